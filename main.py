@@ -3,6 +3,7 @@ from src.etl.batch_etl_system import run_batch_etl_system
 
 
 if __name__ == "__main__":
-    program_mode = ["live_camera", "image", "video"]
-    run_classification_system(program_mode[2])  # Change index to select mode
+    program_mode = ["live_camera", "image", "video", "multi_source"]
+    preview = False  # True = show the detections in a window (headless otherwise)
+    run_classification_system(program_mode[2], preview)  # Change index to select mode
     run_batch_etl_system()
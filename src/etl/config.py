@@ -0,0 +1,6 @@
+# Detecciones con track_id >= 0 se reducen a una fila por track (la de mayor confianza)
+COLLAPSE_TRACK_SEGMENTS = True
+
+# Recalcula dominant_color_name desde dom_r/dom_g/dom_b con la tabla de colores de visión
+# (opcional: con COLOR_LUT_BITS < 8 cambia etiquetas de datos ya guardados)
+RELABEL_DOMINANT_COLORS = False
@@ -1,5 +1,7 @@
 import pandas as pd
 from pathlib import Path
+from src.vision.colors import COLOR_NAMES, UNKNOWN_COLOR_CODE, lookup_color_codes
+from .config import COLLAPSE_TRACK_SEGMENTS, RELABEL_DOMINANT_COLORS
 from .warehouse import (
     init_hive_schema,
     insert_into_hive,
@@ -9,16 +11,30 @@ from .warehouse import (
 
 
 class ETL:
-    def __init__(self, output_path: str) -> None:
+    def __init__(
+        self,
+        output_path: str,
+        collapse_tracks: bool = COLLAPSE_TRACK_SEGMENTS,
+        relabel_colors: bool = RELABEL_DOMINANT_COLORS,
+    ) -> None:
         self.output_path = output_path
+        self.collapse_tracks = collapse_tracks
+        self.relabel_colors = relabel_colors
 
     def extract(self):
         dfs = []
-        for file_path in Path(self.output_path).iterdir():
-            if not file_path.is_file():
-                continue
-
-            df = pd.read_csv(file_path)
+        # Solo archivos finalizados: los chunks en escritura terminan en .tmp
+        file_paths = sorted(
+            path
+            for path in Path(self.output_path).iterdir()
+            if path.is_file() and path.suffix in (".csv", ".parquet")
+        )
+        for file_path in file_paths:
+            if file_path.suffix == ".parquet":
+                # Tipos de la tabla Hive ya aplicados por la etapa de visión
+                df = pd.read_parquet(file_path)
+            else:
+                df = pd.read_csv(file_path)
             print(f"Dataframe cargado con {df.shape[0]} filas")
             dfs.append(df)
 
@@ -36,10 +52,14 @@ class ETL:
         df = self.remove_out_of_range_confidence(df)
         df = self.filter_high_confidence(df, threshold=0.5)
         df = self.detect_and_remove_duplicates(df)
+        if self.collapse_tracks:
+            df = self.collapse_track_segments(df)
 
         self._print_transformation_summary(initial_row_count, df.shape[0])
 
         df = self.normalize_data(df)
+        if self.relabel_colors:
+            df = self.relabel_dominant_colors(df)
         df = self.cast_data_types(df)
         df = self.create_feature_engineering_columns(df)
         return df
@@ -156,9 +176,35 @@ class ETL:
         )
         return df_cleaned
 
+    @staticmethod
+    def collapse_track_segments(df: pd.DataFrame) -> pd.DataFrame:
+        """Keep one row (the most confident) per tracked object, source and run."""
+        if "track_id" not in df.columns:
+            return df
+
+        print("Reduciendo detecciones con seguimiento a una fila por track...")
+        initial_count = df.shape[0]
+        tracked = df["track_id"] >= 0
+        # Los track_id solo son únicos dentro de una ejecución (run_id)
+        key_cols = ["source_type", "source_id", "track_id"]
+        if "run_id" in df.columns:
+            key_cols.insert(2, "run_id")
+        best_rows = (
+            df[tracked].groupby(key_cols, dropna=False)["confidence"].idxmax()
+        )
+        df_collapsed = pd.concat([df[~tracked], df.loc[best_rows]]).sort_index()
+        removed_count = initial_count - df_collapsed.shape[0]
+        print(
+            f"Eliminadas {removed_count} filas de tracks repetidos. Filas restantes: {df_collapsed.shape[0]}"
+        )
+        return df_collapsed
+
     @staticmethod
     def normalize_data(df: pd.DataFrame) -> pd.DataFrame:
-        df = df.fillna({"class_name": "unknown"})
+        if "track_id" not in df.columns:
+            # CSV generados antes de existir el tracker
+            df["track_id"] = -1
+        df = df.fillna({"class_name": "unknown", "track_id": -1})
         df["detection_id"] = df["detection_id"].str.lower().replace(" ", "_")
         df["bbox_area_ratio"] = df["bbox_area_ratio"].round(3)
         df["center_x_norm"] = df["center_x_norm"].round(3)
@@ -166,6 +212,20 @@ class ETL:
         df["timestamp_sec"] = df["timestamp_sec"].round(3)
         return df
 
+    @staticmethod
+    def relabel_dominant_colors(df: pd.DataFrame) -> pd.DataFrame:
+        """Recompute dominant_color_name from dom_r/dom_g/dom_b with the color lookup table."""
+        print("Reetiquetando colores dominantes...")
+        codes = lookup_color_codes(
+            df["dom_r"].to_numpy(), df["dom_g"].to_numpy(), df["dom_b"].to_numpy()
+        )
+        # Cajas inválidas: se conserva "unknown"
+        codes[(df["dominant_color_name"] == "unknown").to_numpy()] = UNKNOWN_COLOR_CODE
+        df["dominant_color_name"] = pd.Categorical.from_codes(
+            codes, categories=COLOR_NAMES
+        )
+        return df
+
     @staticmethod
     def cast_data_types(df: pd.DataFrame) -> pd.DataFrame:
         cat_cols = [
@@ -178,6 +238,7 @@ class ETL:
 
         int_cols = [
             "frame_number",
+            "track_id",
             "class_id",
             "x_min",
             "y_min",
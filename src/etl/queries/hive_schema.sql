@@ -10,6 +10,7 @@ CREATE EXTERNAL TABLE IF NOT EXISTS yolo_objects (
   source_type          STRING,
   source_id            STRING,
   frame_number         INT,
+  track_id             INT,
   class_id             INT,
   class_name           STRING,
   confidence           DOUBLE,
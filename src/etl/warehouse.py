@@ -111,7 +111,7 @@ def insert_into_hive(df: pd.DataFrame, debug: bool = False) -> None:
     table_name = "yolo_objects"
 
     cols = (
-        "detection_id, source_type, source_id, frame_number, "
+        "detection_id, source_type, source_id, frame_number, track_id, "
         "class_id, class_name, confidence, "
         "x_min, y_min, x_max, y_max, "
         "width, height, area_pixels, "
@@ -136,6 +136,7 @@ def insert_into_hive(df: pd.DataFrame, debug: bool = False) -> None:
                     row["source_type"],
                     row["source_id"],
                     int(row["frame_number"]),
+                    int(row["track_id"]),
                     int(row["class_id"]),
                     row["class_name"],
                     float(row["confidence"]),
@@ -0,0 +1,141 @@
+"""
+Append-optimized columnar storage of detection rows.
+Every column of the detection schema is kept in its own preallocated NumPy
+array that doubles its capacity when full, so appending a detection costs
+the same at the start and at the end of a long session. A DataFrame is only
+built when it is asked for.
+"""
+
+from typing import Mapping, Optional
+
+import numpy as np
+import pandas as pd
+
+from .config import DETECTION_BUFFER_CAPACITY
+from .utils import create_detection_dataframe_schema
+
+_INT_COLUMNS = {
+    "frame_number",
+    "track_id",
+    "class_id",
+    "x_min",
+    "y_min",
+    "x_max",
+    "y_max",
+    "width",
+    "height",
+    "area_pixels",
+    "frame_width",
+    "frame_height",
+    "center_x",
+    "center_y",
+    "dom_r",
+    "dom_g",
+    "dom_b",
+}
+_FLOAT_COLUMNS = {
+    "confidence",
+    "bbox_area_ratio",
+    "center_x_norm",
+    "center_y_norm",
+    "timestamp_sec",
+}
+
+
+def detection_column_dtypes() -> dict:
+    """
+    Get the NumPy dtype of every detection schema column.
+
+    Returns:
+        dict: Column name -> dtype (int64, float64, or object for strings)
+    """
+    return {
+        name: (
+            np.int64
+            if name in _INT_COLUMNS
+            else np.float64 if name in _FLOAT_COLUMNS else object
+        )
+        for name in create_detection_dataframe_schema()
+    }
+
+
+class DetectionAccumulator:
+    """Growable typed column arrays holding detection rows."""
+
+    def __init__(self, capacity: int = DETECTION_BUFFER_CAPACITY) -> None:
+        self._initial_capacity = max(1, capacity)
+        self._columns = self._allocate(self._initial_capacity)
+        self._size = 0
+
+    def _allocate(self, capacity: int) -> dict:
+        return {
+            name: np.empty(capacity, dtype=dtype)
+            for name, dtype in detection_column_dtypes().items()
+        }
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        """Rows that fit before the columns have to grow."""
+        return len(self._columns["detection_id"])
+
+    def _reserve(self, count: int) -> None:
+        """Make room for `count` more rows, doubling the capacity if needed."""
+        needed = self._size + count
+        if needed <= self.capacity:
+            return
+        grown = self._allocate(max(needed, 2 * self.capacity))
+        for name, column in self._columns.items():
+            grown[name][: self._size] = column[: self._size]
+        self._columns = grown
+
+    def extend(self, columns: Mapping) -> None:
+        """
+        Append several detections at once.
+
+        Args:
+            columns: {column: sequence of values}, all sequences of the same
+                length (at least one column must be a sequence). Scalars are
+                broadcast to every row
+        """
+        count = len(next(value for value in columns.values() if np.ndim(value) > 0))
+        if count == 0:
+            return
+        self._reserve(count)
+        for name, column in self._columns.items():
+            column[self._size : self._size + count] = columns[name]
+        self._size += count
+
+    def extend_dataframe(self, dataframe: pd.DataFrame) -> None:
+        """Append the rows of a detection dataframe."""
+        if dataframe.empty:
+            return
+        self.extend({name: dataframe[name].to_numpy() for name in self._columns})
+
+    def truncate(self, size: int) -> None:
+        """Drop every row after the first `size` ones."""
+        if size >= self._size:
+            return
+        for column in self._columns.values():
+            if column.dtype == object:
+                # Release the dropped strings
+                column[size : self._size] = None
+        self._size = max(0, size)
+
+    def clear(self) -> None:
+        """Drop all rows and give the grown buffers back."""
+        self._columns = self._allocate(self._initial_capacity)
+        self._size = 0
+
+    def to_dataframe(self, start: int = 0, stop: Optional[int] = None) -> pd.DataFrame:
+        """
+        Build a DataFrame with rows [start, stop) (all rows by default).
+        The DataFrame owns a copy of the data, later appends do not change it.
+        """
+        stop = self._size if stop is None else min(stop, self._size)
+        return pd.DataFrame(
+            {name: column[start:stop] for name, column in self._columns.items()},
+            copy=True,
+        )
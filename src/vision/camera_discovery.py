@@ -0,0 +1,224 @@
+"""
+Fast camera discovery.
+Candidates come from /dev/video* when available (Linux) instead of blindly
+scanning indices, every candidate is probed on its own thread with a
+timeout, and the working cameras are cached in a small JSON file that is
+reused until the device list changes, a cached camera fails to open or the
+cache is invalidated explicitly.
+"""
+
+import json
+import os
+import re
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+import cv2
+
+from .config import (
+    CAMERA_CACHE_PATH,
+    CAMERA_MAX_INDEX,
+    CAMERA_PROBE_TIMEOUT,
+)
+
+_VIDEO_DEVICE_PATTERN = re.compile(r"^video(\d+)$")
+
+
+def camera_backends() -> list[int]:
+    """OpenCV capture backends worth trying on this platform, in order."""
+    if sys.platform.startswith("linux"):
+        return [cv2.CAP_V4L2, cv2.CAP_ANY]
+    if sys.platform.startswith("win"):
+        return [cv2.CAP_DSHOW, cv2.CAP_MSMF, cv2.CAP_ANY]
+    if sys.platform == "darwin":
+        return [cv2.CAP_AVFOUNDATION, cv2.CAP_ANY]
+    return [cv2.CAP_ANY]
+
+
+def list_video_devices(dev_dir: str = "/dev") -> Optional[list[str]]:
+    """
+    Get the /dev/video* device names.
+
+    Returns:
+        list: Sorted device names (e.g. ["video0", "video2"]), or None when
+        the platform is not Linux (macOS and other Unix systems have a /dev
+        without video* nodes) or has no /dev directory to enumerate
+    """
+    if not sys.platform.startswith("linux") or not os.path.isdir(dev_dir):
+        return None
+    return sorted(
+        (name for name in os.listdir(dev_dir) if _VIDEO_DEVICE_PATTERN.match(name)),
+        key=lambda name: int(_VIDEO_DEVICE_PATTERN.match(name).group(1)),
+    )
+
+
+def candidate_indices(
+    devices: Optional[list[str]], max_index: int = CAMERA_MAX_INDEX
+) -> list[int]:
+    """Camera indices to probe: the /dev/video* numbers, or 0..max_index-1."""
+    if devices is None:
+        return list(range(max_index))
+    return [int(_VIDEO_DEVICE_PATTERN.match(name).group(1)) for name in devices]
+
+
+def probe_camera(index: int, backends: Optional[list[int]] = None) -> Optional[dict]:
+    """
+    Open a camera index and read one frame.
+
+    Args:
+        index: Camera index
+        backends: Backends to try in order (defaults to camera_backends())
+
+    Returns:
+        dict: {"index", "backend", "width", "height"} of the first backend
+        that delivers a frame, or None
+    """
+    for backend in backends or camera_backends():
+        cap = cv2.VideoCapture(index, backend)
+        try:
+            if not cap.isOpened():
+                continue
+            ret, frame = cap.read()
+            if ret and frame is not None:
+                return {
+                    "index": index,
+                    "backend": backend,
+                    "width": frame.shape[1],
+                    "height": frame.shape[0],
+                }
+        finally:
+            cap.release()
+    return None
+
+
+def probe_cameras(
+    indices: list[int], timeout: float = CAMERA_PROBE_TIMEOUT
+) -> list[dict]:
+    """
+    Probe several camera indices in parallel.
+    Probes still running after `timeout` seconds are abandoned (OpenCV calls
+    cannot be interrupted, so they run out on daemon threads).
+
+    Args:
+        indices: Camera indices to probe
+        timeout: Max seconds for the whole probe round
+
+    Returns:
+        list: Probe results of the working cameras, sorted by index
+    """
+    results: dict[int, Optional[dict]] = {}
+
+    def _probe(index: int) -> None:
+        results[index] = probe_camera(index)
+
+    threads = [
+        threading.Thread(target=_probe, args=(index,), daemon=True) for index in indices
+    ]
+    for thread in threads:
+        thread.start()
+
+    deadline = time.monotonic() + timeout
+    for index, thread in zip(indices, threads):
+        thread.join(max(0.0, deadline - time.monotonic()))
+        if thread.is_alive():
+            print(f"Camera {index}: probe timed out after {timeout:.1f}s")
+
+    return [
+        results[index] for index in sorted(indices) if results.get(index) is not None
+    ]
+
+
+def load_camera_cache(
+    cache_path: str = CAMERA_CACHE_PATH, devices: Optional[list[str]] = None
+) -> Optional[list[dict]]:
+    """
+    Get the cached cameras if the cache is still valid.
+
+    Args:
+        cache_path: JSON cache file
+        devices: Current /dev/video* listing. The cache is invalid if it differs
+
+    Returns:
+        list: Cached cameras, or None if there is no valid cache
+    """
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if cache.get("platform") != sys.platform or cache.get("devices") != devices:
+        return None
+    return cache.get("cameras")
+
+
+def save_camera_cache(
+    cameras: list[dict],
+    cache_path: str = CAMERA_CACHE_PATH,
+    devices: Optional[list[str]] = None,
+) -> None:
+    """Write the discovered cameras to the cache file (atomically)."""
+    path = Path(cache_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "platform": sys.platform,
+                "devices": devices,
+                "cameras": cameras,
+                "created_at": time.time(),
+            },
+            f,
+            indent=2,
+        )
+    os.replace(tmp_path, path)
+
+
+def invalidate_camera_cache(cache_path: str = CAMERA_CACHE_PATH) -> None:
+    """Delete the camera cache so the next discovery probes again."""
+    try:
+        os.remove(cache_path)
+    except FileNotFoundError:
+        pass
+
+
+def discover_cameras(
+    use_cache: bool = True,
+    cache_path: str = CAMERA_CACHE_PATH,
+    timeout: float = CAMERA_PROBE_TIMEOUT,
+) -> list[dict]:
+    """
+    Find the working cameras, from the cache when it is valid.
+
+    Args:
+        use_cache: Reuse a valid cache instead of probing
+        cache_path: JSON cache file
+        timeout: Max seconds for probing
+
+    Returns:
+        list: {"index", "backend", "width", "height"} of every working camera
+    """
+    devices = list_video_devices()
+    if use_cache:
+        cameras = load_camera_cache(cache_path, devices)
+        if cameras is not None:
+            return cameras
+
+    cameras = probe_cameras(candidate_indices(devices), timeout)
+    if cameras:
+        # An empty result is not cached, so a camera plugged in later is found
+        save_camera_cache(cameras, cache_path, devices)
+    return cameras
+
+
+def find_cached_camera(
+    index: int, cache_path: str = CAMERA_CACHE_PATH
+) -> Optional[dict]:
+    """Get the cached probe result of a camera index, without probing."""
+    for camera in load_camera_cache(cache_path, list_video_devices()) or []:
+        if camera["index"] == index:
+            return camera
+    return None
@@ -0,0 +1,165 @@
+"""
+Low-latency camera capture.
+A background thread keeps reading the camera and holds only the newest
+frame, so a slow inference loop always gets the freshest frame instead of
+one that waited in the driver buffer. Frames replaced before being read are
+counted as dropped, and the capture-to-detection latency of every processed
+frame is tracked so it can be alerted on.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Optional
+
+import cv2
+import numpy as np
+
+from .config import LATENCY_ALERT_MS, LATENCY_WINDOW
+
+
+class LatestFrameCapture:
+    """Read a cv2.VideoCapture on a thread and keep only the latest frame."""
+
+    def __init__(self, cap: cv2.VideoCapture) -> None:
+        self._cap = cap
+        self._condition = threading.Condition()
+        self._frame: Optional[np.ndarray] = None
+        self._captured_at = 0.0
+        self._sequence = 0
+        self._last_read_sequence = 0
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+        self.captured_frames = 0
+        self.dropped_frames = 0
+
+    def __enter__(self) -> "LatestFrameCapture":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    @property
+    def is_running(self) -> bool:
+        """False once the camera stopped delivering frames or stop() was called."""
+        return self._running
+
+    def start(self) -> None:
+        """Start the capture thread."""
+        if self._thread is not None:
+            return
+        self._running = True
+        self._thread = threading.Thread(
+            target=self._capture_loop, name="latest-frame-capture", daemon=True
+        )
+        self._thread.start()
+
+    def _capture_loop(self) -> None:
+        while self._running:
+            ret, frame = self._cap.read()
+            captured_at = time.perf_counter()
+            with self._condition:
+                if not ret:
+                    self._running = False
+                else:
+                    if self._sequence > self._last_read_sequence:
+                        self.dropped_frames += 1
+                    self._frame = frame
+                    self._captured_at = captured_at
+                    self._sequence += 1
+                    self.captured_frames += 1
+                self._condition.notify_all()
+
+    def read(
+        self, timeout: Optional[float] = 5.0
+    ) -> tuple[bool, Optional[np.ndarray], float]:
+        """
+        Get the newest frame not returned yet, waiting for it if needed.
+
+        Args:
+            timeout: Max seconds to wait for a new frame (None = forever)
+
+        Returns:
+            tuple: (ret, frame, captured_at) with captured_at taken from
+            time.perf_counter() right after the frame was read.
+            ret is False when the camera stopped delivering frames
+        """
+        with self._condition:
+            has_new_frame = self._condition.wait_for(
+                lambda: self._sequence > self._last_read_sequence or not self._running,
+                timeout,
+            )
+            if not has_new_frame or self._sequence == self._last_read_sequence:
+                return False, None, 0.0
+            self._last_read_sequence = self._sequence
+            return True, self._frame, self._captured_at
+
+    def stop(self) -> None:
+        """Stop the capture thread (the VideoCapture is not released)."""
+        if self._thread is None:
+            return
+        self._running = False
+        self._thread.join()
+        self._thread = None
+
+    def stats(self) -> dict:
+        """Get captured and dropped frame counters."""
+        with self._condition:
+            return {
+                "captured_frames": self.captured_frames,
+                "dropped_frames": self.dropped_frames,
+            }
+
+
+class LatencyMonitor:
+    """Track capture-to-detection latencies and flag the ones over a threshold."""
+
+    def __init__(
+        self, alert_ms: Optional[float] = LATENCY_ALERT_MS, window: int = LATENCY_WINDOW
+    ) -> None:
+        self.alert_ms = alert_ms
+        self._latencies_ms: deque = deque(maxlen=max(1, window))
+        self.total_frames = 0
+        self.alerts = 0
+        self.max_ms = 0.0
+
+    def record(self, captured_at: float, done_at: Optional[float] = None) -> bool:
+        """
+        Record the latency of one processed frame.
+
+        Args:
+            captured_at: time.perf_counter() when the frame was captured
+            done_at: time.perf_counter() when its detections were ready
+                (defaults to now)
+
+        Returns:
+            bool: True if the latency is above the alert threshold
+        """
+        done_at = time.perf_counter() if done_at is None else done_at
+        latency_ms = (done_at - captured_at) * 1000
+        self._latencies_ms.append(latency_ms)
+        self.total_frames += 1
+        self.max_ms = max(self.max_ms, latency_ms)
+
+        is_alert = self.alert_ms is not None and latency_ms > self.alert_ms
+        if is_alert:
+            self.alerts += 1
+        return is_alert
+
+    @property
+    def last_ms(self) -> Optional[float]:
+        """Latency of the last recorded frame."""
+        return self._latencies_ms[-1] if self._latencies_ms else None
+
+    def stats(self) -> dict:
+        """Get mean/p50/p95 over the recent window plus overall max and alerts."""
+        values = np.asarray(self._latencies_ms, dtype=float)
+        return {
+            "frames": self.total_frames,
+            "mean_ms": float(values.mean()) if values.size else 0.0,
+            "p50_ms": float(np.percentile(values, 50)) if values.size else 0.0,
+            "p95_ms": float(np.percentile(values, 95)) if values.size else 0.0,
+            "max_ms": self.max_ms,
+            "alerts": self.alerts,
+        }
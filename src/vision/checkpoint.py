@@ -0,0 +1,161 @@
+"""
+Checkpoint and resume of long video runs.
+While a video is processed, the detections found since the previous
+checkpoint are flushed to a new part file and the position of the next frame
+(plus the motion gate and tracker state) is saved, both atomically. After a
+crash the run resumes from the last checkpoint and produces the same rows as
+an uninterrupted run.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import shutil
+import time
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+
+from .config import (
+    CHECKPOINT_DIR,
+    CHECKPOINT_INTERVAL,
+    COLOR_LUT_BITS,
+    DOMINANT_COLOR_DOWNSCALE,
+)
+from .parallel import merge_detection_frames
+from .result_cache import model_identity
+
+
+def _atomic_pickle(obj, path: Path) -> None:
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_path, "wb") as f:
+        pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+class VideoCheckpoint:
+    """
+    Checkpoints of one video processed with given parameters.
+
+    The checkpoint directory is keyed by the video path, size and
+    modification time, the model identity, the inference parameters and the
+    color settings, so a checkpoint is never resumed against a different file
+    or configuration.
+    """
+
+    def __init__(
+        self,
+        video_path: str,
+        params: dict,
+        checkpoint_dir: str = CHECKPOINT_DIR,
+        interval: float = CHECKPOINT_INTERVAL,
+    ) -> None:
+        stat = os.stat(video_path)
+        description = {
+            "video": str(Path(video_path).resolve()),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "model": model_identity(),
+            "params": params,
+            "color_lut_bits": COLOR_LUT_BITS,
+            "dominant_color_downscale": DOMINANT_COLOR_DOWNSCALE,
+        }
+        key = hashlib.sha256(
+            json.dumps(description, sort_keys=True, default=str).encode()
+        ).hexdigest()
+        self.directory = Path(checkpoint_dir) / key
+        self.interval = interval
+        self._state_path = self.directory / "state.pkl"
+        self._parts = 0
+        self._flushed_parts = 0
+        self._state: Optional[dict] = None
+        self._last_saved = time.monotonic()
+
+    def _part_path(self, part: int) -> Path:
+        return self.directory / f"part_{part:06d}.pkl"
+
+    def load(self) -> Optional[tuple[dict, pd.DataFrame]]:
+        """
+        Get the last checkpoint of the video.
+
+        Returns:
+            tuple: (state, rows) with the state passed to the last `save` and
+            the detection rows saved up to it that were not written to the
+            output yet (see `mark_flushed`), or None if there is none
+        """
+        try:
+            with open(self._state_path, "rb") as f:
+                checkpoint = pickle.load(f)
+            flushed_parts = checkpoint.get("flushed_parts", 0)
+            # Parts written after the last state (crash in between) are ignored
+            rows = merge_detection_frames(
+                [
+                    pd.read_pickle(self._part_path(part))
+                    for part in range(flushed_parts + 1, checkpoint["parts"] + 1)
+                ]
+            )
+        except (OSError, EOFError, pickle.UnpicklingError) as e:
+            if self._state_path.exists():
+                print(f"Checkpoint unreadable, starting over: {e}")
+            return None
+
+        self._parts = checkpoint["parts"]
+        self._flushed_parts = flushed_parts
+        self._state = checkpoint["state"]
+        return checkpoint["state"], rows
+
+    def due(self) -> bool:
+        """Check whether `interval` seconds passed since the last checkpoint."""
+        return time.monotonic() - self._last_saved >= self.interval
+
+    def save(self, state: dict, new_rows: pd.DataFrame) -> None:
+        """
+        Write a checkpoint.
+
+        Args:
+            state: Picklable resume state (next frame, motion gate, tracker...)
+            new_rows: Detection rows found since the previous checkpoint
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._parts += 1
+        _atomic_pickle(new_rows.reset_index(drop=True), self._part_path(self._parts))
+        # The state is replaced last, so it never refers to a missing part
+        self._state = state
+        self._save_state()
+        self._last_saved = time.monotonic()
+
+    def mark_flushed(self) -> None:
+        """
+        Record that every row saved so far has been written to the output,
+        so a resume only restores the rows found after the last `save`.
+        A crash between the output write and this call restores rows that
+        were already written (the ETL drops the duplicates).
+        """
+        if self._state is None:
+            return
+        flushed = range(self._flushed_parts + 1, self._parts + 1)
+        self._flushed_parts = self._parts
+        self._save_state()
+        for part in flushed:
+            self._part_path(part).unlink(missing_ok=True)
+
+    def _save_state(self) -> None:
+        _atomic_pickle(
+            {
+                "parts": self._parts,
+                "flushed_parts": self._flushed_parts,
+                "state": self._state,
+            },
+            self._state_path,
+        )
+
+    def clear(self) -> None:
+        """Delete the checkpoints once the video is fully processed."""
+        shutil.rmtree(self.directory, ignore_errors=True)
+        self._parts = 0
+        self._flushed_parts = 0
+        self._state = None
@@ -1,22 +1,52 @@
 from datetime import datetime
 from src.vision.media_io import MediaIO
-from .utils import save_dataframe_to_csv
+from .config import OUTPUT_FORMAT, PREVIEW_ENABLED, STREAMING_OUTPUT_ENABLED
+from .output_writer import ChunkedDetectionWriter
+from .utils import save_dataframe_to_csv, save_dataframe_to_parquet
 
 
-def run_classification_system(mode: str):
+def run_classification_system(
+    mode: str,
+    preview: bool = PREVIEW_ENABLED,
+    streaming: bool = STREAMING_OUTPUT_ENABLED,
+    output_format: str = OUTPUT_FORMAT,
+):
     """
     Entry point to run the classification system.
+    With preview=False (headless) no window is opened and no GUI call is made.
+    With streaming, detections are written to chunk files while processing
+    instead of a single file at the end. `output_format` is "parquet" or "csv".
     """
-    media_io = MediaIO()
-    if mode == "live_camera":
-        media_io.run_camera_process()
-    elif mode == "image":
-        media_io.run_image_process(preview=True)
-    elif mode == "video":
-        media_io.run_video_process(preview=True)
-    else:
-        raise ValueError(f"Unknown mode: {mode}")
+    writer = ChunkedDetectionWriter(output_format=output_format) if streaming else None
+    media_io = MediaIO(output_writer=writer)
+    try:
+        if mode == "live_camera":
+            media_io.run_camera_process(preview=preview)
+        elif mode == "image":
+            media_io.run_image_process(preview=preview)
+        elif mode == "video":
+            media_io.run_video_process(preview=preview)
+        elif mode == "multi_source":
+            media_io.run_multi_source_process(preview=preview)
+        else:
+            raise ValueError(f"Unknown mode: {mode}")
+    finally:
+        if writer is not None:
+            # Also on Ctrl+C or errors: rows already found are not lost
+            media_io.flush_detections()
+            stats = writer.stats()
+            print(
+                f"Detection data saved to {writer.output_dir} "
+                f"({stats['files']} file(s))"
+            )
+            print(f"Total detections: {stats['rows']}")
 
-    df_with_detections = media_io.get_df_detections()
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    save_dataframe_to_csv(df_with_detections, f"detections_{timestamp}.csv")
+    if writer is None:
+        df_with_detections = media_io.get_df_detections()
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        if output_format == "parquet":
+            save_dataframe_to_parquet(
+                df_with_detections, f"detections_{timestamp}.parquet"
+            )
+        else:
+            save_dataframe_to_csv(df_with_detections, f"detections_{timestamp}.csv")
@@ -0,0 +1,119 @@
+"""
+Vectorized color naming.
+The naming rules are evaluated once on a grid of quantized RGB values to
+build a lookup table (COLOR_LUT_BITS bits per channel), so whole arrays of
+colors are named with a single indexing operation. Only NumPy is needed,
+which lets the ETL re-label stored detections without OpenCV.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+from .config import COLOR_LUT_BITS
+
+COLOR_NAMES = np.array(
+    [
+        "black",
+        "white",
+        "gray",
+        "red",
+        "green",
+        "blue",
+        "yellow",
+        "magenta",
+        "cyan",
+        "mixed",
+        "unknown",  # Never produced by the rules, used for invalid boxes
+    ],
+    dtype=object,
+)
+UNKNOWN_COLOR_CODE = len(COLOR_NAMES) - 1
+
+
+def _as_channels(r, g, b) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    return tuple(
+        np.clip(np.asarray(channel, dtype=np.int64), 0, 255) for channel in (r, g, b)
+    )
+
+
+def classify_colors(r, g, b) -> np.ndarray:
+    """
+    Apply the color naming rules to arrays of RGB values (no quantization).
+
+    Args:
+        r, g, b: RGB values (0-255, clipped), arrays of the same shape
+
+    Returns:
+        np.ndarray: Color codes (int8) indexing COLOR_NAMES
+    """
+    r, g, b = _as_channels(r, g, b)
+    max_val = np.maximum(np.maximum(r, g), b)
+    min_val = np.minimum(np.minimum(r, g), b)
+    low_saturation = max_val - min_val < 30
+
+    conditions = [
+        low_saturation & (max_val < 50),
+        low_saturation & (max_val > 200),
+        low_saturation,
+        (r > g) & (r > b) & (r > 150),
+        (g > r) & (g > b) & (g > 150),
+        (b > r) & (b > g) & (b > 150),
+        (r > 150) & (g > 150) & (b < 100),
+        (r > 150) & (b > 150) & (g < 100),
+        (g > 150) & (b > 150) & (r < 100),
+    ]
+    # Codes follow COLOR_NAMES: one per condition, then "mixed"
+    return np.select(
+        conditions, np.arange(len(conditions)), default=len(conditions)
+    ).astype(np.int8)
+
+
+@lru_cache(maxsize=None)
+def build_color_lut(bits: int = COLOR_LUT_BITS) -> np.ndarray:
+    """
+    Build the color code lookup table.
+    Each cell holds the code of the center of its quantization bin; with
+    bits=8 the table gives exactly the rule results.
+
+    Args:
+        bits: Bits kept per channel (1-8)
+
+    Returns:
+        np.ndarray: Flat int8 table of 2**(3*bits) codes indexed by
+        (r_bin << 2*bits) | (g_bin << bits) | b_bin
+    """
+    if not 1 <= bits <= 8:
+        raise ValueError(f"COLOR_LUT_BITS must be between 1 and 8, got {bits}")
+    shift = 8 - bits
+    centers = (np.arange(1 << bits) << shift) + ((1 << shift) >> 1)
+    r, g, b = np.meshgrid(centers, centers, centers, indexing="ij")
+    lut = classify_colors(r, g, b).ravel()
+    lut.setflags(write=False)
+    return lut
+
+
+def lookup_color_codes(r, g, b, bits: int = COLOR_LUT_BITS) -> np.ndarray:
+    """
+    Get the color codes of arrays of RGB values through the lookup table
+    (with bits=8, by applying the rules directly).
+
+    Args:
+        r, g, b: RGB values (0-255, clipped), arrays of the same shape
+        bits: Bits kept per channel
+
+    Returns:
+        np.ndarray: Color codes (int8) indexing COLOR_NAMES
+    """
+    if bits == 8:
+        # The exact table only repeats the rules, at 16 MB and ~1.5 s to build
+        return classify_colors(r, g, b)
+    r, g, b = _as_channels(r, g, b)
+    shift = 8 - bits
+    index = ((r >> shift) << (2 * bits)) | ((g >> shift) << bits) | (b >> shift)
+    return build_color_lut(bits)[index]
+
+
+def name_colors(r, g, b, bits: int = COLOR_LUT_BITS) -> np.ndarray:
+    """Get the color names (object array) of arrays of RGB values."""
+    return COLOR_NAMES[lookup_color_codes(r, g, b, bits)]
@@ -8,6 +8,100 @@ FRAME_HEIGHT = 480
 
 # YOLO
 YOLO_MODEL_PATH = "models/yolov8n.pt"
+INFERENCE_BACKEND = "pytorch"  # "pytorch", "onnx" (ONNX Runtime) or "openvino"
+INFERENCE_IMGSZ = 640  # Model input size, also part of the exported model cache key
+EXPORTED_MODELS_DIR = "models/exported/"  # Cache of ONNX/OpenVINO exports
+INFERENCE_BATCH_SIZE = 8  # Frames sent to YOLO per forward pass in image/video modes.
+MODEL_WARMUP = True  # Run a dummy frame through the model right after loading it
+
+# INT8 quantization (ONNX Runtime backend only): None, "dynamic" or "static"
+QUANTIZATION = None
+QUANTIZATION_CALIBRATION_PATH = IMG_INPUT_PATH  # Images for static calibration
+QUANTIZATION_CALIBRATION_IMAGES = 100  # Max images used for calibration
+
+# Camera discovery
+CAMERA_CACHE_PATH = "data/cache/cameras.json"  # Working cameras found by the last scan
+CAMERA_PROBE_TIMEOUT = 3.0  # Seconds for probing all candidate cameras in parallel
+CAMERA_MAX_INDEX = 10  # Indices probed when /dev/video* cannot be listed
+
+# Result cache: detections of unchanged image/video files are reused on rerun
+RESULT_CACHE_ENABLED = False
+RESULT_CACHE_DIR = "data/cache/results/"  # Keyed by file, model and parameters
+
+# Checkpoints of sequential video runs: an interrupted video resumes where it stopped
+CHECKPOINT_ENABLED = False
+CHECKPOINT_DIR = "data/cache/checkpoints/"
+CHECKPOINT_INTERVAL = 60.0  # Seconds between checkpoints
+
+# Detection rows are kept in typed column arrays that double their size when full
+DETECTION_BUFFER_CAPACITY = 4096  # Rows preallocated per column
+
+# Streaming output: detections are written to rolling chunk files in OUTPUT_DATA_PATH
+# while processing instead of once at the end, so memory stays flat on long sessions
+STREAMING_OUTPUT_ENABLED = False
+OUTPUT_CHUNK_ROWS = 50000  # Rows held in memory before a chunk is written
+OUTPUT_CHUNK_SECONDS = 300.0  # Max seconds between chunks (0 = by size only)
+OUTPUT_FORMAT = "csv"  # "csv" or "parquet" (types of hive_schema.sql, needs pyarrow)
+
+# Box colors: mean of a summed-area table built once per frame. A factor > 1 builds
+# it on a frame shrunk that many times (faster, approximate colors)
+DOMINANT_COLOR_DOWNSCALE = 1
+COLOR_LUT_BITS = 8  # Bits per channel of the color naming lookup table (8 = exact)
+
+# Live camera latency
+CAMERA_LATEST_FRAME = False  # Capture on a thread and always process the newest frame
+# Driver buffer (CAP_PROP_BUFFERSIZE), not every backend honours it
+CAMERA_BUFFER_SIZE = 1
+# Warn when capture-to-detection latency exceeds this (None = off)
+LATENCY_ALERT_MS = 500
+LATENCY_WINDOW = 300  # Recent frames used for the latency percentiles
+
+# Multi-source mode: camera indices and/or video paths processed concurrently
+MULTI_SOURCES = [CAM_INDEX]
+MULTI_SOURCE_FPS_REPORT_INTERVAL = 5.0  # Seconds between per-source FPS reports
+
+# Image folders: parallel decoding
+IMAGE_DECODE_WORKERS = None  # Decoder threads (None = one per CPU core)
+IMAGE_READ_REDUCTION = 1  # 1, 2, 4 or 8: decode at 1/N size (IMREAD_REDUCED_COLOR_N)
+
+# Preview window. Off = headless, no GUI calls at all (maximum throughput).
+PREVIEW_ENABLED = False
+PREVIEW_MAX_FPS = 15  # Refresh rate cap of the preview renderer thread
+
+# Video frame sampling. Skipped frames are only grabbed, never retrieved/converted.
+VIDEO_FRAME_STRIDE = 1  # Analyse every Nth frame of a video
+VIDEO_TARGET_FPS = None  # If set, the stride is derived from the source fps instead
+
+# Video decoding: "opencv" (cv2.VideoCapture) or "ffmpeg" (downscaled raw frames
+# through an ffmpeg pipe into preallocated buffers; boxes are scaled back to the
+# source resolution)
+VIDEO_READER = "opencv"
+FFMPEG_BINARY = "ffmpeg"
+FFMPEG_MAX_SIDE = INFERENCE_IMGSZ  # Longest side of the decoded frames (None = source)
+
+# Video pipeline (decode -> inference -> postprocess on separate threads)
+VIDEO_PIPELINE_ENABLED = False
+PIPELINE_QUEUE_SIZE = 32  # Max frames buffered between two pipeline stages
+
+# Parallel processing of the video input directory
+VIDEO_WORKERS = 1  # Worker processes, each with its own model. 1 = sequential.
+TORCH_THREADS_PER_WORKER = None  # None = split the CPU cores evenly between workers
+VIDEO_SPLIT_RANGES = False  # True = split each video into frame ranges, one per worker
+
+# Motion gating: reuse the previous detections while the scene is static
+MOTION_GATING_ENABLED = False
+MOTION_DOWNSCALE_WIDTH = 160  # Width of the grayscale frame used for the comparison
+MOTION_PIXEL_THRESHOLD = 25  # Gray level change for a pixel to count as changed
+MOTION_CHANGED_RATIO = 0.005  # Fraction of changed pixels that triggers inference
+MOTION_REFRESH_INTERVAL = 30  # Run inference at least once every N frames
+
+# Tracking: persistent track IDs, YOLO only on keyframes and boxes propagated in between
+TRACKING_ENABLED = False
+TRACKER_KEYFRAME_INTERVAL = 5  # Run the detector every K frames
+TRACKER_IOU_THRESHOLD = 0.3  # Minimum IoU to associate a detection with a track
+TRACKER_MAX_MISSED = 3  # Keyframes a track survives without a matching detection
+TRACKER_ALPHA = 0.7  # Position gain of the constant-velocity filter
+TRACKER_BETA = 0.2  # Velocity gain of the constant-velocity filter
 
 ALLOWED_CLASSES = {
     "person",
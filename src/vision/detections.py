@@ -0,0 +1,62 @@
+"""
+Compact detection records.
+The detections of a frame are a NumPy structured array with one 32-byte
+record per box, so they flow from the model through the tracker into the
+feature functions without creating Python objects per detection. Fields are
+zero-copy column views (`detections["bbox"]` is an (N, 4) view). Class names
+are not stored: they are looked up from `class_id` in the model's name table.
+"""
+
+import numpy as np
+
+DETECTION_DTYPE = np.dtype(
+    [
+        ("bbox", np.int32, (4,)),  # x1, y1, x2, y2
+        ("confidence", np.float64),
+        ("class_id", np.int32),
+        ("track_id", np.int32),  # -1 when the detection is not tracked
+    ]
+)
+
+
+def empty_detections() -> np.ndarray:
+    """Detections of a frame without objects."""
+    return np.empty(0, dtype=DETECTION_DTYPE)
+
+
+def make_detections(bbox, confidence, class_id, track_id=-1) -> np.ndarray:
+    """
+    Build the detection records of a frame from column arrays.
+
+    Args:
+        bbox: Bounding boxes (N, 4) as (x1, y1, x2, y2)
+        confidence: Confidence scores (N,)
+        class_id: Class IDs (N,)
+        track_id: Track IDs (N,) or a single value for every detection
+
+    Returns:
+        np.ndarray: Structured array of DETECTION_DTYPE
+    """
+    confidence = np.asarray(confidence)
+    detections = np.empty(len(confidence), dtype=DETECTION_DTYPE)
+    detections["bbox"] = np.asarray(bbox).reshape(-1, 4)
+    detections["confidence"] = confidence
+    detections["class_id"] = class_id
+    detections["track_id"] = track_id
+    return detections
+
+
+def class_name_table(class_names: dict) -> np.ndarray:
+    """
+    Turn the {class_id: name} mapping of a model into an array indexed by class_id.
+
+    Args:
+        class_names: Class names by ID (e.g. YOLO `model.names`)
+
+    Returns:
+        np.ndarray: Object array of names; IDs without a name map to "unknown"
+    """
+    table = np.full(max(class_names, default=-1) + 1, "unknown", dtype=object)
+    for class_id, name in class_names.items():
+        table[class_id] = name
+    return table
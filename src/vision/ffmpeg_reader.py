@@ -0,0 +1,214 @@
+"""
+Reduced-resolution video decoding through an ffmpeg pipe.
+ffmpeg decodes and downscales the video (scale filter) and writes raw BGR
+frames to its stdout, which are read straight into a ring of preallocated
+NumPy buffers with `readinto`, so no frame is allocated or converted in
+Python. The reader mimics the parts of cv2.VideoCapture used by MediaIO.
+Boxes found on the reduced frames are mapped back to the source resolution
+with `source_size`, so both readers produce the same rows.
+"""
+
+import shutil
+import subprocess
+import tempfile
+from typing import Optional
+
+import cv2
+import numpy as np
+
+from .config import FFMPEG_BINARY, FFMPEG_MAX_SIDE, INFERENCE_BATCH_SIZE
+
+
+def ffmpeg_available(ffmpeg_binary: str = FFMPEG_BINARY) -> bool:
+    """Check whether the ffmpeg executable can be found."""
+    return shutil.which(ffmpeg_binary) is not None
+
+
+def scaled_size(width: int, height: int, max_side: Optional[int]) -> tuple[int, int]:
+    """
+    Get the output size that fits the longest side into `max_side`.
+    The aspect ratio is kept, sizes are even (required by most pixel formats)
+    and frames are never upscaled.
+
+    Args:
+        width: Source width
+        height: Source height
+        max_side: Max output width/height. None keeps the source size
+
+    Returns:
+        tuple: (width, height)
+    """
+    if not max_side or max(width, height) <= max_side:
+        return width, height
+    scale = max_side / max(width, height)
+    return (
+        max(2, int(round(width * scale / 2)) * 2),
+        max(2, int(round(height * scale / 2)) * 2),
+    )
+
+
+class FFmpegVideoReader:
+    """
+    cv2.VideoCapture-like reader backed by an ffmpeg subprocess.
+
+    Frames returned by `read()`/`retrieve()` are views of the internal ring
+    buffers: a frame stays valid until `ring_size` more frames have been
+    retrieved, so `ring_size` must exceed the frames a caller keeps in flight
+    (batch, pipeline queues, preview). Frame positions and timestamps assume
+    a constant frame rate. If ffmpeg exits with an error, `grab()` raises
+    RuntimeError instead of reporting a normal end of video.
+    """
+
+    def __init__(
+        self,
+        file_path: str,
+        max_side: Optional[int] = FFMPEG_MAX_SIDE,
+        ring_size: int = INFERENCE_BATCH_SIZE + 4,
+        ffmpeg_binary: str = FFMPEG_BINARY,
+    ) -> None:
+        self.file_path = file_path
+        self.ffmpeg_binary = ffmpeg_binary
+        self._process: Optional[subprocess.Popen] = None
+        self._stderr = None
+        self._position = 0  # Number of the next frame in the pipe
+
+        # Container metadata only; no frame is decoded here
+        probe = cv2.VideoCapture(file_path)
+        self._opened = probe.isOpened()
+        self.fps = probe.get(cv2.CAP_PROP_FPS) if self._opened else 0.0
+        self.frame_count = probe.get(cv2.CAP_PROP_FRAME_COUNT) if self._opened else 0
+        source_width = int(probe.get(cv2.CAP_PROP_FRAME_WIDTH))
+        source_height = int(probe.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        probe.release()
+        # Size of the frames in the file, before the scale filter
+        self.source_size = (source_width, source_height)
+        if not self._opened:
+            return
+
+        self.width, self.height = scaled_size(source_width, source_height, max_side)
+        self._frame_bytes = self.width * self.height * 3
+        self._buffers = [
+            np.empty((self.height, self.width, 3), dtype=np.uint8)
+            for _ in range(max(2, ring_size))
+        ]
+        self._next_buffer = 0
+        self._grabbed = False
+        self._start(0)
+
+    def _start(self, frame_number: int) -> None:
+        """(Re)start ffmpeg so that the next frame in the pipe is `frame_number`."""
+        self._stop()
+        command = [self.ffmpeg_binary, "-nostdin", "-loglevel", "error"]
+        if frame_number > 0 and self.fps > 0:
+            # Input seeking, frame accurate when transcoding
+            command += ["-ss", f"{frame_number / self.fps:.6f}"]
+        command += [
+            "-i",
+            self.file_path,
+            "-an",
+            "-sn",
+            "-vf",
+            f"scale={self.width}:{self.height}:flags=area",
+            "-vsync",
+            "passthrough",
+            "-f",
+            "rawvideo",
+            "-pix_fmt",
+            "bgr24",
+            "-",
+        ]
+        # A file, not a pipe: nobody reads stderr while frames are streamed
+        self._stderr = tempfile.TemporaryFile()
+        self._process = subprocess.Popen(
+            command,
+            stdout=subprocess.PIPE,
+            stderr=self._stderr,
+            bufsize=self._frame_bytes,
+        )
+        self._position = frame_number
+        self._grabbed = False
+
+    def _stop(self) -> None:
+        if self._process is None:
+            return
+        self._process.stdout.close()
+        self._process.kill()
+        self._process.wait()
+        self._process = None
+        self._stderr.close()
+        self._stderr = None
+
+    def _check_exit(self) -> None:
+        """At the end of the pipe, raise if ffmpeg stopped because of an error."""
+        returncode = self._process.wait()
+        if returncode == 0:
+            return
+        self._stderr.seek(0)
+        message = self._stderr.read().decode(errors="replace").strip()
+        self._stop()
+        raise RuntimeError(
+            f"ffmpeg failed on {self.file_path} (exit code {returncode}): "
+            f"{message or 'no error output'}"
+        )
+
+    def isOpened(self) -> bool:
+        return self._opened
+
+    def grab(self) -> bool:
+        """Read the next frame into the current ring buffer without committing it."""
+        if self._process is None:
+            return False
+        view = memoryview(self._buffers[self._next_buffer]).cast("B")
+        filled = 0
+        while filled < self._frame_bytes:
+            count = self._process.stdout.readinto(view[filled:])
+            if not count:
+                self._grabbed = False
+                self._check_exit()
+                return False
+            filled += count
+        self._position += 1
+        self._grabbed = True
+        return True
+
+    def retrieve(self) -> tuple[bool, Optional[np.ndarray]]:
+        """Return the grabbed frame and move on to the next ring buffer."""
+        if not self._grabbed:
+            return False, None
+        frame = self._buffers[self._next_buffer]
+        self._next_buffer = (self._next_buffer + 1) % len(self._buffers)
+        self._grabbed = False
+        return True, frame
+
+    def read(self) -> tuple[bool, Optional[np.ndarray]]:
+        if not self.grab():
+            return False, None
+        return self.retrieve()
+
+    def get(self, prop_id: int) -> float:
+        if prop_id == cv2.CAP_PROP_FPS:
+            return self.fps
+        if prop_id == cv2.CAP_PROP_FRAME_COUNT:
+            return self.frame_count
+        if prop_id == cv2.CAP_PROP_FRAME_WIDTH:
+            return float(self.width)
+        if prop_id == cv2.CAP_PROP_FRAME_HEIGHT:
+            return float(self.height)
+        if prop_id == cv2.CAP_PROP_POS_FRAMES:
+            return float(self._position)
+        if prop_id == cv2.CAP_PROP_POS_MSEC:
+            # Like OpenCV: timestamp of the last frame read
+            if self._position == 0 or self.fps <= 0:
+                return 0.0
+            return (self._position - 1) * 1000 / self.fps
+        return 0.0
+
+    def set(self, prop_id: int, value: float) -> bool:
+        if prop_id == cv2.CAP_PROP_POS_FRAMES and self._opened:
+            self._start(max(0, int(value)))
+            return True
+        return False
+
+    def release(self) -> None:
+        self._stop()
+        self._opened = False
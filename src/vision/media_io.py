@@ -3,103 +3,484 @@ Media I/O handler for computer vision operations with YOLO detection.
 Handles camera, image, and video processing with automatic data logging.
 """
 
+import os
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from itertools import islice
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 import cv2
 import numpy as np
 import pandas as pd
 
+from . import config
+from .camera_discovery import (
+    camera_backends,
+    discover_cameras,
+    find_cached_camera,
+    invalidate_camera_cache,
+)
+from .accumulator import DetectionAccumulator
+from .capture import LatencyMonitor, LatestFrameCapture
+from .checkpoint import VideoCheckpoint
 from .config import (
+    CAMERA_BUFFER_SIZE,
+    CAMERA_LATEST_FRAME,
     CAM_INDEX,
+    CHECKPOINT_ENABLED,
     FRAME_HEIGHT,
     FRAME_WIDTH,
+    IMAGE_DECODE_WORKERS,
+    IMAGE_READ_REDUCTION,
     IMG_INPUT_PATH,
+    INFERENCE_BATCH_SIZE,
+    MOTION_GATING_ENABLED,
+    MULTI_SOURCES,
+    PIPELINE_QUEUE_SIZE,
+    PREVIEW_ENABLED,
+    RESULT_CACHE_ENABLED,
+    TORCH_THREADS_PER_WORKER,
+    TRACKER_KEYFRAME_INTERVAL,
+    TRACKING_ENABLED,
+    VIDEO_FRAME_STRIDE,
     VIDEO_INPUT_PATH,
+    VIDEO_PIPELINE_ENABLED,
+    VIDEO_READER,
+    VIDEO_SPLIT_RANGES,
+    VIDEO_TARGET_FPS,
+    VIDEO_WORKERS,
 )
-from .model import YoloModel
+from .detections import empty_detections
+from .ffmpeg_reader import FFmpegVideoReader, ffmpeg_available
+from .model import YoloModel, get_shared_model
+from .motion_gate import MotionGate
+from .multi_source import MultiSourceScheduler, SourceSession
+from .output_writer import ChunkedDetectionWriter
+from .parallel import process_video_in_ranges, process_videos_in_parallel
+from .pipeline import FramePipeline
+from .preview import PreviewRenderer
+from .result_cache import ResultCache
+from .tracker import IoUTracker
 from .utils import (
-    add_detection_to_dataframe,
-    create_detection_dataframe_schema,
+    build_detection_columns,
     draw_multiple_detections,
     extract_filename_from_path,
+    new_run_id,
 )
 
+_IMREAD_REDUCTION_FLAGS = {
+    1: cv2.IMREAD_COLOR,
+    2: cv2.IMREAD_REDUCED_COLOR_2,
+    4: cv2.IMREAD_REDUCED_COLOR_4,
+    8: cv2.IMREAD_REDUCED_COLOR_8,
+}
+
 
 class MediaIO:
     """Media I/O handler for computer vision operations with YOLO detection."""
 
-    def __init__(self) -> None:
-        self._yolo_model = YoloModel()
-        self.dataframe = pd.DataFrame(columns=create_detection_dataframe_schema())
+    def __init__(
+        self,
+        motion_gating: bool = MOTION_GATING_ENABLED,
+        tracking: bool = TRACKING_ENABLED,
+        keyframe_interval: int = TRACKER_KEYFRAME_INTERVAL,
+        result_cache: bool = RESULT_CACHE_ENABLED,
+        output_writer: Optional[ChunkedDetectionWriter] = None,
+        run_id: Optional[str] = None,
+    ) -> None:
+        # Written with every row: track IDs are only unique within a run
+        self.run_id = run_id or new_run_id()
+        self._stream_run_id = self.run_id
+        # Loaded on first inference from the process-wide registry
+        self._yolo_model: Optional[YoloModel] = None
+        self._created_at = time.perf_counter()
+        self._first_detection_seconds: Optional[float] = None
+        self._latency_monitor: Optional[LatencyMonitor] = None
+        self._detections = DetectionAccumulator()
         self._frame_counter = 0
         self._start_time = None
+        self._motion_gate = MotionGate() if motion_gating else None
+        self._tracker = IoUTracker() if tracking else None
+        self._motion_gating = motion_gating
+        self._tracking = tracking
+        self._keyframe_interval = max(1, keyframe_interval)
+        self._tracked_frames = 0
+        self._last_detections = empty_detections()
+        self._result_cache = ResultCache() if result_cache else None
+        # With a writer, rows are flushed to chunk files and dropped from memory
+        self._output_writer = output_writer
+        self._flushes = 0
+
+    @property
+    def yolo_model(self) -> YoloModel:
+        """Shared YOLO model, loaded (and warmed up) on first access."""
+        if self._yolo_model is None:
+            self._yolo_model = get_shared_model()
+            warmup = self._yolo_model.warmup_seconds
+            print(
+                f"Model ready: loaded in {self._yolo_model.load_seconds:.2f}s"
+                + (f", warm-up {warmup:.2f}s" if warmup is not None else "")
+            )
+        return self._yolo_model
+
+    def warmup(self) -> None:
+        """Load and warm up the model now instead of on the first frame."""
+        _ = self.yolo_model
+
+    def get_startup_stats(self) -> dict:
+        """
+        Get the cold start timings of this instance.
+
+        Returns:
+            dict: Model load and warm-up seconds (None until the model is
+            loaded; a model shared with an earlier instance keeps its original
+            timings) and seconds from creating the MediaIO to the first
+            completed inference
+        """
+        model = self._yolo_model
+        return {
+            "model_load_seconds": model.load_seconds if model else None,
+            "warmup_seconds": model.warmup_seconds if model else None,
+            "first_detection_seconds": self._first_detection_seconds,
+        }
 
     def _reset_counters(self) -> None:
-        """Reset frame counter and start time."""
+        """Reset frame counter, start time, motion gate and tracker state."""
         self._frame_counter = 0
         self._start_time = time.time()
+        self._stream_run_id = self.run_id
+        self._last_detections = empty_detections()
+        self._tracked_frames = 0
+        if self._motion_gate is not None:
+            self._motion_gate.reset()
+        if self._tracker is not None:
+            self._tracker.reset()
+
+    def _get_stream_state(self, next_frame: int) -> dict:
+        """State needed to resume the current video at `next_frame`."""
+        return {
+            "next_frame": next_frame,
+            "run_id": self._stream_run_id,
+            "motion_gate": self._motion_gate,
+            "tracker": self._tracker,
+            "tracked_frames": self._tracked_frames,
+            "last_detections": self._last_detections,
+        }
+
+    def _restore_stream_state(self, state: dict) -> None:
+        """
+        Restore the motion gate and tracker state saved by `_get_stream_state`.
+        The rest of the video keeps the run ID of its first rows, so its track
+        IDs stay comparable.
+        """
+        self._stream_run_id = state.get("run_id", self.run_id)
+        self._motion_gate = state["motion_gate"]
+        self._tracker = state["tracker"]
+        self._tracked_frames = state["tracked_frames"]
+        self._last_detections = state["last_detections"]
+
+    def get_motion_gate_stats(self) -> Optional[dict]:
+        """Get skip statistics of the motion gate for the current source."""
+        if self._motion_gate is None:
+            return None
+        return self._motion_gate.stats()
+
+    def _print_motion_gate_stats(self) -> None:
+        stats = self.get_motion_gate_stats()
+        if stats is not None:
+            print(
+                f"Motion gate: skipped {stats['skipped_frames']}/{stats['total_frames']} "
+                f"frames ({stats['skip_ratio']:.1%})"
+            )
 
     def get_df_detections(self) -> pd.DataFrame:
-        """Get the current detections dataframe."""
-        return self.dataframe
+        """Build a dataframe with the detections collected so far (not yet flushed)."""
+        return self._detections.to_dataframe()
 
-    def _process_detection(
-        self, frame: np.ndarray, source_type: str, source_id: str, preview: bool = True
-    ) -> None:
-        """Process frame with YOLO detection and update dataframe."""
-        has_detections = self._yolo_model.run_inference_on_frame(frame)
+    def clear_detections(self) -> None:
+        """Drop all detections collected so far."""
+        self._detections.clear()
+
+    def flush_detections(self, force: bool = True) -> None:
+        """
+        Hand the collected detections over to the output writer (if any) and
+        drop them from memory.
 
-        if not has_detections:
+        Args:
+            force: Write whatever is pending. If False, write only when the
+                writer's row or time bound is reached
+        """
+        writer = self._output_writer
+        if writer is None or not len(self._detections):
             return
+        if force or writer.due(len(self._detections)):
+            writer.write(self._detections.to_dataframe())
+            self._detections.clear()
+            self._flushes += 1
 
-        detections = self._yolo_model.get_detections()
+    def _flush_due(self) -> bool:
+        """Check whether the output writer wants the pending rows now."""
+        writer = self._output_writer
+        return writer is not None and writer.due(len(self._detections))
 
-        for class_name, confidence, bbox, class_id in detections:
-            self.dataframe = add_detection_to_dataframe(
-                self.dataframe,
+    # ==================== RESULT CACHE ====================
+
+    def _result_cache_params(self, **params) -> dict:
+        """
+        Settings that change the detection rows of a file, used in the result
+        cache key together with the `params` of the processing mode.
+        """
+        settings = {
+            name: value
+            for name, value in vars(config).items()
+            if name.startswith(("MOTION_", "TRACKER_"))
+        }
+        settings.update(
+            motion_gating=self._motion_gating,
+            tracking=self._tracking,
+            keyframe_interval=self._keyframe_interval,
+        )
+        settings.update(params)
+        return settings
+
+    def _worker_settings(self) -> dict:
+        """MediaIO keyword arguments that worker processes must share with this one."""
+        return {
+            "motion_gating": self._motion_gating,
+            "tracking": self._tracking,
+            "keyframe_interval": self._keyframe_interval,
+            "run_id": self.run_id,
+        }
+
+    def _video_cache_params(self, split_ranges: bool) -> dict:
+        reader = (
+            "ffmpeg" if VIDEO_READER == "ffmpeg" and ffmpeg_available() else "opencv"
+        )
+        return self._result_cache_params(
+            mode="video",
+            frame_stride=VIDEO_FRAME_STRIDE,
+            target_fps=VIDEO_TARGET_FPS,
+            reader=reader,
+            ffmpeg_max_side=config.FFMPEG_MAX_SIDE if reader == "ffmpeg" else None,
+            split_ranges=split_ranges,
+        )
+
+    def _load_cached_rows(self, path: Path, params: dict) -> Optional[pd.DataFrame]:
+        """Get the cached detection rows of a file, or None if it must be processed."""
+        if self._result_cache is None:
+            return None
+        try:
+            rows = self._result_cache.load(str(path), params)
+        except OSError as e:
+            print(f"Result cache error ({path.name}): {e}")
+            return None
+        return rows
+
+    def _store_cached_rows(self, path: Path, params: dict, rows: pd.DataFrame) -> None:
+        """Save the detection rows of a fully processed file in the result cache."""
+        if self._result_cache is None:
+            return
+        try:
+            self._result_cache.store(str(path), params, rows)
+        except OSError as e:
+            print(f"Result cache error ({path.name}): {e}")
+
+    def _finish_result_cache(self) -> None:
+        """Write the pending file hashes of the result cache and print its stats."""
+        if self._result_cache is not None:
+            try:
+                self._result_cache.flush()
+            except OSError as e:
+                print(f"Result cache error: {e}")
+            stats = self._result_cache.stats()
+            print(
+                f"Result cache: {stats['hits']} file(s) reused, "
+                f"{stats['misses']} processed"
+            )
+
+    def _needs_inference(self, frame: np.ndarray) -> bool:
+        """Check whether a frame has to go through YOLO."""
+        if self._tracker is not None:
+            is_keyframe = self._tracked_frames % self._keyframe_interval == 0
+            self._tracked_frames += 1
+            if not is_keyframe:
+                return False
+        return self._motion_gate is None or self._motion_gate.should_infer(frame)
+
+    def _run_model(self, frames: list[np.ndarray]) -> list[np.ndarray]:
+        """
+        Run YOLO on a batch of frames and return the detections of each frame
+        as a structured array (see detections.py), with track_id -1.
+        """
+        detections = [
+            self.yolo_model.to_detections(xyxy, conf, cls)
+            for xyxy, conf, cls in self.yolo_model.run_inference_on_batch(frames)
+        ]
+        if self._first_detection_seconds is None and frames:
+            self._first_detection_seconds = time.perf_counter() - self._created_at
+            print(
+                f"Cold start to first detection: {self._first_detection_seconds:.2f}s"
+            )
+        return detections
+
+    def _infer_frames(self, frames: list[np.ndarray]) -> list[np.ndarray]:
+        """
+        Get the detections of a batch of consecutive frames of a stream.
+        With motion gating, frames without changes reuse the detections of the
+        last inferred frame; with tracking, only keyframes reach the model and
+        the tracker propagates the boxes in between. Untracked detections have
+        track_id -1.
+        """
+        needs_inference = [self._needs_inference(frame) for frame in frames]
+        inferred = iter(
+            self._run_model(
+                [frame for frame, needed in zip(frames, needs_inference) if needed]
+            )
+        )
+        return [
+            self._complete_detections(frame, next(inferred) if needed else None)
+            for frame, needed in zip(frames, needs_inference)
+        ]
+
+    def _complete_detections(
+        self, frame: np.ndarray, detections: Optional[np.ndarray]
+    ) -> np.ndarray:
+        """
+        Turn the YOLO detections of a frame (None if the frame was not
+        inferred) into its final detections with their track IDs, updating
+        the tracker and the reusable last detections.
+        """
+        if detections is not None:
+            if self._tracker is not None:
+                detections["track_id"] = self._tracker.update(detections)
+        elif self._tracker is not None:
+            detections = self._tracker.propagate(frame.shape)
+        else:
+            return self._last_detections
+
+        self._last_detections = detections
+        return self._last_detections
+
+    def _record_detections(
+        self,
+        frame: np.ndarray,
+        detections: np.ndarray,
+        source_type: str,
+        source_id: str,
+        preview: bool = True,
+        timestamp_sec: Optional[float] = None,
+        source_size: Optional[tuple[int, int]] = None,
+    ) -> None:
+        """
+        Append the detections of a frame to the accumulator and, with `preview`,
+        log them. Drawing is left to the preview renderer.
+        `timestamp_sec` is the position of the frame in its source; camera and
+        image frames leave it as None and use the elapsed processing time.
+        `source_size` is the (width, height) of the source when the frame was
+        decoded at a reduced size (see `_source_size`, `_image_source_size`).
+        """
+        if len(detections) == 0:
+            return
+
+        class_names = self.yolo_model.class_name_table
+        self._detections.extend(
+            build_detection_columns(
                 source_type,
                 source_id,
                 frame,
-                class_name,
-                confidence,
-                bbox,
-                class_id,
+                detections,
+                class_names,
                 self._frame_counter,
                 self._start_time,
+                timestamp_sec,
+                source_size,
+                self._stream_run_id,
             )
+        )
 
-        if preview and detections:
-            draw_multiple_detections(frame, detections)
+        if preview:
             detection_summary = ", ".join(
-                [f"{name}({conf:.2f})" for name, conf, _, _ in detections]
+                f"{class_names[class_id]}({conf:.2f})"
+                for class_id, conf in zip(
+                    detections["class_id"].tolist(), detections["confidence"].tolist()
+                )
             )
             print(f"Frame {self._frame_counter}: {detection_summary}")
 
+    # ==================== EXTERNAL SCHEDULING ====================
+
+    def start_stream(self) -> None:
+        """
+        Prepare for a stream of frames whose inference is run by a caller
+        (see multi_source.py), resetting counters, motion gate and tracker.
+        """
+        self._reset_counters()
+
+    def needs_inference(self, frame: np.ndarray) -> bool:
+        """
+        Check whether the next frame of the stream has to go through YOLO.
+        Must be called once per frame, in order, before `record_frame`.
+        """
+        return self._needs_inference(frame)
+
+    def record_frame(
+        self,
+        frame: np.ndarray,
+        frame_number: int,
+        inferred: Optional[np.ndarray],
+        source_type: str,
+        source_id: str,
+        timestamp_sec: Optional[float] = None,
+    ) -> np.ndarray:
+        """
+        Record a frame of the stream with the detections inferred by the caller.
+
+        Args:
+            frame: Frame passed to `needs_inference`
+            frame_number: Position of the frame in its source
+            inferred: YOLO detections of the frame (structured array, see
+                detections.py), None if `needs_inference` returned False
+            source_type: Type of source ("video", "camera")
+            source_id: Source identifier
+            timestamp_sec: Position of the frame in its source, None for cameras
+
+        Returns:
+            np.ndarray: Final detections of the frame, with their track IDs
+        """
+        detections = self._complete_detections(frame, inferred)
+        self._frame_counter = frame_number
+        self._record_detections(
+            frame,
+            detections,
+            source_type,
+            source_id,
+            preview=False,
+            timestamp_sec=timestamp_sec,
+        )
+        self.flush_detections(force=False)
+        return detections
+
     # ==================== CAMERA OPERATIONS ====================
 
     @staticmethod
-    def diagnose_cameras() -> list[int]:
-        """Diagnose available cameras and return list of working indices."""
-        working_cameras = []
-        backends = [cv2.CAP_V4L2, cv2.CAP_DSHOW, cv2.CAP_ANY]
-
+    def diagnose_cameras(use_cache: bool = True) -> list[int]:
+        """
+        Diagnose available cameras and return list of working indices.
+        Candidates are probed in parallel and the result is cached on disk
+        (see camera_discovery), so repeated calls are near-instant.
+        """
         print("Scanning for available cameras...")
-        for index in range(0, 10):  # Check indices 0-9
-            for backend in backends:
-                cap = cv2.VideoCapture(index, backend)
-                if cap.isOpened():
-                    ret, frame = cap.read()
-                    if ret and frame is not None:
-                        print(
-                            f"✓ Camera {index} working (backend: {backend}, resolution: {frame.shape[1]}x{frame.shape[0]})"
-                        )
-                        working_cameras.append(index)
-                        cap.release()
-                        break  # Found working camera at this index
-                cap.release()
+        cameras = discover_cameras(use_cache=use_cache)
+        for camera in cameras:
+            print(
+                f"✓ Camera {camera['index']} working (backend: {camera['backend']}, "
+                f"resolution: {camera['width']}x{camera['height']})"
+            )
 
+        working_cameras = [camera["index"] for camera in cameras]
         if not working_cameras:
             print("✗ No working cameras found")
         else:
@@ -107,15 +488,40 @@ class MediaIO:
 
         return working_cameras
 
+    @staticmethod
+    def _configure_camera(
+        cap: cv2.VideoCapture,
+        width: Optional[int],
+        height: Optional[int],
+        buffer_size: Optional[int],
+    ) -> cv2.VideoCapture:
+        if width is not None:
+            cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+        if height is not None:
+            cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+        if buffer_size is not None:
+            cap.set(cv2.CAP_PROP_BUFFERSIZE, buffer_size)
+        return cap
+
     def open_camera(
         self,
         index: int = CAM_INDEX,
         width: Optional[int] = FRAME_WIDTH,
         height: Optional[int] = FRAME_HEIGHT,
+        buffer_size: Optional[int] = CAMERA_BUFFER_SIZE,
     ) -> cv2.VideoCapture:
-        """Open camera with specified dimensions."""
-        # Try different backends in order of preference
-        backends = [cv2.CAP_V4L2, cv2.CAP_DSHOW, cv2.CAP_ANY]
+        """
+        Open camera with specified dimensions and driver buffer size.
+        The backend found by the last discovery is tried first; if the camera
+        cannot be opened, the cache is invalidated and a fresh (parallel)
+        discovery picks a working camera.
+        """
+        cached = find_cached_camera(index)
+        backends = camera_backends()
+        if cached is not None:
+            backends = [cached["backend"]] + [
+                backend for backend in backends if backend != cached["backend"]
+            ]
 
         for backend in backends:
             cap = cv2.VideoCapture(index, backend)
@@ -123,26 +529,20 @@ class MediaIO:
                 print(
                     f"Camera opened successfully with backend {backend} and index {index}"
                 )
-                if width is not None:
-                    cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
-                if height is not None:
-                    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
-                return cap
+                return self._configure_camera(cap, width, height, buffer_size)
             cap.release()
 
-        # If all backends fail, try different indices
+        # The camera may have been unplugged or renumbered: scan again
         print(f"Failed to open camera with index {index}. Trying other indices...")
-        for test_index in range(0, 4):  # Try indices 0-3
-            for backend in backends:
-                cap = cv2.VideoCapture(test_index, backend)
-                if cap.isOpened():
-                    print(f"Camera found at index {test_index} with backend {backend}")
-                    if width is not None:
-                        cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
-                    if height is not None:
-                        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
-                    return cap
-                cap.release()
+        invalidate_camera_cache()
+        for camera in discover_cameras(use_cache=False):
+            cap = cv2.VideoCapture(camera["index"], camera["backend"])
+            if cap.isOpened():
+                print(
+                    f"Camera found at index {camera['index']} with backend {camera['backend']}"
+                )
+                return self._configure_camera(cap, width, height, buffer_size)
+            cap.release()
 
         raise RuntimeError(
             f"Could not open any camera. Please check if a camera is connected and accessible."
@@ -154,49 +554,174 @@ class MediaIO:
         preview: bool = True,
         window_title: str = "Camera preview",
         exit_key: str = "q",
+        latest_frame: bool = CAMERA_LATEST_FRAME,
     ) -> None:
-        """Live camera preview with object detection."""
+        """
+        Live camera processing with object detection. With `preview` the
+        annotated frames are shown by a renderer thread; without it no GUI
+        call is made. With `latest_frame` a capture thread keeps only the
+        newest frame, so slow inference skips frames instead of lagging.
+        The capture-to-detection latency of every frame is monitored.
+        """
         if preview:
             print(f"Camera opened. Press '{exit_key}' to exit.")
         else:
             print("Camera processing started. Press Ctrl+C to stop.")
 
         self._reset_counters()
+        renderer = (
+            PreviewRenderer(
+                window_title, self.yolo_model.class_name_table, exit_key=exit_key
+            )
+            if preview
+            else None
+        )
+        capture = LatestFrameCapture(cap) if latest_frame else None
+        self._latency_monitor = LatencyMonitor()
+        alerting = False
 
-        while True:
-            ret, frame = cap.read()
-            if not ret:
-                print("Could not read frame from camera.")
-                break
+        try:
+            if renderer is not None:
+                renderer.start()
+            if capture is not None:
+                capture.start()
+            while renderer is None or not renderer.stop_requested:
+                if capture is not None:
+                    ret, frame, captured_at = capture.read()
+                else:
+                    ret, frame = cap.read()
+                    captured_at = time.perf_counter()
+                if not ret:
+                    print("Could not read frame from camera.")
+                    break
 
-            self._process_detection(frame, "camera", "live_camera", preview=preview)
+                detections = self._infer_frames([frame])[0]
+                is_alert = self._latency_monitor.record(captured_at)
+                if is_alert and not alerting:
+                    print(
+                        f"⚠ Capture-to-detection latency {self._latency_monitor.last_ms:.0f} ms "
+                        f"above {self._latency_monitor.alert_ms} ms"
+                    )
+                alerting = is_alert
+                self._record_detections(
+                    frame, detections, "camera", "live_camera", preview=preview
+                )
+                self.flush_detections(force=False)
+
+                if renderer is not None:
+                    renderer.submit(frame, detections)
+                elif (self._frame_counter + 1) % 30 == 0:
+                    print(f"Processed {self._frame_counter + 1} frames...")
 
-            if preview:
-                cv2.imshow(window_title, frame)
-                if cv2.waitKey(1) & 0xFF == ord(exit_key):
-                    break
-            else:
                 self._frame_counter += 1
-                if self._frame_counter % 30 == 0:
-                    print(f"Processed {self._frame_counter} frames...")
+        finally:
+            if capture is not None:
+                capture.stop()
+                print(
+                    f"Capture: {capture.dropped_frames}/{capture.captured_frames} "
+                    "frames dropped (only the newest frame is processed)"
+                )
+            if renderer is not None:
+                renderer.close()
+            self.flush_detections()
+            self._print_latency_stats()
+            self._print_motion_gate_stats()
+
+    def get_latency_stats(self) -> Optional[dict]:
+        """Get capture-to-detection latency stats of the last camera session."""
+        if self._latency_monitor is None:
+            return None
+        return self._latency_monitor.stats()
 
-            self._frame_counter += 1
+    def _print_latency_stats(self) -> None:
+        stats = self.get_latency_stats()
+        if stats is not None and stats["frames"]:
+            print(
+                f"Latency: mean {stats['mean_ms']:.0f} ms | p95 {stats['p95_ms']:.0f} ms "
+                f"| max {stats['max_ms']:.0f} ms | {stats['alerts']} alert(s)"
+            )
 
     @staticmethod
     def release_camera(cap: cv2.VideoCapture) -> None:
-        """Release camera and close windows."""
+        """Release camera."""
         cap.release()
-        cv2.destroyAllWindows()
 
     # ==================== IMAGE OPERATIONS ====================
 
-    def read_image_from_file(self, file_path: str) -> np.ndarray:
-        """Read image from file path."""
-        image = cv2.imread(file_path, cv2.IMREAD_COLOR)
+    def read_image_from_file(
+        self, file_path: str, reduction: int = IMAGE_READ_REDUCTION
+    ) -> np.ndarray:
+        """
+        Read image from file path.
+        `reduction` 2, 4 or 8 decodes at 1/N size (IMREAD_REDUCED_COLOR_N),
+        which is much faster for huge JPEGs.
+        """
+        flag = _IMREAD_REDUCTION_FLAGS.get(reduction)
+        if flag is None:
+            raise ValueError(f"Unsupported image reduction: {reduction}")
+        image = cv2.imread(file_path, flag)
         if image is None:
             raise FileNotFoundError(f"Could not read image: {file_path}")
         return image
 
+    @staticmethod
+    def _image_source_size(file_path: str) -> tuple[int, int]:
+        """
+        Get the (width, height) of an image as cv2.imread returns it at full
+        size, reading only the file header. EXIF rotations by 90 degrees swap
+        the stored size, like imread does.
+        """
+        from PIL import Image
+
+        with Image.open(file_path) as image:
+            width, height = image.size
+            # Orientation tag 0x0112: values 5-8 are transposed
+            if image.getexif().get(0x0112, 1) in (5, 6, 7, 8):
+                width, height = height, width
+        return width, height
+
+    def _iter_decoded_images(
+        self,
+        image_paths: list[Path],
+        workers: Optional[int] = IMAGE_DECODE_WORKERS,
+        reduction: int = IMAGE_READ_REDUCTION,
+        prefetch: int = INFERENCE_BATCH_SIZE,
+    ) -> Iterator[tuple[Path, Optional[np.ndarray], Optional[Exception]]]:
+        """
+        Decode images on a thread pool (cv2.imread releases the GIL).
+        Results come back in input order and at most `workers + prefetch`
+        images are decoded ahead, so memory stays bounded for huge folders.
+
+        Yields:
+            tuple: (path, image, None) or (path, None, error) for files that
+            could not be read
+        """
+        workers = workers or os.cpu_count() or 1
+        paths = iter(image_paths)
+        pending = deque()
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="image-decode"
+        ) as executor:
+
+            def submit_next() -> None:
+                path = next(paths, None)
+                if path is not None:
+                    future = executor.submit(
+                        self.read_image_from_file, str(path), reduction
+                    )
+                    pending.append((path, future))
+
+            for _ in range(workers + prefetch):
+                submit_next()
+
+            while pending:
+                path, future = pending.popleft()
+                submit_next()
+                try:
+                    yield path, future.result(), None
+                except Exception as e:
+                    yield path, None, e
+
     def preview_image(
         self,
         image: np.ndarray,
@@ -211,13 +736,148 @@ class MediaIO:
 
     # ==================== VIDEO OPERATIONS ====================
 
-    def read_video_from_file(self, file_path: str) -> cv2.VideoCapture:
-        """Open video file for reading."""
+    def read_video_from_file(
+        self,
+        file_path: str,
+        reader: str = VIDEO_READER,
+        ring_size: int = INFERENCE_BATCH_SIZE + 4,
+    ) -> cv2.VideoCapture:
+        """
+        Open video file for reading.
+        With reader="ffmpeg" the frames are decoded at reduced resolution by
+        an ffmpeg process into `ring_size` reusable buffers (see
+        FFmpegVideoReader); it falls back to OpenCV if ffmpeg is not installed.
+        """
+        if reader == "ffmpeg":
+            if ffmpeg_available():
+                cap = FFmpegVideoReader(file_path, ring_size=ring_size)
+                if not cap.isOpened():
+                    raise FileNotFoundError(f"Could not open video: {file_path}")
+                return cap
+            print("ffmpeg not found, decoding with OpenCV instead.")
         cap = cv2.VideoCapture(file_path)
         if not cap.isOpened():
             raise FileNotFoundError(f"Could not open video: {file_path}")
         return cap
 
+    @staticmethod
+    def _source_size(cap) -> Optional[tuple[int, int]]:
+        """
+        Get the source (width, height) of a capture that decodes at a reduced
+        size (FFmpegVideoReader), or None if frames come at the source size.
+        """
+        if isinstance(cap, FFmpegVideoReader):
+            return cap.source_size
+        return None
+
+    @staticmethod
+    def _seek_to_frame(cap: cv2.VideoCapture, frame_number: int) -> None:
+        """
+        Position a capture so that the next read returns `frame_number`.
+        CAP_PROP_POS_FRAMES only echoes the requested position, so the seek is
+        checked by decoding the frame before the target and comparing its
+        timestamp (relative to the first frame, at a constant frame rate). A
+        seek that lands on an earlier keyframe is grabbed forward; one that
+        overshoots is rewound and grabbed from the start.
+        """
+        if frame_number <= 0:
+            return
+
+        fps = cap.get(cv2.CAP_PROP_FPS)
+        if isinstance(cap, FFmpegVideoReader) or fps <= 0:
+            # ffmpeg seeks are frame accurate; without a frame rate there is
+            # nothing to check against
+            cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
+            return
+
+        cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+        if not cap.grab():
+            return
+        first_msec = cap.get(cv2.CAP_PROP_POS_MSEC)
+
+        # Index of the last grabbed frame; the next read is position + 1
+        position = 0
+        target = frame_number - 1
+        if target > 0:
+            cap.set(cv2.CAP_PROP_POS_FRAMES, target)
+            if cap.grab():
+                msec = cap.get(cv2.CAP_PROP_POS_MSEC)
+                position = round((msec - first_msec) * fps / 1000)
+            else:
+                position = target + 1  # Past the end: rewind below
+            if not 0 < position <= target:
+                # Overshot, or no usable timestamp (position 0 is ambiguous)
+                cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+                position = -1
+
+        while position < target:
+            if not cap.grab():
+                return
+            position += 1
+
+    @staticmethod
+    def resolve_frame_stride(
+        cap: cv2.VideoCapture,
+        frame_stride: int = VIDEO_FRAME_STRIDE,
+        target_fps: Optional[float] = VIDEO_TARGET_FPS,
+    ) -> int:
+        """
+        Get the frame stride to use for a video.
+
+        Args:
+            cap: Opened video capture
+            frame_stride: Analyse every Nth frame
+            target_fps: Desired analysis rate. If set and the source fps is
+                known, it takes precedence over frame_stride
+
+        Returns:
+            int: Stride of at least 1
+        """
+        if target_fps:
+            source_fps = cap.get(cv2.CAP_PROP_FPS)
+            if source_fps > 0:
+                return max(1, round(source_fps / target_fps))
+        return max(1, int(frame_stride))
+
+    @staticmethod
+    def iter_video_frames(
+        cap: cv2.VideoCapture,
+        start_frame: int = 0,
+        end_frame: Optional[int] = None,
+        frame_stride: int = 1,
+    ) -> Iterator[tuple[tuple[int, float], np.ndarray]]:
+        """
+        Yield ((frame_number, timestamp_sec), frame) for the frames of a video.
+        Frame numbers and timestamps come from the container, so they are the
+        same whether the video is read from the start or from a seek.
+
+        Args:
+            cap: Opened video capture
+            start_frame: First frame to read
+            end_frame: Frame to stop at (exclusive). None reads to the end
+            frame_stride: Only frames whose number is a multiple of the stride
+                are returned; the ones in between are advanced with grab()
+        """
+        frame_stride = max(1, frame_stride)
+        # Align to the stride so a range yields the same frames as a full read
+        frame_number = start_frame + (-start_frame % frame_stride)
+        MediaIO._seek_to_frame(cap, frame_number)
+
+        while end_frame is None or frame_number < end_frame:
+            ret, frame = cap.read()
+            if not ret:
+                return
+            timestamp_sec = cap.get(cv2.CAP_PROP_POS_MSEC) / 1000
+            yield (frame_number, timestamp_sec), frame
+            frame_number += 1
+
+            for _ in range(frame_stride - 1):
+                if end_frame is not None and frame_number >= end_frame:
+                    return
+                if not cap.grab():
+                    return
+                frame_number += 1
+
     def preview_video(
         self,
         cap: cv2.VideoCapture,
@@ -225,8 +885,28 @@ class MediaIO:
         preview: bool = True,
         window_title: str = "Video Preview",
         exit_key: str = "q",
-    ) -> None:
-        """Preview video with object detection."""
+        batch_size: int = INFERENCE_BATCH_SIZE,
+        start_frame: int = 0,
+        end_frame: Optional[int] = None,
+        frame_stride: int = VIDEO_FRAME_STRIDE,
+        target_fps: Optional[float] = VIDEO_TARGET_FPS,
+        checkpoint: Optional[VideoCheckpoint] = None,
+    ) -> bool:
+        """
+        Process a video with object detection, inferring `batch_size` frames at a time.
+        `start_frame`/`end_frame` restrict processing to a range of the video and
+        `frame_stride`/`target_fps` sample only part of its frames. With
+        `preview` the annotated frames are shown by a renderer thread, which
+        never slows the processing down. With a `checkpoint` the run resumes
+        from the last saved checkpoint of the video and saves new ones
+        periodically (the caller clears them). With an output writer, rows
+        are written while the video is processed; with a checkpoint, only
+        right after a save, so a resume never restores rows already written.
+
+        Returns:
+            bool: True if the video was processed to the end, False if the
+            preview was closed first
+        """
         if preview:
             print(f"Video opened. Press '{exit_key}' to exit.")
         else:
@@ -234,32 +914,165 @@ class MediaIO:
 
         self._reset_counters()
         source_id = extract_filename_from_path(video_path)
+        source_size = self._source_size(cap)
+        if checkpoint is not None:
+            resumed = checkpoint.load()
+            if resumed is not None:
+                state, rows = resumed
+                self._detections.extend_dataframe(rows)
+                self._restore_stream_state(state)
+                start_frame = max(start_frame, state["next_frame"])
+                print(
+                    f"Resuming {source_id} from frame {start_frame} "
+                    f"({len(rows)} detections restored)"
+                )
+        flushed_rows = len(self._detections)
 
-        while True:
-            ret, frame = cap.read()
-            if not ret:
+        frame_stride = self.resolve_frame_stride(cap, frame_stride, target_fps)
+        video_frames = self.iter_video_frames(cap, start_frame, end_frame, frame_stride)
+        renderer = (
+            PreviewRenderer(
+                window_title, self.yolo_model.class_name_table, exit_key=exit_key
+            )
+            if preview
+            else None
+        )
+        if renderer is not None:
+            renderer.start()
+
+        completed = False
+        while renderer is None or not renderer.stop_requested:
+            batch = list(islice(video_frames, max(1, batch_size)))
+            if not batch:
                 print("End of video.")
+                completed = True
                 break
 
-            self._process_detection(frame, "video", source_id, preview=preview)
+            frames = [frame for _, frame in batch]
+            for ((frame_number, timestamp_sec), frame), detections in zip(
+                batch, self._infer_frames(frames)
+            ):
+                self._frame_counter = frame_number
+                self._record_detections(
+                    frame,
+                    detections,
+                    "video",
+                    source_id,
+                    preview=preview,
+                    timestamp_sec=timestamp_sec,
+                    source_size=source_size,
+                )
 
-            if preview:
-                cv2.imshow(window_title, frame)
-                if cv2.waitKey(30) & 0xFF == ord(exit_key):
-                    break
-            else:
-                if self._frame_counter % 30 == 0:
+                if renderer is not None:
+                    renderer.submit(frame, detections)
+                elif self._frame_counter % 30 == 0:
                     print(f"Processed {self._frame_counter} frames...")
 
-            self._frame_counter += 1
+            flush_due = self._flush_due()
+            if checkpoint is not None and (flush_due or checkpoint.due()):
+                checkpoint.save(
+                    self._get_stream_state(next_frame=batch[-1][0][0] + 1),
+                    self._detections.to_dataframe(flushed_rows),
+                )
+                flushed_rows = len(self._detections)
+            if flush_due:
+                self.flush_detections()
+                if checkpoint is not None:
+                    checkpoint.mark_flushed()
+                flushed_rows = 0
 
         cap.release()
+        if renderer is not None:
+            renderer.close()
+        self._print_motion_gate_stats()
+        return completed
+
+    def preview_video_pipelined(
+        self,
+        cap: cv2.VideoCapture,
+        video_path: str,
+        preview: bool = True,
+        window_title: str = "Video Preview",
+        exit_key: str = "q",
+        batch_size: int = INFERENCE_BATCH_SIZE,
+        queue_size: int = PIPELINE_QUEUE_SIZE,
+        frame_stride: int = VIDEO_FRAME_STRIDE,
+        target_fps: Optional[float] = VIDEO_TARGET_FPS,
+    ) -> bool:
+        """
+        Preview video with object detection using a threaded pipeline.
+        Frames are decoded and inferred on background threads while this
+        thread extracts features and hands frames to the preview renderer.
+        Returns True if the video was processed to the end.
+        """
         if preview:
-            cv2.destroyAllWindows()
+            print(f"Video opened (pipelined). Press '{exit_key}' to exit.")
+        else:
+            print("Video processing started (pipelined)...")
+
+        self._reset_counters()
+        source_id = extract_filename_from_path(video_path)
+        source_size = self._source_size(cap)
+        pipeline = FramePipeline(
+            self._infer_frames, batch_size=batch_size, queue_size=queue_size
+        )
+        frame_stride = self.resolve_frame_stride(cap, frame_stride, target_fps)
+        video_frames = self.iter_video_frames(cap, frame_stride=frame_stride)
+        renderer = (
+            PreviewRenderer(
+                window_title, self.yolo_model.class_name_table, exit_key=exit_key
+            )
+            if preview
+            else None
+        )
+        completed = False
+
+        try:
+            if renderer is not None:
+                renderer.start()
+            with closing(pipeline.run(video_frames)) as results:
+                for (frame_number, timestamp_sec), frame, detections in results:
+                    self._frame_counter = frame_number
+                    self._record_detections(
+                        frame,
+                        detections,
+                        "video",
+                        source_id,
+                        preview=preview,
+                        timestamp_sec=timestamp_sec,
+                        source_size=source_size,
+                    )
+
+                    self.flush_detections(force=False)
+
+                    if renderer is not None:
+                        renderer.submit(frame, detections)
+                        if renderer.stop_requested:
+                            break
+                    elif frame_number % 30 == 0:
+                        print(
+                            f"Processed {frame_number} frames... "
+                            f"(queues: {pipeline.format_queue_depths()})"
+                        )
+                else:
+                    print("End of video.")
+                    completed = True
+        finally:
+            cap.release()
+            if renderer is not None:
+                renderer.close()
+
+        for stats in pipeline.queue_stats():
+            print(
+                f"Queue '{stats['name']}': max depth {stats['max_depth']}/{stats['capacity']}, "
+                f"avg depth {stats['avg_depth']:.1f}"
+            )
+        self._print_motion_gate_stats()
+        return completed
 
     # ==================== PUBLIC ENTRY POINTS ====================
 
-    def run_camera_process(self, preview: bool = True) -> None:
+    def run_camera_process(self, preview: bool = PREVIEW_ENABLED) -> None:
         """Entry point for live camera processing with optional preview."""
         cap = None
         try:
@@ -268,7 +1081,7 @@ class MediaIO:
         except RuntimeError as e:
             print(f"Camera error: {e}")
             print("\nRunning camera diagnosis...")
-            working_cameras = self.diagnose_cameras()
+            working_cameras = self.diagnose_cameras(use_cache=False)
 
             if working_cameras:
                 print(f"\nTrying to use camera {working_cameras[0]}...")
@@ -290,36 +1103,270 @@ class MediaIO:
             if cap is not None:
                 self.release_camera(cap)
 
-    def run_image_process(self, preview: bool = True) -> None:
-        """Entry point for image preview with detection."""
+    def run_image_process(
+        self,
+        preview: bool = PREVIEW_ENABLED,
+        batch_size: int = INFERENCE_BATCH_SIZE,
+        workers: Optional[int] = IMAGE_DECODE_WORKERS,
+        reduction: int = IMAGE_READ_REDUCTION,
+    ) -> None:
+        """
+        Entry point for image detection over the input folder.
+        Images are decoded on `workers` threads and inferred `batch_size` at a
+        time. A file that cannot be read or processed is reported and skipped
+        without stopping the rest of the folder.
+        """
         try:
-            for image_path in Path(IMG_INPUT_PATH).iterdir():
-                if not image_path.is_file():
-                    continue
-                image = self.read_image_from_file(str(image_path))
-                source_id = extract_filename_from_path(str(image_path))
+            image_paths = sorted(
+                path for path in Path(IMG_INPUT_PATH).iterdir() if path.is_file()
+            )
+        except OSError as e:
+            print(f"Image error: {e}")
+            return
+
+        # Rows of every image, cached or new, merged in path order at the end
+        rows_by_path = {}
+        cache_params = self._result_cache_params(mode="image", reduction=reduction)
+        pending_paths = []
+        for image_path in image_paths:
+            rows = self._load_cached_rows(image_path, cache_params)
+            if rows is None:
+                pending_paths.append(image_path)
+            else:
+                rows_by_path[image_path] = rows
+        first_new_row = len(self._detections)
+
+        batch_size = max(1, batch_size)
+        decoded = self._iter_decoded_images(
+            pending_paths, workers, reduction, batch_size
+        )
+        processed = 0
+        failed = 0
+        while True:
+            chunk = list(islice(decoded, batch_size))
+            if not chunk:
+                break
+
+            batch = []
+            for image_path, image, error in chunk:
+                if error is not None:
+                    failed += 1
+                    print(f"Image error ({image_path.name}): {error}")
+                else:
+                    batch.append((image_path, image))
+            if not batch:
+                continue
+
+            # Unrelated images: no motion gate or tracker, every image is inferred
+            try:
+                batch_detections = self._run_model([image for _, image in batch])
+            except Exception as e:
+                print(f"Batch inference failed ({e}), retrying image by image...")
+                batch_detections = None
 
-                self._reset_counters()
-                self._process_detection(image, "image", source_id, preview=preview)
+            for index, (image_path, image) in enumerate(batch):
+                try:
+                    detections = (
+                        batch_detections[index]
+                        if batch_detections is not None
+                        else self._run_model([image])[0]
+                    )
+                    source_id = extract_filename_from_path(str(image_path))
+
+                    # Reduced decodes report boxes at the original image size
+                    source_size = (
+                        self._image_source_size(str(image_path))
+                        if reduction > 1
+                        else None
+                    )
+
+                    self._reset_counters()
+                    image_first_row = len(self._detections)
+                    self._record_detections(
+                        image,
+                        detections,
+                        "image",
+                        source_id,
+                        preview=preview,
+                        source_size=source_size,
+                    )
+                    rows_by_path[image_path] = self._detections.to_dataframe(
+                        image_first_row
+                    )
+                    self._store_cached_rows(
+                        image_path, cache_params, rows_by_path[image_path]
+                    )
+
+                    if preview:
+                        draw_multiple_detections(
+                            image, detections, self.yolo_model.class_name_table
+                        )
+                        self.preview_image(image)
+                    processed += 1
+                except Exception as e:
+                    failed += 1
+                    print(f"Image error ({image_path.name}): {e}")
+
+        # Put the new rows back in path order, between the cached ones
+        self._detections.truncate(first_new_row)
+        for image_path in image_paths:
+            if image_path in rows_by_path:
+                self._detections.extend_dataframe(rows_by_path[image_path])
+        self.flush_detections(force=False)
+        print(
+            f"Images processed: {processed}, failed: {failed}, "
+            f"cached: {len(image_paths) - len(pending_paths)}"
+        )
+        self._finish_result_cache()
 
-                if preview:
-                    self.preview_image(image)
+    def run_multi_source_process(
+        self,
+        sources: list = MULTI_SOURCES,
+        preview: bool = PREVIEW_ENABLED,
+        batch_size: int = INFERENCE_BATCH_SIZE,
+    ) -> None:
+        """
+        Entry point for several cameras (int indices) and/or video files (paths)
+        at once. Every source gets its own session state and all of them share
+        this process' model through a round-robin batched scheduler.
+        """
+        sessions = []
+        try:
+            for source in sources:
+                session_media_io = MediaIO(
+                    self._motion_gating,
+                    self._tracking,
+                    self._keyframe_interval,
+                    output_writer=self._output_writer,
+                    run_id=self.run_id,
+                )
+                sessions.append(SourceSession(source, session_media_io))
+
+            scheduler = MultiSourceScheduler(sessions, batch_size)
+            scheduler.run(preview=preview)
+            self._detections.extend_dataframe(scheduler.get_detections())
         except Exception as e:
-            print(f"Image error: {e}")
+            print(f"Multi-source error: {e}")
+        finally:
+            for session in sessions:
+                session.close()
 
-    def run_video_process(self, preview: bool = True) -> None:
-        """Entry point for video processing with optional preview."""
+    def run_video_process(
+        self,
+        preview: bool = PREVIEW_ENABLED,
+        pipelined: bool = VIDEO_PIPELINE_ENABLED,
+        workers: int = VIDEO_WORKERS,
+        split_ranges: bool = VIDEO_SPLIT_RANGES,
+        checkpoints: bool = CHECKPOINT_ENABLED,
+    ) -> None:
+        """
+        Entry point for video processing with optional preview.
+        With workers > 1 the videos are spread over a process pool and
+        processed headless. With split_ranges each video is instead cut into
+        frame ranges that the workers process in parallel, one video at a time.
+        With `checkpoints`, sequential (non-pipelined) runs save their progress
+        periodically and a video interrupted by a crash resumes where it stopped.
+        """
         cap = None
         try:
-            for video_path in Path(VIDEO_INPUT_PATH).iterdir():
-                if not video_path.is_file():
+            video_paths = sorted(
+                path for path in Path(VIDEO_INPUT_PATH).iterdir() if path.is_file()
+            )
+
+            if workers > 1 and split_ranges and self._tracking:
+                # Ranges would start their own tracks and keyframe schedule
+                print("Tracking is on: videos are processed whole, not in ranges")
+                split_ranges = False
+            split_ranges = workers > 1 and split_ranges
+            cache_params = self._video_cache_params(split_ranges)
+
+            if workers > 1 and not split_ranges:
+                # Rows of every video, cached or new, merged in path order
+                rows_by_path = {}
+                for video_path in video_paths:
+                    rows = self._load_cached_rows(video_path, cache_params)
+                    if rows is not None:
+                        rows_by_path[video_path] = rows
+                pending_paths = [
+                    path for path in video_paths if path not in rows_by_path
+                ]
+                if pending_paths:
+                    detections = process_videos_in_parallel(
+                        [str(path) for path in pending_paths],
+                        workers,
+                        torch_threads=TORCH_THREADS_PER_WORKER,
+                        media_io_settings=self._worker_settings(),
+                    )
+                    for video_path in pending_paths:
+                        rows_by_path[video_path] = detections[
+                            detections["source_id"]
+                            == extract_filename_from_path(str(video_path))
+                        ]
+                        self._store_cached_rows(
+                            video_path, cache_params, rows_by_path[video_path]
+                        )
+                for video_path in video_paths:
+                    self._detections.extend_dataframe(rows_by_path[video_path])
+                    self.flush_detections(force=False)
+                return
+
+            # Frames held at once: queues + batch + preview (ffmpeg ring buffers)
+            ring_size = INFERENCE_BATCH_SIZE + 4
+            if pipelined:
+                ring_size += 2 * PIPELINE_QUEUE_SIZE
+            for video_path in video_paths:
+                # Rows of finished videos only, the cache and checkpoints
+                # address the rows of the current one by position
+                self.flush_detections(force=False)
+                rows = self._load_cached_rows(video_path, cache_params)
+                if rows is not None:
+                    self._detections.extend_dataframe(rows)
                     continue
-                cap = self.read_video_from_file(str(video_path))
-                self.preview_video(cap, str(video_path), preview=preview)
+
+                first_row = len(self._detections)
+                flushes = self._flushes
+                if split_ranges:
+                    detections = process_video_in_ranges(
+                        str(video_path),
+                        workers,
+                        torch_threads=TORCH_THREADS_PER_WORKER,
+                        media_io_settings=self._worker_settings(),
+                    )
+                    self._detections.extend_dataframe(detections)
+                    completed = True
+                else:
+                    cap = self.read_video_from_file(
+                        str(video_path), ring_size=ring_size
+                    )
+                    if pipelined:
+                        completed = self.preview_video_pipelined(
+                            cap, str(video_path), preview=preview
+                        )
+                    else:
+                        checkpoint = (
+                            VideoCheckpoint(str(video_path), cache_params)
+                            if checkpoints
+                            else None
+                        )
+                        completed = self.preview_video(
+                            cap, str(video_path), preview=preview, checkpoint=checkpoint
+                        )
+                        # A run stopped from the preview resumes next time
+                        if checkpoint is not None and completed:
+                            checkpoint.clear()
+                if not completed:
+                    # Partial results are kept but never cached
+                    break
+                if self._flushes == flushes:
+                    # Rows already streamed out mid-video cannot be cached
+                    self._store_cached_rows(
+                        video_path,
+                        cache_params,
+                        self._detections.to_dataframe(first_row),
+                    )
         except Exception as e:
             print(f"Video error: {e}")
         finally:
             if cap is not None:
                 cap.release()
-                if preview:
-                    cv2.destroyAllWindows()
+            self._finish_result_cache()
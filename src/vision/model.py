@@ -1,44 +1,106 @@
-import math
+import threading
+import time
+
+import numpy as np
 
-from ultralytics import YOLO
 from .config import YOLO_MODEL_PATH
 from .config import ALLOWED_CLASSES
+from .config import INFERENCE_BACKEND, INFERENCE_IMGSZ, MODEL_WARMUP, QUANTIZATION
+from .detections import class_name_table, empty_detections, make_detections
+from .model_export import resolve_model_path
+
+# Models shared by every MediaIO of the process, keyed by their configuration
+_model_registry: dict[tuple, "YoloModel"] = {}
+_model_registry_lock = threading.Lock()
 
 
 class YoloModel:
-    def __init__(self) -> None:
-        self.model = YOLO(YOLO_MODEL_PATH)
+    def __init__(
+        self,
+        backend: str = INFERENCE_BACKEND,
+        imgsz: int = INFERENCE_IMGSZ,
+        quantization: str | None = QUANTIZATION,
+    ) -> None:
+        start = time.perf_counter()
+        # Imported here so I/O-only code paths never pay for ultralytics/torch
+        from ultralytics import YOLO
+
+        self.backend = backend
+        self.imgsz = imgsz
+        self.quantization = quantization
+        self.model = YOLO(
+            resolve_model_path(
+                YOLO_MODEL_PATH, backend, imgsz, quantization=quantization
+            ),
+            task="detect",
+        )
         self.class_names = self.model.names
-        self.detections = []
+        self.class_name_table = class_name_table(self.class_names)
+        self._allowed_class_ids = np.array(
+            [
+                class_id
+                for class_id, name in self.class_names.items()
+                if name in ALLOWED_CLASSES
+            ],
+            dtype=int,
+        )
+        self.detections = empty_detections()
+        self.load_seconds = time.perf_counter() - start
+        self.warmup_seconds = None
+        # The ultralytics predictor keeps per-call state, so shared models
+        # serialise their forward passes
+        self._inference_lock = threading.Lock()
+
+    def warmup(self) -> float:
+        """
+        Run a dummy frame through the model so the first real frame does not
+        pay for lazy runtime initialisation (predictor setup, kernels, memory).
 
-    def get_detections(self) -> list:
-        """Get all detections from the last inference."""
+        Returns:
+            float: Warm-up time in seconds
+        """
+        start = time.perf_counter()
+        dummy = np.zeros((self.imgsz, self.imgsz, 3), dtype=np.uint8)
+        with self._inference_lock:
+            for _ in self.model(dummy, stream=True, imgsz=self.imgsz, verbose=False):
+                pass
+        self.warmup_seconds = time.perf_counter() - start
+        return self.warmup_seconds
+
+    def get_detections(self) -> np.ndarray:
+        """Get all detections (structured array) from the last inference."""
         return self.detections
 
-    def get_class_names(self) -> list[str]:
-        """Get list of detected class names."""
-        return [detection[0] for detection in self.detections]
+    def get_class_names(self) -> np.ndarray:
+        """Get the detected class names."""
+        return self.class_name_table[self.detections["class_id"]]
 
-    def get_coordinates(self) -> list[tuple[int, int, int, int]]:
-        """Get list of bounding box coordinates."""
-        return [detection[2] for detection in self.detections]
+    def get_coordinates(self) -> np.ndarray:
+        """Get the bounding boxes (N, 4) as a view of the detections."""
+        return self.detections["bbox"]
 
-    def get_confidences(self) -> list[float]:
-        """Get list of confidence scores."""
-        return [detection[1] for detection in self.detections]
+    def get_confidences(self) -> np.ndarray:
+        """Get the confidence scores as a view of the detections."""
+        return self.detections["confidence"]
 
-    def get_class_ids(self) -> list[int]:
-        """Get list of class IDs."""
-        return [detection[3] for detection in self.detections]
+    def get_class_ids(self) -> np.ndarray:
+        """Get the class IDs as a view of the detections."""
+        return self.detections["class_id"]
 
     def get_class_name(self) -> str | None:
-        return self.detections[0][0] if self.detections else None
+        if len(self.detections) == 0:
+            return None
+        return self.class_name_table[self.detections["class_id"][0]]
 
     def get_coordinates_single(self) -> tuple[int, int, int, int] | None:
-        return self.detections[0][2] if self.detections else None
+        if len(self.detections) == 0:
+            return None
+        return tuple(self.detections["bbox"][0].tolist())
 
     def get_confidence(self) -> float | None:
-        return self.detections[0][1] if self.detections else None
+        if len(self.detections) == 0:
+            return None
+        return float(self.detections["confidence"][0])
 
     def _get_class_id_from_name(self, class_name: str) -> int:
         """
@@ -55,29 +117,110 @@ class YoloModel:
                 return class_id
         return 0
 
-    def run_inference_on_frame(self, frame):
+    def _extract_boxes(self, result) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
-        Runs YOLO inference on a single BGR frame (OpenCV format)
-        and stores all valid detections in self.detections list.
+        Extract the allowed boxes of a single YOLO result as NumPy arrays.
+
+        Args:
+            result: YOLO result for one frame
+
+        Returns:
+            tuple: (xyxy, conf, cls) arrays of shape (N, 4), (N,) and (N,)
+        """
+        if result.boxes is None or len(result.boxes) == 0:
+            return (
+                np.empty((0, 4), dtype=int),
+                np.empty(0, dtype=float),
+                np.empty(0, dtype=int),
+            )
+
+        boxes = result.boxes.cpu().numpy()
+        xyxy = boxes.xyxy.astype(int)
+        # Same rounding as math.ceil(conf * 100) / 100 on the float32 tensor.
+        conf = np.ceil(boxes.conf * 100).astype(float) / 100
+        cls = boxes.cls.astype(int)
+
+        keep = np.isin(cls, self._allowed_class_ids)
+        return xyxy[keep], conf[keep], cls[keep]
+
+    @staticmethod
+    def to_detections(
+        xyxy: np.ndarray, conf: np.ndarray, cls: np.ndarray
+    ) -> np.ndarray:
+        """
+        Convert the box arrays of one frame into detection records.
+
+        Args:
+            xyxy: Bounding boxes (N, 4)
+            conf: Confidence scores (N,)
+            cls: Class IDs (N,)
+
+        Returns:
+            np.ndarray: Untracked detections (structured array, see detections.py)
         """
-        self.detections = []
+        return make_detections(xyxy, conf, cls)
 
-        results = self.model(frame, stream=True)
-        for r in results:
-            if r.boxes is None:
-                continue
+    def run_inference_on_batch(
+        self, frames: list[np.ndarray]
+    ) -> list[tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """
+        Runs YOLO inference on several BGR frames in a single forward pass.
 
-            for box in r.boxes:
-                x_min, y_min, x_max, y_max = map(int, box.xyxy[0])
-                coordinates = (x_min, y_min, x_max, y_max)
-                confidence = math.ceil((box.conf[0] * 100)) / 100
-                cls = int(box.cls[0])
-                class_name = self.class_names.get(cls, str(cls))
+        Args:
+            frames: List of frames (OpenCV format)
+
+        Returns:
+            list: One (xyxy, conf, cls) tuple of NumPy arrays per frame,
+            already filtered by ALLOWED_CLASSES
+        """
+        if not frames:
+            return []
 
-                if class_name not in ALLOWED_CLASSES:
-                    continue
+        with self._inference_lock:
+            results = self.model(frames, stream=True, imgsz=self.imgsz)
+            return [self._extract_boxes(r) for r in results]
 
-                detection = (class_name, confidence, coordinates, cls)
-                self.detections.append(detection)
+    def run_inference_on_frame(self, frame):
+        """
+        Runs YOLO inference on a single BGR frame (OpenCV format)
+        and stores all valid detections in self.detections.
+        """
+        xyxy, conf, cls = self.run_inference_on_batch([frame])[0]
+        self.detections = self.to_detections(xyxy, conf, cls)
 
         return len(self.detections) > 0
+
+
+def get_shared_model(
+    backend: str = INFERENCE_BACKEND,
+    imgsz: int = INFERENCE_IMGSZ,
+    quantization: str | None = QUANTIZATION,
+    warmup: bool = MODEL_WARMUP,
+) -> YoloModel:
+    """
+    Get the process-wide model for a configuration, loading it on first use.
+
+    Args:
+        backend: "pytorch", "onnx" or "openvino"
+        imgsz: Model input size
+        quantization: None, "dynamic" or "static" INT8 (ONNX backend only)
+        warmup: Run a dummy frame through a newly loaded model
+
+    Returns:
+        YoloModel: Model shared by every caller with the same configuration
+    """
+    key = (backend, imgsz, quantization)
+    with _model_registry_lock:
+        model = _model_registry.get(key)
+        if model is None:
+            model = YoloModel(backend, imgsz, quantization)
+            if warmup:
+                model.warmup()
+            _model_registry[key] = model
+    return model
+
+
+def clear_model_registry() -> None:
+    """Drop every shared model (e.g. after changing the weights on disk)."""
+    with _model_registry_lock:
+        _model_registry.clear()
@@ -0,0 +1,268 @@
+"""
+Export of the YOLO weights to faster CPU runtimes.
+Exported (and optionally INT8 quantized) models are cached on disk, keyed by
+the weights hash, the backend, the input size and the quantization mode, so
+the export only runs once per configuration.
+"""
+
+import hashlib
+import shutil
+from pathlib import Path
+from typing import Optional
+
+import cv2
+import numpy as np
+
+from .config import (
+    EXPORTED_MODELS_DIR,
+    INFERENCE_BACKEND,
+    INFERENCE_IMGSZ,
+    QUANTIZATION,
+    QUANTIZATION_CALIBRATION_IMAGES,
+    QUANTIZATION_CALIBRATION_PATH,
+    YOLO_MODEL_PATH,
+)
+
+# Backend name -> (ultralytics export format, suffix of the exported artifact)
+EXPORT_FORMATS = {
+    "onnx": ("onnx", ".onnx"),
+    "openvino": ("openvino", "_openvino_model"),
+}
+SUPPORTED_BACKENDS = ("pytorch", *EXPORT_FORMATS)
+QUANTIZATION_MODES = ("dynamic", "static")
+IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".bmp"}
+
+
+def file_sha256(path: str, chunk_size: int = 1 << 20) -> str:
+    """
+    Compute the SHA-256 of a file.
+
+    Args:
+        path: File path
+        chunk_size: Bytes read per iteration
+
+    Returns:
+        str: Hex digest
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def exported_model_path(
+    weights_path: str = YOLO_MODEL_PATH,
+    backend: str = INFERENCE_BACKEND,
+    imgsz: int = INFERENCE_IMGSZ,
+    cache_dir: str = EXPORTED_MODELS_DIR,
+) -> Path:
+    """
+    Get the cache location of an exported model.
+
+    Args:
+        weights_path: PyTorch weights the export comes from
+        backend: "onnx" or "openvino"
+        imgsz: Model input size
+        cache_dir: Cache directory
+
+    Returns:
+        Path: File (ONNX) or directory (OpenVINO) of the exported model
+    """
+    _, suffix = EXPORT_FORMATS[backend]
+    weights_hash = file_sha256(weights_path)[:16]
+    return Path(cache_dir) / f"{Path(weights_path).stem}_{weights_hash}_{imgsz}{suffix}"
+
+
+def list_calibration_images(
+    image_dir: str = QUANTIZATION_CALIBRATION_PATH,
+    max_images: int = QUANTIZATION_CALIBRATION_IMAGES,
+) -> list[Path]:
+    """Get the (sorted) image files used for static INT8 calibration."""
+    images = sorted(
+        path
+        for path in Path(image_dir).iterdir()
+        if path.is_file() and path.suffix.lower() in IMAGE_EXTENSIONS
+    )
+    return images[:max_images]
+
+
+def _calibration_set_hash(images: list[Path]) -> str:
+    """Short hash of the calibration file names and sizes."""
+    digest = hashlib.sha256()
+    for path in images:
+        digest.update(f"{path.name}:{path.stat().st_size};".encode())
+    return digest.hexdigest()[:8]
+
+
+def letterbox_for_onnx(image: np.ndarray, imgsz: int) -> np.ndarray:
+    """
+    Resize and pad a BGR image the way YOLO expects it as ONNX input.
+
+    Args:
+        image: BGR image
+        imgsz: Square model input size
+
+    Returns:
+        np.ndarray: Float32 tensor (1, 3, imgsz, imgsz) in RGB, scaled to 0-1
+    """
+    height, width = image.shape[:2]
+    scale = min(imgsz / height, imgsz / width)
+    new_width, new_height = round(width * scale), round(height * scale)
+    resized = cv2.resize(image, (new_width, new_height), interpolation=cv2.INTER_LINEAR)
+
+    canvas = np.full((imgsz, imgsz, 3), 114, dtype=np.uint8)
+    top = (imgsz - new_height) // 2
+    left = (imgsz - new_width) // 2
+    canvas[top : top + new_height, left : left + new_width] = resized
+
+    tensor = canvas[:, :, ::-1].transpose(2, 0, 1).astype(np.float32) / 255.0
+    return tensor[None]
+
+
+def quantize_onnx_model(
+    onnx_path: str,
+    output_path: str,
+    mode: str,
+    imgsz: int = INFERENCE_IMGSZ,
+    calibration_images: Optional[list[Path]] = None,
+) -> str:
+    """
+    Quantize an exported YOLO ONNX model to INT8 with ONNX Runtime.
+
+    Args:
+        onnx_path: FP32 ONNX model
+        output_path: Where the INT8 model is written
+        mode: "dynamic" (weights only) or "static" (weights and activations,
+            calibrated on `calibration_images`)
+        imgsz: Model input size
+        calibration_images: Images for static calibration
+
+    Returns:
+        str: Path of the quantized model
+    """
+    import onnx
+    from onnxruntime.quantization import (
+        CalibrationDataReader,
+        QuantFormat,
+        QuantType,
+        quantize_dynamic,
+        quantize_static,
+    )
+
+    if mode == "dynamic":
+        quantize_dynamic(onnx_path, output_path, weight_type=QuantType.QUInt8)
+    else:
+        if not calibration_images:
+            raise ValueError("Static INT8 quantization needs calibration images")
+
+        graph = onnx.load(onnx_path).graph
+        input_name = graph.input[0].name
+        # Box decoding (DFL, anchors, concat of boxes and scores) loses the
+        # detections when it shares one INT8 scale, so only the head convs
+        # are quantized
+        head_prefix = graph.node[-1].name.rsplit("/", 1)[0] + "/"
+        head_nodes = [
+            node.name
+            for node in graph.node
+            if node.name.startswith(head_prefix)
+            and (node.op_type != "Conv" or "/dfl/" in node.name)
+        ]
+
+        class _ImageCalibrationReader(CalibrationDataReader):
+            def __init__(self) -> None:
+                self._paths = iter(calibration_images)
+
+            def get_next(self):
+                for path in self._paths:
+                    image = cv2.imread(str(path), cv2.IMREAD_COLOR)
+                    if image is not None:
+                        return {input_name: letterbox_for_onnx(image, imgsz)}
+                return None
+
+        quantize_static(
+            onnx_path,
+            output_path,
+            _ImageCalibrationReader(),
+            quant_format=QuantFormat.QDQ,
+            activation_type=QuantType.QUInt8,
+            weight_type=QuantType.QInt8,
+            per_channel=True,
+            nodes_to_exclude=head_nodes,
+        )
+
+    # ultralytics reads class names, stride and imgsz from the model metadata
+    source = onnx.load(onnx_path)
+    quantized = onnx.load(output_path)
+    onnx.helper.set_model_props(
+        quantized, {prop.key: prop.value for prop in source.metadata_props}
+    )
+    onnx.save(quantized, output_path)
+    return output_path
+
+
+def resolve_model_path(
+    weights_path: str = YOLO_MODEL_PATH,
+    backend: str = INFERENCE_BACKEND,
+    imgsz: int = INFERENCE_IMGSZ,
+    cache_dir: str = EXPORTED_MODELS_DIR,
+    quantization: Optional[str] = QUANTIZATION,
+) -> str:
+    """
+    Get the model path to load for a backend, exporting it if it is not cached.
+
+    Args:
+        weights_path: PyTorch weights
+        backend: "pytorch", "onnx" or "openvino"
+        imgsz: Model input size
+        cache_dir: Cache directory of exported models
+        quantization: None, "dynamic" or "static" INT8 (ONNX backend only)
+
+    Returns:
+        str: Path that YOLO() can load
+    """
+    if backend not in SUPPORTED_BACKENDS:
+        raise ValueError(
+            f"Unknown inference backend: {backend}. Use one of {SUPPORTED_BACKENDS}"
+        )
+    if quantization is not None:
+        if quantization not in QUANTIZATION_MODES:
+            raise ValueError(
+                f"Unknown quantization mode: {quantization}. Use one of {QUANTIZATION_MODES}"
+            )
+        if backend != "onnx":
+            raise ValueError("INT8 quantization is only available for the onnx backend")
+    if backend == "pytorch":
+        return weights_path
+
+    target = exported_model_path(weights_path, backend, imgsz, cache_dir)
+    if not target.exists():
+        from ultralytics import YOLO
+
+        export_format, _ = EXPORT_FORMATS[backend]
+        print(f"Exporting {weights_path} to {backend} (imgsz={imgsz})...")
+        # dynamic=True keeps the batch axis variable for run_inference_on_batch
+        exported = YOLO(weights_path).export(
+            format=export_format, imgsz=imgsz, dynamic=True
+        )
+
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.move(str(exported), str(target))
+        print(f"Exported model cached at {target}")
+
+    if quantization is None:
+        return str(target)
+
+    calibration_images = None
+    suffix = "int8_dynamic"
+    if quantization == "static":
+        calibration_images = list_calibration_images()
+        suffix = f"int8_static_{_calibration_set_hash(calibration_images)}"
+    quantized_target = target.with_name(f"{target.stem}_{suffix}.onnx")
+    if not quantized_target.exists():
+        print(f"Quantizing {target} to INT8 ({quantization})...")
+        quantize_onnx_model(
+            str(target), str(quantized_target), quantization, imgsz, calibration_images
+        )
+        print(f"Quantized model cached at {quantized_target}")
+    return str(quantized_target)
@@ -0,0 +1,107 @@
+"""
+Motion gate for static scenes.
+Compares a small grayscale version of every frame with the last frame that
+went through YOLO and decides whether the previous detections can be reused.
+"""
+
+import cv2
+import numpy as np
+
+from .config import (
+    MOTION_CHANGED_RATIO,
+    MOTION_DOWNSCALE_WIDTH,
+    MOTION_PIXEL_THRESHOLD,
+    MOTION_REFRESH_INTERVAL,
+)
+
+
+class MotionGate:
+    """Decide per frame whether a new YOLO inference is needed."""
+
+    def __init__(
+        self,
+        changed_ratio: float = MOTION_CHANGED_RATIO,
+        pixel_threshold: int = MOTION_PIXEL_THRESHOLD,
+        refresh_interval: int = MOTION_REFRESH_INTERVAL,
+        downscale_width: int = MOTION_DOWNSCALE_WIDTH,
+    ) -> None:
+        self.changed_ratio = changed_ratio
+        self.pixel_threshold = pixel_threshold
+        self.refresh_interval = max(1, refresh_interval)
+        self.downscale_width = downscale_width
+        self.total_frames = 0
+        self.skipped_frames = 0
+        self._reference = None
+        self._frames_since_refresh = 0
+
+    def reset(self) -> None:
+        """Forget the reference frame and the counters (e.g. for a new source)."""
+        self.total_frames = 0
+        self.skipped_frames = 0
+        self._reference = None
+        self._frames_since_refresh = 0
+
+    def _signature(self, frame: np.ndarray) -> np.ndarray:
+        """Downscaled grayscale version of a frame."""
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY) if frame.ndim == 3 else frame
+        height, width = gray.shape[:2]
+        if width > self.downscale_width:
+            new_height = max(1, round(height * self.downscale_width / width))
+            gray = cv2.resize(
+                gray, (self.downscale_width, new_height), interpolation=cv2.INTER_AREA
+            )
+        return gray
+
+    def change_score(self, signature: np.ndarray) -> float:
+        """
+        Fraction of pixels that changed with respect to the reference frame.
+
+        Args:
+            signature: Downscaled grayscale frame
+
+        Returns:
+            float: Changed pixel ratio (0-1). 1.0 when there is no reference
+        """
+        if self._reference is None or self._reference.shape != signature.shape:
+            return 1.0
+        diff = cv2.absdiff(signature, self._reference)
+        return float(np.count_nonzero(diff > self.pixel_threshold)) / diff.size
+
+    def should_infer(self, frame: np.ndarray) -> bool:
+        """
+        Check whether a frame needs a new inference.
+        Frames that need it become the new reference.
+
+        Args:
+            frame: BGR frame
+
+        Returns:
+            bool: True if the scene changed or the refresh interval elapsed
+        """
+        self.total_frames += 1
+        signature = self._signature(frame)
+
+        if (
+            self._frames_since_refresh + 1 >= self.refresh_interval
+            or self.change_score(signature) >= self.changed_ratio
+        ):
+            self._reference = signature
+            self._frames_since_refresh = 0
+            return True
+
+        self._frames_since_refresh += 1
+        self.skipped_frames += 1
+        return False
+
+    @property
+    def skip_ratio(self) -> float:
+        """Fraction of frames that reused the previous detections."""
+        return self.skipped_frames / self.total_frames if self.total_frames else 0.0
+
+    def stats(self) -> dict:
+        """Get frame, skip and skip ratio counters."""
+        return {
+            "total_frames": self.total_frames,
+            "skipped_frames": self.skipped_frames,
+            "skip_ratio": self.skip_ratio,
+        }
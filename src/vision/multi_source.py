@@ -0,0 +1,315 @@
+"""
+Concurrent processing of several cameras and/or video files.
+Every source has its own session (capture, counters, motion gate, tracker and
+detections) and a reader thread. A single scheduler takes frames from the
+sources in round-robin order, runs them through one shared YOLO model in
+batches and hands the results back to each session.
+"""
+
+import queue
+import threading
+import time
+from typing import Optional, Union
+
+import cv2
+import numpy as np
+import pandas as pd
+
+from .capture import LatestFrameCapture
+from .config import (
+    CAMERA_BUFFER_SIZE,
+    FRAME_HEIGHT,
+    FRAME_WIDTH,
+    INFERENCE_BATCH_SIZE,
+    MULTI_SOURCE_FPS_REPORT_INTERVAL,
+    PIPELINE_QUEUE_SIZE,
+)
+from .model import get_shared_model
+from .parallel import merge_detection_frames
+from .preview import PreviewRenderer
+from .utils import extract_filename_from_path
+
+_END = object()  # Pushed by a video reader when its file is exhausted
+
+
+class SourceSession:
+    """
+    State of one camera or video source.
+
+    Cameras are read with a LatestFrameCapture (stale frames are dropped);
+    video files are decoded on a reader thread into a bounded queue, so no
+    frame is lost and a slow scheduler only applies backpressure.
+    """
+
+    def __init__(
+        self,
+        source: Union[int, str],
+        media_io,
+        queue_size: int = PIPELINE_QUEUE_SIZE,
+    ) -> None:
+        self.source = source
+        self.is_camera = isinstance(source, int)
+        self.source_type = "camera" if self.is_camera else "video"
+        self.source_id = (
+            f"camera_{source}" if self.is_camera else extract_filename_from_path(source)
+        )
+        # Per-source counters, motion gate, tracker and detections
+        self.media_io = media_io
+        self.cap = self._open(source)
+        self.finished = False
+        self.error: Optional[Exception] = None
+        self._closed = False
+        self.processed_frames = 0
+        self._camera_frames = 0
+        self.started_at: Optional[float] = None
+        self._last_report_frames = 0
+        self._last_report_at: Optional[float] = None
+
+        if self.is_camera:
+            self._capture = LatestFrameCapture(self.cap)
+        else:
+            self._frames: queue.Queue = queue.Queue(maxsize=max(1, queue_size))
+            self._stop_event = threading.Event()
+            self._reader = threading.Thread(
+                target=self._read_video,
+                name=f"reader-{self.source_id}",
+                daemon=True,
+            )
+
+    @staticmethod
+    def _open(source: Union[int, str]) -> cv2.VideoCapture:
+        cap = cv2.VideoCapture(source)
+        if not cap.isOpened():
+            raise RuntimeError(f"Could not open source: {source}")
+        if isinstance(source, int):
+            cap.set(cv2.CAP_PROP_FRAME_WIDTH, FRAME_WIDTH)
+            cap.set(cv2.CAP_PROP_FRAME_HEIGHT, FRAME_HEIGHT)
+            cap.set(cv2.CAP_PROP_BUFFERSIZE, CAMERA_BUFFER_SIZE)
+        return cap
+
+    def start(self) -> None:
+        """Reset the session counters and start reading frames."""
+        self.media_io.start_stream()
+        self.started_at = self._last_report_at = time.perf_counter()
+        if self.is_camera:
+            self._capture.start()
+        else:
+            self._reader.start()
+
+    def _read_video(self) -> None:
+        try:
+            for item in self.media_io.iter_video_frames(self.cap):
+                while not self._stop_event.is_set():
+                    try:
+                        self._frames.put(item, timeout=0.1)
+                        break
+                    except queue.Full:
+                        continue
+                if self._stop_event.is_set():
+                    return
+        except Exception as e:
+            # The source ends here, the other sources keep going
+            self.error = e
+            print(f"Source {self.source_id} error: {e}")
+        finally:
+            self._frames.put(_END)
+
+    def poll(self) -> Optional[tuple[tuple[int, Optional[float]], np.ndarray]]:
+        """
+        Get the next frame of the source without blocking.
+
+        Returns:
+            tuple: ((frame_number, timestamp_sec), frame), or None when no
+            frame is ready yet or the source is finished (see `finished`)
+        """
+        if self.finished:
+            return None
+        if self.is_camera:
+            ret, frame, _ = self._capture.read(timeout=0)
+            if ret:
+                self._camera_frames += 1
+                return (self._camera_frames - 1, None), frame
+            if not self._capture.is_running:
+                self.finished = True
+            return None
+
+        try:
+            item = self._frames.get_nowait()
+        except queue.Empty:
+            return None
+        if item is _END:
+            self.finished = True
+            return None
+        return item
+
+    def fps(self, now: Optional[float] = None) -> float:
+        """Average processed frames per second since the session started."""
+        now = time.perf_counter() if now is None else now
+        elapsed = now - self.started_at if self.started_at is not None else 0.0
+        return self.processed_frames / elapsed if elapsed > 0 else 0.0
+
+    def recent_fps(self, now: float) -> float:
+        """Frames per second since the previous call."""
+        elapsed = now - self._last_report_at
+        frames = self.processed_frames - self._last_report_frames
+        self._last_report_frames = self.processed_frames
+        self._last_report_at = now
+        return frames / elapsed if elapsed > 0 else 0.0
+
+    def close(self) -> None:
+        """Stop the reader thread and release the capture (only the first call)."""
+        if self._closed:
+            return
+        self._closed = True
+        if self.is_camera:
+            self._capture.stop()
+        else:
+            self._stop_event.set()
+            if self._reader.is_alive():
+                # Unblock a reader waiting on a full queue
+                while self._reader.is_alive():
+                    try:
+                        self._frames.get(timeout=0.1)
+                    except queue.Empty:
+                        pass
+        self.cap.release()
+
+
+class MultiSourceScheduler:
+    """
+    Shared batched inference over several sources with fair round-robin.
+
+    Every round takes at most one frame per source, starting one source
+    further than the previous round, so a fast source cannot starve the
+    others. Frames of all sources go through the model in the same batch.
+    """
+
+    def __init__(
+        self,
+        sessions: list[SourceSession],
+        batch_size: int = INFERENCE_BATCH_SIZE,
+        report_interval: float = MULTI_SOURCE_FPS_REPORT_INTERVAL,
+    ) -> None:
+        self.sessions = sessions
+        self.batch_size = max(1, batch_size)
+        self.report_interval = report_interval
+        self._next_source = 0
+
+    def _next_batch(self) -> list[tuple[SourceSession, tuple, np.ndarray]]:
+        """Collect up to batch_size ready frames, one per source per round."""
+        batch = []
+        count = len(self.sessions)
+        start = self._next_source
+        self._next_source = (self._next_source + 1) % count
+
+        progress = True
+        while progress and len(batch) < self.batch_size:
+            progress = False
+            for offset in range(count):
+                session = self.sessions[(start + offset) % count]
+                item = session.poll()
+                if item is None:
+                    continue
+                metadata, frame = item
+                batch.append((session, metadata, frame))
+                progress = True
+                if len(batch) == self.batch_size:
+                    break
+        return batch
+
+    def run(self, preview: bool = False) -> None:
+        """
+        Process all sources until every one is finished or the exit key is
+        pressed in one of the preview windows.
+
+        Args:
+            preview: Show every source in its own preview window
+        """
+        model = get_shared_model()
+        renderers = {}
+        if preview:
+            for session in self.sessions:
+                renderers[session] = PreviewRenderer(
+                    session.source_id, model.class_name_table
+                )
+                renderers[session].start()
+
+        for session in self.sessions:
+            session.start()
+        last_report = time.perf_counter()
+
+        try:
+            while not all(session.finished for session in self.sessions):
+                if any(renderer.stop_requested for renderer in renderers.values()):
+                    break
+
+                batch = self._next_batch()
+                if not batch:
+                    time.sleep(0.002)
+                    continue
+
+                needs_inference = [
+                    session.media_io.needs_inference(frame)
+                    for session, _, frame in batch
+                ]
+                inferred = iter(
+                    [
+                        model.to_detections(xyxy, conf, cls)
+                        for xyxy, conf, cls in model.run_inference_on_batch(
+                            [
+                                frame
+                                for (_, _, frame), needed in zip(batch, needs_inference)
+                                if needed
+                            ]
+                        )
+                    ]
+                )
+
+                for (session, (frame_number, timestamp_sec), frame), needed in zip(
+                    batch, needs_inference
+                ):
+                    detections = session.media_io.record_frame(
+                        frame,
+                        frame_number,
+                        next(inferred) if needed else None,
+                        session.source_type,
+                        session.source_id,
+                        timestamp_sec,
+                    )
+                    session.processed_frames += 1
+                    if session in renderers:
+                        renderers[session].submit(frame, detections)
+
+                now = time.perf_counter()
+                if now - last_report >= self.report_interval:
+                    self.print_fps(now)
+                    last_report = now
+        finally:
+            for renderer in renderers.values():
+                renderer.close()
+            for session in self.sessions:
+                session.close()
+                session.media_io.flush_detections()
+
+        print("Multi-source processing finished.")
+        for session in self.sessions:
+            print(
+                f"  {session.source_id}: {session.processed_frames} frames, "
+                f"{session.fps():.1f} fps"
+            )
+
+    def print_fps(self, now: float) -> None:
+        """Print the recent frame rate of every source."""
+        print(
+            "FPS | "
+            + " | ".join(
+                f"{session.source_id}: {session.recent_fps(now):.1f}"
+                for session in self.sessions
+            )
+        )
+
+    def get_detections(self) -> pd.DataFrame:
+        """Detections of all sources, in source order."""
+        return merge_detection_frames(
+            [session.media_io.get_df_detections() for session in self.sessions]
+        )
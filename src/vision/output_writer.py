@@ -0,0 +1,112 @@
+"""
+Streaming detection output.
+Instead of holding every detection of a session until the end, MediaIO hands
+its rows over to a ChunkedDetectionWriter, which writes them to rolling files
+in OUTPUT_DATA_PATH whenever OUTPUT_CHUNK_ROWS rows are pending or
+OUTPUT_CHUNK_SECONDS have passed. Each chunk is written to a temporary file
+and renamed into place, so the ETL (which only reads *.csv and *.parquet)
+never sees a half-written file.
+"""
+
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+
+from .config import (
+    OUTPUT_CHUNK_ROWS,
+    OUTPUT_CHUNK_SECONDS,
+    OUTPUT_DATA_PATH,
+    OUTPUT_FORMAT,
+)
+from .parquet_output import write_detections_parquet
+
+
+class ChunkedDetectionWriter:
+    """
+    Write detection rows to numbered chunk files of one session.
+
+    Files are named `<prefix>_<session start>_<chunk>.<format>`. The writer keeps
+    no rows itself: callers check `due()` with the number of rows they hold
+    and pass them to `write()`.
+    """
+
+    def __init__(
+        self,
+        output_dir: str = OUTPUT_DATA_PATH,
+        prefix: str = "detections",
+        max_rows: int = OUTPUT_CHUNK_ROWS,
+        max_seconds: float = OUTPUT_CHUNK_SECONDS,
+        output_format: str = OUTPUT_FORMAT,
+    ) -> None:
+        if output_format not in ("csv", "parquet"):
+            raise ValueError(f"Unknown output format: {output_format}")
+        self.output_dir = Path(output_dir)
+        self.prefix = prefix
+        self.max_rows = max(1, max_rows)
+        self.max_seconds = max_seconds
+        self.output_format = output_format
+        self._session = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self._last_written = time.monotonic()
+        self.files_written = 0
+        self.rows_written = 0
+
+    def due(self, pending_rows: int) -> bool:
+        """
+        Check whether pending rows should be written now.
+
+        Args:
+            pending_rows: Rows held by the caller since the last write
+
+        Returns:
+            bool: True if there are max_rows rows, or any rows and max_seconds
+            passed since the last write (max_seconds <= 0 disables the timer)
+        """
+        if pending_rows >= self.max_rows:
+            return True
+        return (
+            pending_rows > 0
+            and self.max_seconds > 0
+            and time.monotonic() - self._last_written >= self.max_seconds
+        )
+
+    def write(self, rows: pd.DataFrame) -> Optional[Path]:
+        """
+        Write rows to the next chunk file.
+
+        Args:
+            rows: Detection rows (DetectionAccumulator.to_dataframe layout)
+
+        Returns:
+            Path: Finalized chunk file, or None if there were no rows
+        """
+        self._last_written = time.monotonic()
+        if rows.empty:
+            return None
+
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        path = (
+            self.output_dir
+            / f"{self.prefix}_{self._session}_{self.files_written + 1:04d}"
+            f".{self.output_format}"
+        )
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            if self.output_format == "parquet":
+                write_detections_parquet(rows, f)
+            else:
+                rows.to_csv(f, index=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+        self.files_written += 1
+        self.rows_written += len(rows)
+        return path
+
+    def stats(self) -> dict:
+        """Get the files and rows written so far."""
+        return {"files": self.files_written, "rows": self.rows_written}
@@ -0,0 +1,214 @@
+"""
+Multi-process video processing.
+Every worker process loads its own YOLO model once and processes whole video
+files, or frame ranges of a single video, headless and sends its detection
+rows back to the parent process.
+"""
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+import cv2
+import pandas as pd
+
+from .model_export import resolve_model_path
+from .utils import create_detection_dataframe_schema
+
+# MediaIO owned by the current worker process (set by _init_worker)
+_worker_media_io = None
+
+
+def resolve_torch_threads(workers: int, torch_threads: Optional[int] = None) -> int:
+    """
+    Get the number of torch threads each worker should use.
+
+    Args:
+        workers: Number of worker processes
+        torch_threads: Explicit thread count. If None, CPU cores are split evenly
+
+    Returns:
+        int: Threads per worker (at least 1)
+    """
+    if torch_threads is not None:
+        return max(1, torch_threads)
+    return max(1, (os.cpu_count() or 1) // max(1, workers))
+
+
+def _init_worker(torch_threads: int, media_io_settings: Optional[dict] = None) -> None:
+    """
+    Pin the worker thread pools, build the worker's MediaIO with the parent's
+    settings (motion gating, tracking, ...) and load and warm up its model once.
+    """
+    global _worker_media_io
+
+    import torch
+
+    from .media_io import MediaIO
+
+    torch.set_num_threads(torch_threads)
+    cv2.setNumThreads(1)
+    # The parent caches the merged rows, workers never use the result cache
+    _worker_media_io = MediaIO(**(media_io_settings or {}), result_cache=False)
+    _worker_media_io.warmup()
+
+
+def _process_video_file(video_path: str) -> pd.DataFrame:
+    """Run detection over a single video inside a worker process."""
+    media_io = _worker_media_io
+    media_io.clear_detections()
+
+    cap = media_io.read_video_from_file(video_path)
+    media_io.preview_video(cap, video_path, preview=False)
+    return media_io.get_df_detections()
+
+
+def _process_video_range(
+    video_path: str, start_frame: int, end_frame: Optional[int]
+) -> pd.DataFrame:
+    """Run detection over frames [start_frame, end_frame) of a video."""
+    media_io = _worker_media_io
+    media_io.clear_detections()
+
+    cap = media_io.read_video_from_file(video_path)
+    media_io.preview_video(
+        cap, video_path, preview=False, start_frame=start_frame, end_frame=end_frame
+    )
+    return media_io.get_df_detections()
+
+
+def split_frame_ranges(frame_count: int, parts: int) -> list[tuple[int, Optional[int]]]:
+    """
+    Split a video into contiguous frame ranges of similar size.
+
+    Args:
+        frame_count: Total number of frames of the video
+        parts: Number of ranges wanted
+
+    Returns:
+        list: (start_frame, end_frame) pairs. The last range is open-ended
+        (end_frame None) because container frame counts can be approximate
+    """
+    parts = max(1, min(parts, frame_count))
+    bounds = [round(i * frame_count / parts) for i in range(parts + 1)]
+    ranges = [(bounds[i], bounds[i + 1]) for i in range(parts)]
+    ranges[-1] = (ranges[-1][0], None)
+    return ranges
+
+
+def merge_detection_frames(frames: list[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Concatenate per-file detection dataframes in the given order.
+
+    Args:
+        frames: Detection dataframes, one per processed file
+
+    Returns:
+        pd.DataFrame: Combined dataframe with the standard detection schema
+    """
+    frames = [frame for frame in frames if not frame.empty]
+    if not frames:
+        return pd.DataFrame(columns=create_detection_dataframe_schema())
+    return pd.concat(frames, ignore_index=True)
+
+
+def process_videos_in_parallel(
+    video_paths: list[str],
+    workers: int,
+    torch_threads: Optional[int] = None,
+    media_io_settings: Optional[dict] = None,
+) -> pd.DataFrame:
+    """
+    Process several video files in a pool of worker processes.
+
+    Args:
+        video_paths: Paths of the videos to process
+        workers: Number of worker processes
+        torch_threads: Torch threads per worker (None = split CPU cores evenly)
+        media_io_settings: MediaIO keyword arguments of the workers (None =
+            config defaults)
+
+    Returns:
+        pd.DataFrame: Detections of all videos, ordered by video path
+    """
+    video_paths = sorted(video_paths)
+    if not video_paths:
+        return merge_detection_frames([])
+
+    workers = max(1, min(workers, len(video_paths)))
+    torch_threads = resolve_torch_threads(workers, torch_threads)
+    # Export once here so the workers do not race to fill the model cache
+    resolve_model_path()
+    print(
+        f"Processing {len(video_paths)} video(s) with {workers} worker(s), "
+        f"{torch_threads} torch thread(s) each..."
+    )
+
+    # "spawn" avoids forking a parent that already initialised torch/OpenMP
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(torch_threads, media_io_settings),
+    ) as executor:
+        # map() yields in submission order, so the merge is deterministic
+        frames = list(executor.map(_process_video_file, video_paths))
+
+    return merge_detection_frames(frames)
+
+
+def process_video_in_ranges(
+    video_path: str,
+    workers: int,
+    torch_threads: Optional[int] = None,
+    media_io_settings: Optional[dict] = None,
+) -> pd.DataFrame:
+    """
+    Split one video into frame ranges and process them in parallel.
+    Frame numbers and timestamps come from the container, so the stitched
+    result is the same as processing the video sequentially.
+
+    Args:
+        video_path: Path of the video
+        workers: Number of worker processes (and frame ranges)
+        torch_threads: Torch threads per worker (None = split CPU cores evenly)
+        media_io_settings: MediaIO keyword arguments of the workers (None =
+            config defaults)
+
+    Returns:
+        pd.DataFrame: Detections of the whole video, in frame order
+    """
+    cap = cv2.VideoCapture(video_path)
+    if not cap.isOpened():
+        raise FileNotFoundError(f"Could not open video: {video_path}")
+    frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+    cap.release()
+
+    ranges = (
+        split_frame_ranges(frame_count, workers) if frame_count > 0 else [(0, None)]
+    )
+    workers = len(ranges)
+    torch_threads = resolve_torch_threads(workers, torch_threads)
+    resolve_model_path()
+    print(
+        f"Processing {video_path} ({frame_count} frames) in {workers} range(s), "
+        f"{torch_threads} torch thread(s) each..."
+    )
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(torch_threads, media_io_settings),
+    ) as executor:
+        frames = list(
+            executor.map(
+                _process_video_range,
+                [video_path] * workers,
+                [start for start, _ in ranges],
+                [end for _, end in ranges],
+            )
+        )
+
+    return merge_detection_frames(frames)
@@ -0,0 +1,69 @@
+"""
+Parquet output of detection rows.
+Files follow the types of the yolo_objects Hive table (hive_schema.sql):
+INT columns as int32, DOUBLE as float64, repeated strings dictionary-encoded
+and ingestion_date as a timestamp, so the ETL reads them without type
+inference and they match the table's STORED AS PARQUET format. Rows are
+sorted by source and frame, which keeps runs of equal values together and
+compresses better. pyarrow is only imported when Parquet is written.
+"""
+
+import numpy as np
+import pandas as pd
+
+from .accumulator import detection_column_dtypes
+
+# Unique per frame: dictionary encoding would not pay off
+_PLAIN_STRING_COLUMNS = {"detection_id"}
+_SORT_COLUMNS = ["source_type", "source_id", "frame_number"]
+
+
+def detection_arrow_schema():
+    """
+    Get the Arrow schema of the detection columns.
+
+    Returns:
+        pyarrow.Schema: One field per detection schema column
+    """
+    import pyarrow as pa
+
+    fields = []
+    for name, dtype in detection_column_dtypes().items():
+        if name == "ingestion_date":
+            arrow_type = pa.timestamp("ms")
+        elif dtype is np.int64:
+            arrow_type = pa.int32()
+        elif dtype is np.float64:
+            arrow_type = pa.float64()
+        elif name in _PLAIN_STRING_COLUMNS:
+            arrow_type = pa.string()
+        else:
+            arrow_type = pa.dictionary(pa.int32(), pa.string())
+        fields.append(pa.field(name, arrow_type))
+    return pa.schema(fields)
+
+
+def write_detections_parquet(rows: pd.DataFrame, file) -> None:
+    """
+    Write detection rows to a Parquet file.
+
+    Args:
+        rows: Detection rows (DetectionAccumulator.to_dataframe layout)
+        file: Path or binary file object to write to
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = detection_arrow_schema()
+    rows = rows.sort_values(_SORT_COLUMNS, kind="stable")
+    columns = {}
+    for field in schema:
+        column = rows[field.name]
+        if field.name == "ingestion_date":
+            column = pd.to_datetime(column)
+        elif pa.types.is_dictionary(field.type):
+            column = column.astype("string").astype("category")
+        columns[field.name] = pa.array(column, type=field.type, from_pandas=True)
+    table = pa.Table.from_pydict(columns, schema=schema)
+    # INT96 timestamps: the encoding every Hive version reads
+    pq.write_table(table, file, use_deprecated_int96_timestamps=True)
@@ -0,0 +1,184 @@
+"""
+Threaded decode -> inference -> postprocess pipeline for video sources.
+Decoding and YOLO inference both release the GIL, so running them on their
+own threads lets them overlap with each other and with the postprocess stage.
+"""
+
+import queue
+import threading
+from typing import Callable, Iterable, Iterator
+
+import numpy as np
+
+_END = object()  # Sentinel pushed downstream when a stage finishes
+_POLL_INTERVAL_SEC = 0.1
+
+
+class MonitoredQueue(queue.Queue):
+    """Bounded FIFO queue that keeps track of its depth for reporting."""
+
+    def __init__(self, name: str, maxsize: int) -> None:
+        super().__init__(maxsize=max(1, maxsize))
+        self.name = name
+        self.max_depth = 0
+        self._depth_total = 0
+        self._depth_samples = 0
+
+    def _put(self, item) -> None:
+        # Called by queue.Queue with its mutex held
+        super()._put(item)
+        depth = len(self.queue)
+        self.max_depth = max(self.max_depth, depth)
+        self._depth_total += depth
+        self._depth_samples += 1
+
+    def stats(self) -> dict:
+        """Get current, maximum and average depth of the queue."""
+        with self.mutex:
+            avg_depth = (
+                self._depth_total / self._depth_samples if self._depth_samples else 0.0
+            )
+            return {
+                "name": self.name,
+                "capacity": self.maxsize,
+                "depth": len(self.queue),
+                "max_depth": self.max_depth,
+                "avg_depth": avg_depth,
+            }
+
+
+class FramePipeline:
+    """
+    Three-stage frame pipeline:
+
+    1. decoder thread: pulls (metadata, frame) items from an iterable
+    2. inference thread: groups frames in batches and runs `infer_batch`
+    3. postprocess/sink: the caller iterating over `run()`
+
+    Every stage is connected by a bounded queue, so a slow stage blocks the
+    previous one (backpressure) instead of buffering the whole video.
+    """
+
+    def __init__(
+        self,
+        infer_batch: Callable[[list[np.ndarray]], list],
+        batch_size: int = 1,
+        queue_size: int = 32,
+    ) -> None:
+        self._infer_batch = infer_batch
+        self._batch_size = max(1, batch_size)
+        self.frame_queue = MonitoredQueue("frames", queue_size)
+        self.result_queue = MonitoredQueue("results", queue_size)
+        self._stop_event = threading.Event()
+        self._errors: list[Exception] = []
+
+    def queue_stats(self) -> list[dict]:
+        """Get depth statistics of every queue in the pipeline."""
+        return [self.frame_queue.stats(), self.result_queue.stats()]
+
+    def format_queue_depths(self) -> str:
+        """Get a short human readable summary of the queue depths."""
+        return ", ".join(
+            f"{stats['name']} {stats['depth']}/{stats['capacity']}"
+            for stats in self.queue_stats()
+        )
+
+    def _put(self, target: queue.Queue, item) -> bool:
+        """Blocking put that gives up when the pipeline is being stopped."""
+        while not self._stop_event.is_set():
+            try:
+                target.put(item, timeout=_POLL_INTERVAL_SEC)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _get(self, source: queue.Queue):
+        """Blocking get that gives up when the pipeline is being stopped."""
+        while not self._stop_event.is_set():
+            try:
+                return source.get(timeout=_POLL_INTERVAL_SEC)
+            except queue.Empty:
+                continue
+        return _END
+
+    def _decode_stage(self, frames: Iterable[tuple[object, np.ndarray]]) -> None:
+        try:
+            for item in frames:
+                if not self._put(self.frame_queue, item):
+                    return
+        except Exception as e:
+            self._errors.append(e)
+        finally:
+            self._put(self.frame_queue, _END)
+
+    def _inference_stage(self) -> None:
+        try:
+            finished = False
+            while not finished:
+                item = self._get(self.frame_queue)
+                if item is _END:
+                    break
+
+                # Take whatever is already decoded, up to batch_size frames
+                batch = [item]
+                while len(batch) < self._batch_size:
+                    try:
+                        item = self.frame_queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is _END:
+                        finished = True
+                        break
+                    batch.append(item)
+
+                detections = self._infer_batch([frame for _, frame in batch])
+                for (metadata, frame), frame_detections in zip(batch, detections):
+                    if not self._put(
+                        self.result_queue, (metadata, frame, frame_detections)
+                    ):
+                        return
+        except Exception as e:
+            self._errors.append(e)
+        finally:
+            self._put(self.result_queue, _END)
+
+    def run(
+        self, frames: Iterable[tuple[object, np.ndarray]]
+    ) -> Iterator[tuple[object, np.ndarray, list]]:
+        """
+        Run the pipeline over `frames` and yield results in frame order.
+
+        Args:
+            frames: Iterable of (metadata, frame) items, e.g. metadata being
+                (frame_number, timestamp_sec). It is consumed on the decoder thread.
+
+        Yields:
+            tuple: (metadata, frame, detections) for every frame
+        """
+        self._stop_event.clear()
+        self._errors.clear()
+        threads = [
+            threading.Thread(
+                target=self._decode_stage, args=(frames,), name="pipeline-decode"
+            ),
+            threading.Thread(target=self._inference_stage, name="pipeline-infer"),
+        ]
+        for thread in threads:
+            thread.daemon = True
+            thread.start()
+
+        try:
+            while True:
+                item = self._get(self.result_queue)
+                if item is _END:
+                    break
+                yield item
+        finally:
+            # Also reached when the consumer stops iterating early
+            self._stop_event.set()
+            for thread in threads:
+                thread.join()
+
+        if self._errors:
+            raise self._errors[0]
@@ -0,0 +1,137 @@
+"""
+Preview window decoupled from inference.
+A renderer thread shows the most recent annotated frame at a capped refresh
+rate. Processing loops only hand over frames and never block on the GUI, so
+inference runs at the same speed whether or not someone is watching.
+"""
+
+import threading
+import time
+from typing import Optional
+
+import cv2
+import numpy as np
+
+from .config import PREVIEW_MAX_FPS
+from .detections import empty_detections
+from .utils import draw_multiple_detections
+
+
+class PreviewRenderer:
+    """
+    Show the latest submitted frame in an OpenCV window on its own thread.
+
+    Frames submitted faster than the refresh rate replace the pending one
+    (stale frames are dropped, never queued). Boxes are drawn on the renderer
+    thread. Note that some platforms (macOS) only allow HighGUI calls from the
+    main thread.
+    """
+
+    def __init__(
+        self,
+        window_title: str = "Preview",
+        class_names: Optional[np.ndarray] = None,
+        max_fps: float = PREVIEW_MAX_FPS,
+        exit_key: str = "q",
+    ) -> None:
+        self.window_title = window_title
+        self.class_names = class_names
+        self.exit_key = exit_key
+        self._min_interval = 1.0 / max_fps if max_fps and max_fps > 0 else 0.0
+        self._pending: Optional[tuple[np.ndarray, np.ndarray]] = None
+        self._lock = threading.Lock()
+        self._new_frame = threading.Event()
+        self._closed = threading.Event()
+        self._exit_requested = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.shown_frames = 0
+        self.dropped_frames = 0
+
+    def __enter__(self) -> "PreviewRenderer":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def stop_requested(self) -> bool:
+        """True once the exit key was pressed in the preview window."""
+        return self._exit_requested.is_set()
+
+    def start(self) -> None:
+        """Start the renderer thread."""
+        if self._thread is not None:
+            return
+        self._closed.clear()
+        self._thread = threading.Thread(
+            target=self._render_loop, name="preview-renderer", daemon=True
+        )
+        self._thread.start()
+
+    def submit(
+        self, frame: np.ndarray, detections: Optional[np.ndarray] = None
+    ) -> None:
+        """
+        Hand a frame over to the renderer without waiting for it.
+        The renderer draws on the frame, so callers must not reuse its buffer.
+
+        Args:
+            frame: BGR frame
+            detections: Detections to draw on the frame (structured array)
+        """
+        with self._lock:
+            if self._pending is not None:
+                self.dropped_frames += 1
+            self._pending = (
+                frame,
+                detections if detections is not None else empty_detections(),
+            )
+        self._new_frame.set()
+
+    def _render_loop(self) -> None:
+        last_shown = 0.0
+        while not self._closed.is_set():
+            if not self._new_frame.wait(timeout=0.1):
+                # Keep the window responsive while no frames arrive
+                self._poll_exit_key()
+                continue
+
+            wait = self._min_interval - (time.perf_counter() - last_shown)
+            if wait > 0 and self._closed.wait(wait):
+                break
+
+            with self._lock:
+                pending, self._pending = self._pending, None
+                self._new_frame.clear()
+            if pending is None:
+                continue
+
+            frame, detections = pending
+            draw_multiple_detections(frame, detections, self.class_names)
+            cv2.imshow(self.window_title, frame)
+            self.shown_frames += 1
+            last_shown = time.perf_counter()
+            self._poll_exit_key()
+
+        if self.shown_frames:
+            cv2.destroyWindow(self.window_title)
+
+    def _poll_exit_key(self) -> None:
+        if self.shown_frames and cv2.waitKey(1) & 0xFF == ord(self.exit_key):
+            self._exit_requested.set()
+
+    def close(self) -> None:
+        """Stop the renderer thread and close its window."""
+        if self._thread is None:
+            return
+        self._closed.set()
+        self._thread.join()
+        self._thread = None
+
+    def stats(self) -> dict:
+        """Get shown and dropped frame counters."""
+        return {
+            "shown_frames": self.shown_frames,
+            "dropped_frames": self.dropped_frames,
+        }
@@ -0,0 +1,191 @@
+"""
+FP32 vs INT8 comparison report.
+Runs a reference and a quantized model over the same images and reports the
+latency of each one and how well their detections agree (matched boxes and
+class counts), so the accuracy cost of INT8 can be checked before switching.
+
+Usage:
+    python -m src.vision.quantization_report [dynamic|static] [image_dir]
+"""
+
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+from .config import IMG_INPUT_PATH, QUANTIZATION
+from .model import YoloModel
+from .model_export import IMAGE_EXTENSIONS
+from .tracker import iou_matrix
+
+
+def match_detections(
+    reference: tuple, candidate: tuple, iou_threshold: float = 0.5
+) -> int:
+    """
+    Count the candidate boxes that match a reference box of the same class.
+
+    Args:
+        reference: (xyxy, conf, cls) arrays of the reference model
+        candidate: (xyxy, conf, cls) arrays of the candidate model
+        iou_threshold: Minimum IoU of a match
+
+    Returns:
+        int: Number of one-to-one matches (greedy by IoU)
+    """
+    ref_xyxy, _, ref_cls = reference
+    cand_xyxy, _, cand_cls = candidate
+    if len(ref_xyxy) == 0 or len(cand_xyxy) == 0:
+        return 0
+
+    ious = iou_matrix(ref_xyxy, cand_xyxy)
+    ious[ref_cls[:, None] != cand_cls[None, :]] = 0.0
+
+    matches = 0
+    for flat_index in np.argsort(ious, axis=None)[::-1]:
+        ref_index, cand_index = np.unravel_index(flat_index, ious.shape)
+        if ious[ref_index, cand_index] < iou_threshold:
+            break
+        matches += 1
+        ious[ref_index, :] = 0.0
+        ious[:, cand_index] = 0.0
+    return matches
+
+
+def _timed_inference(model: YoloModel, image: np.ndarray) -> tuple[tuple, float]:
+    """Run one inference and return (result, milliseconds)."""
+    start = time.perf_counter()
+    result = model.run_inference_on_batch([image])[0]
+    return result, (time.perf_counter() - start) * 1000
+
+
+def _latency_stats(latencies_ms: list[float]) -> dict:
+    """Mean, p50 and p95 of a list of latencies."""
+    if not latencies_ms:
+        return {"mean_ms": 0.0, "p50_ms": 0.0, "p95_ms": 0.0}
+    values = np.asarray(latencies_ms)
+    return {
+        "mean_ms": float(values.mean()),
+        "p50_ms": float(np.percentile(values, 50)),
+        "p95_ms": float(np.percentile(values, 95)),
+    }
+
+
+def compare_models(
+    reference: YoloModel,
+    candidate: YoloModel,
+    image_dir: str = IMG_INPUT_PATH,
+    iou_threshold: float = 0.5,
+    warmup: int = 2,
+) -> dict:
+    """
+    Compare latency and detections of two models on the same images.
+
+    Args:
+        reference: Reference model (usually FP32)
+        candidate: Model under evaluation (usually INT8)
+        image_dir: Directory with the evaluation images
+        iou_threshold: Minimum IoU for two boxes to count as the same detection
+        warmup: Untimed inferences per model before measuring
+
+    Returns:
+        dict: Latency stats per model, speedup, matched boxes, recall and
+        precision of the candidate against the reference and class counts
+    """
+    paths = sorted(
+        path
+        for path in Path(image_dir).iterdir()
+        if path.is_file() and path.suffix.lower() in IMAGE_EXTENSIONS
+    )
+    images = [image for image in map(cv2.imread, map(str, paths)) if image is not None]
+    if not images:
+        raise FileNotFoundError(f"No images found in {image_dir}")
+
+    for model in (reference, candidate):
+        for _ in range(warmup):
+            model.run_inference_on_batch([images[0]])
+
+    reference_ms, candidate_ms = [], []
+    reference_boxes = candidate_boxes = matched = 0
+    reference_classes, candidate_classes = Counter(), Counter()
+    for image in images:
+        ref_result, ref_ms = _timed_inference(reference, image)
+        cand_result, cand_ms = _timed_inference(candidate, image)
+        reference_ms.append(ref_ms)
+        candidate_ms.append(cand_ms)
+
+        reference_boxes += len(ref_result[0])
+        candidate_boxes += len(cand_result[0])
+        matched += match_detections(ref_result, cand_result, iou_threshold)
+        reference_classes.update(
+            reference.model.names[int(c)] for c in ref_result[2].tolist()
+        )
+        candidate_classes.update(
+            candidate.model.names[int(c)] for c in cand_result[2].tolist()
+        )
+
+    reference_latency = _latency_stats(reference_ms)
+    candidate_latency = _latency_stats(candidate_ms)
+    return {
+        "images": len(images),
+        "reference_latency": reference_latency,
+        "candidate_latency": candidate_latency,
+        "speedup": (
+            reference_latency["mean_ms"] / candidate_latency["mean_ms"]
+            if candidate_latency["mean_ms"]
+            else 0.0
+        ),
+        "reference_boxes": reference_boxes,
+        "candidate_boxes": candidate_boxes,
+        "matched_boxes": matched,
+        "recall": matched / reference_boxes if reference_boxes else 1.0,
+        "precision": matched / candidate_boxes if candidate_boxes else 1.0,
+        "class_counts": {
+            class_name: (reference_classes[class_name], candidate_classes[class_name])
+            for class_name in sorted(reference_classes | candidate_classes)
+        },
+    }
+
+
+def print_report(report: dict, reference_label: str, candidate_label: str) -> None:
+    """Print a comparison report returned by `compare_models`."""
+    print(
+        f"\n=== {reference_label} vs {candidate_label} ({report['images']} images) ==="
+    )
+    for label, key in (
+        (reference_label, "reference_latency"),
+        (candidate_label, "candidate_latency"),
+    ):
+        stats = report[key]
+        print(
+            f"{label:>12}: mean {stats['mean_ms']:.1f} ms | "
+            f"p50 {stats['p50_ms']:.1f} ms | p95 {stats['p95_ms']:.1f} ms"
+        )
+    print(f"Speedup: {report['speedup']:.2f}x")
+    print(
+        f"Boxes: {report['reference_boxes']} -> {report['candidate_boxes']} | "
+        f"matched {report['matched_boxes']} | recall {report['recall']:.1%} | "
+        f"precision {report['precision']:.1%}"
+    )
+    print("Class counts (reference -> candidate):")
+    class_counts = report["class_counts"]
+    for class_name, (reference_count, candidate_count) in class_counts.items():
+        print(f"  {class_name}: {reference_count} -> {candidate_count}")
+
+
+def main() -> None:
+    """Compare the ONNX FP32 model with its INT8 variant."""
+    quantization = sys.argv[1] if len(sys.argv) > 1 else (QUANTIZATION or "dynamic")
+    image_dir = sys.argv[2] if len(sys.argv) > 2 else IMG_INPUT_PATH
+
+    reference = YoloModel(backend="onnx", quantization=None)
+    candidate = YoloModel(backend="onnx", quantization=quantization)
+    report = compare_models(reference, candidate, image_dir)
+    print_report(report, "onnx-fp32", f"onnx-int8-{quantization}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+"""
+Persistent cache of detection results per media file.
+Entries are keyed by the file content hash, the model identity (weights
+hash, backend, input size, quantization, ultralytics version) and the
+inference parameters, so unchanged files are served without running YOLO
+again and any change to the media, the model or the parameters misses.
+"""
+
+import atexit
+import hashlib
+import json
+import os
+import time
+from functools import lru_cache
+from importlib import metadata
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+
+from .config import (
+    ALLOWED_CLASSES,
+    COLOR_LUT_BITS,
+    DOMINANT_COLOR_DOWNSCALE,
+    INFERENCE_BACKEND,
+    INFERENCE_IMGSZ,
+    QUANTIZATION,
+    RESULT_CACHE_DIR,
+    YOLO_MODEL_PATH,
+)
+from .model_export import file_sha256
+from .utils import create_detection_dataframe_schema
+
+# Bump when the way detection rows are computed changes (features, colors...)
+CACHE_FORMAT_VERSION = 4
+# Newly hashed files between two writes of the hash index (also written by flush())
+HASH_INDEX_SAVE_INTERVAL = 1000
+
+
+@lru_cache(maxsize=None)
+def _weights_sha256(weights_path: str, size: int, mtime_ns: int) -> str:
+    return file_sha256(weights_path)
+
+
+def model_identity(
+    weights_path: str = YOLO_MODEL_PATH,
+    backend: str = INFERENCE_BACKEND,
+    imgsz: int = INFERENCE_IMGSZ,
+    quantization: Optional[str] = QUANTIZATION,
+) -> dict:
+    """
+    Describe the model that produces the detections, without loading it.
+
+    Returns:
+        dict: Weights hash, backend, input size, quantization, allowed classes
+        and ultralytics version
+    """
+    stat = os.stat(weights_path)
+    try:
+        ultralytics_version = metadata.version("ultralytics")
+    except metadata.PackageNotFoundError:
+        ultralytics_version = None
+    return {
+        "weights_sha256": _weights_sha256(weights_path, stat.st_size, stat.st_mtime_ns),
+        "backend": backend,
+        "imgsz": imgsz,
+        "quantization": quantization,
+        "allowed_classes": sorted(ALLOWED_CLASSES),
+        "ultralytics": ultralytics_version,
+    }
+
+
+class ResultCache:
+    """Store and serve the detection rows produced for a media file."""
+
+    def __init__(self, cache_dir: str = RESULT_CACHE_DIR) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.hits = 0
+        self.misses = 0
+        self._hash_index_path = self.cache_dir / "file_hashes.json"
+        self._hash_index = self._load_hash_index()
+        self._unsaved_hashes = 0
+        self._model_identity: Optional[dict] = None
+        # Hashes computed by a run interrupted before its flush() are kept
+        atexit.register(self.flush)
+
+    def _load_hash_index(self) -> dict:
+        try:
+            with open(self._hash_index_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_hash_index(self) -> None:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._hash_index_path.with_suffix(".json.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._hash_index, f)
+        os.replace(tmp_path, self._hash_index_path)
+
+    def file_hash(self, path: str) -> str:
+        """
+        SHA-256 of a file's content. Hashes are remembered by path, size and
+        modification time, so unchanged files are not read again.
+        """
+        stat = os.stat(path)
+        absolute_path = str(Path(path).resolve())
+        entry = self._hash_index.get(absolute_path)
+        if entry is not None and entry[:2] == [stat.st_size, stat.st_mtime_ns]:
+            return entry[2]
+
+        digest = file_sha256(path)
+        self._hash_index[absolute_path] = [stat.st_size, stat.st_mtime_ns, digest]
+        self._unsaved_hashes += 1
+        if self._unsaved_hashes >= HASH_INDEX_SAVE_INTERVAL:
+            self.flush()
+        return digest
+
+    def flush(self) -> None:
+        """Write the file hash index if new hashes were computed since the last write."""
+        if not self._unsaved_hashes:
+            return
+        self._save_hash_index()
+        self._unsaved_hashes = 0
+
+    def key(self, path: str, params: dict) -> str:
+        """Cache key of a file processed with the given inference parameters."""
+        if self._model_identity is None:
+            self._model_identity = model_identity()
+        description = {
+            "version": CACHE_FORMAT_VERSION,
+            "file": self.file_hash(path),
+            "model": self._model_identity,
+            "params": params,
+            "schema": create_detection_dataframe_schema(),
+            "color_lut_bits": COLOR_LUT_BITS,
+            "dominant_color_downscale": DOMINANT_COLOR_DOWNSCALE,
+        }
+        encoded = json.dumps(description, sort_keys=True, default=str).encode()
+        return hashlib.sha256(encoded).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.pkl"
+
+    def load(self, path: str, params: dict) -> Optional[pd.DataFrame]:
+        """
+        Get the cached detection rows of a file.
+
+        Args:
+            path: Media file
+            params: Inference parameters the rows must have been produced with
+
+        Returns:
+            pd.DataFrame: Cached rows (possibly empty) with ingestion_date
+            refreshed to today, or None on a cache miss
+        """
+        entry_path = self._entry_path(self.key(path, params))
+        try:
+            rows = pd.read_pickle(entry_path)
+        except (OSError, ValueError, EOFError):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        if not rows.empty:
+            today = time.strftime("%Y-%m-%d", time.localtime())
+            rows["ingestion_date"] = pd.Series(today, index=rows.index, dtype=object)
+        return rows
+
+    def store(self, path: str, params: dict, rows: pd.DataFrame) -> None:
+        """Save the detection rows of a file (atomically)."""
+        entry_path = self._entry_path(self.key(path, params))
+        entry_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = entry_path.with_suffix(".pkl.tmp")
+        rows.reset_index(drop=True).to_pickle(tmp_path)
+        os.replace(tmp_path, entry_path)
+
+    def stats(self) -> dict:
+        """Get hit and miss counters."""
+        return {"hits": self.hits, "misses": self.misses}
@@ -0,0 +1,209 @@
+"""
+Lightweight multi-object tracker.
+Associates detections of consecutive keyframes by IoU and propagates boxes
+between keyframes with a constant-velocity alpha-beta filter (a steady-state
+Kalman filter), so YOLO only needs to run on keyframes.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+from .config import (
+    TRACKER_ALPHA,
+    TRACKER_BETA,
+    TRACKER_IOU_THRESHOLD,
+    TRACKER_MAX_MISSED,
+)
+from .detections import empty_detections, make_detections
+
+
+def iou_matrix(boxes_a: np.ndarray, boxes_b: np.ndarray) -> np.ndarray:
+    """
+    Compute the IoU between every pair of boxes.
+
+    Args:
+        boxes_a: Boxes (N, 4) as x1, y1, x2, y2
+        boxes_b: Boxes (M, 4) as x1, y1, x2, y2
+
+    Returns:
+        np.ndarray: IoU matrix (N, M)
+    """
+    boxes_a = np.asarray(boxes_a, dtype=float).reshape(-1, 4)
+    boxes_b = np.asarray(boxes_b, dtype=float).reshape(-1, 4)
+
+    x1 = np.maximum(boxes_a[:, None, 0], boxes_b[None, :, 0])
+    y1 = np.maximum(boxes_a[:, None, 1], boxes_b[None, :, 1])
+    x2 = np.minimum(boxes_a[:, None, 2], boxes_b[None, :, 2])
+    y2 = np.minimum(boxes_a[:, None, 3], boxes_b[None, :, 3])
+    intersection = np.clip(x2 - x1, 0, None) * np.clip(y2 - y1, 0, None)
+
+    area_a = (boxes_a[:, 2] - boxes_a[:, 0]) * (boxes_a[:, 3] - boxes_a[:, 1])
+    area_b = (boxes_b[:, 2] - boxes_b[:, 0]) * (boxes_b[:, 3] - boxes_b[:, 1])
+    union = area_a[:, None] + area_b[None, :] - intersection
+
+    return np.divide(
+        intersection, union, out=np.zeros_like(intersection), where=union > 0
+    )
+
+
+class Track:
+    """Single tracked object with a constant-velocity box model."""
+
+    def __init__(
+        self,
+        track_id: int,
+        bbox: Tuple[int, int, int, int],
+        class_id: int,
+        confidence: float,
+    ) -> None:
+        self.track_id = track_id
+        self.box = np.asarray(bbox, dtype=float)
+        self.velocity = np.zeros(4)
+        self.class_id = class_id
+        self.confidence = confidence
+        self.missed_keyframes = 0
+        self._frames_since_update = 0
+
+    def predict(self) -> None:
+        """Advance the box one frame."""
+        self.box = self.box + self.velocity
+        self._frames_since_update += 1
+
+    def update(
+        self,
+        bbox: Tuple[int, int, int, int],
+        confidence: float,
+        alpha: float = TRACKER_ALPHA,
+        beta: float = TRACKER_BETA,
+    ) -> None:
+        """Correct the predicted box with a new detection."""
+        residual = np.asarray(bbox, dtype=float) - self.box
+        frames = max(1, self._frames_since_update)
+        self.box = self.box + alpha * residual
+        self.velocity = self.velocity + beta * residual / frames
+        self.confidence = confidence
+        self.missed_keyframes = 0
+        self._frames_since_update = 0
+
+    def bbox(self, frame_shape: Tuple[int, int]) -> Tuple[int, int, int, int]:
+        """Current box as integer coordinates clamped to the frame."""
+        frame_height, frame_width = frame_shape[:2]
+        x1, y1, x2, y2 = self.box
+        x1 = int(np.clip(x1, 0, frame_width - 1))
+        y1 = int(np.clip(y1, 0, frame_height - 1))
+        x2 = int(np.clip(x2, x1 + 1, frame_width))
+        y2 = int(np.clip(y2, y1 + 1, frame_height))
+        return (x1, y1, x2, y2)
+
+
+class IoUTracker:
+    """
+    Assign persistent track IDs to detections.
+
+    Call `update()` with the detections of every keyframe and `propagate()`
+    on the frames in between.
+    """
+
+    def __init__(
+        self,
+        iou_threshold: float = TRACKER_IOU_THRESHOLD,
+        max_missed: int = TRACKER_MAX_MISSED,
+    ) -> None:
+        self.iou_threshold = iou_threshold
+        self.max_missed = max_missed
+        self.tracks: list[Track] = []
+        self._next_track_id = 0
+
+    def reset(self) -> None:
+        """
+        Drop all tracks (e.g. for a new source). Track IDs keep counting, so
+        they are never reused within a run.
+        """
+        self.tracks = []
+
+    def _match(self, detections: np.ndarray) -> list[tuple[int, int]]:
+        """Greedy IoU matching between tracks and detections of the same class."""
+        if not self.tracks or len(detections) == 0:
+            return []
+
+        ious = iou_matrix([track.box for track in self.tracks], detections["bbox"])
+        track_classes = np.array([track.class_id for track in self.tracks])
+        detection_classes = detections["class_id"]
+        ious[track_classes[:, None] != detection_classes[None, :]] = 0.0
+
+        matches = []
+        for flat_index in np.argsort(ious, axis=None)[::-1]:
+            track_index, detection_index = np.unravel_index(flat_index, ious.shape)
+            if ious[track_index, detection_index] < self.iou_threshold:
+                break
+            matches.append((int(track_index), int(detection_index)))
+            ious[track_index, :] = 0.0
+            ious[:, detection_index] = 0.0
+        return matches
+
+    def update(self, detections: np.ndarray) -> np.ndarray:
+        """
+        Associate the detections of a keyframe with the existing tracks.
+
+        Args:
+            detections: Detections of the keyframe (structured array)
+
+        Returns:
+            np.ndarray: Track ID of every detection (int32), in the same order
+        """
+        for track in self.tracks:
+            track.predict()
+
+        track_ids = np.full(len(detections), -1, dtype=np.int32)
+        matched_tracks = set()
+        for track_index, detection_index in self._match(detections):
+            detection = detections[detection_index]
+            track = self.tracks[track_index]
+            track.update(detection["bbox"], float(detection["confidence"]))
+            track_ids[detection_index] = track.track_id
+            matched_tracks.add(track_index)
+
+        for track_index, track in enumerate(self.tracks):
+            if track_index not in matched_tracks:
+                track.missed_keyframes += 1
+        self.tracks = [
+            track for track in self.tracks if track.missed_keyframes <= self.max_missed
+        ]
+
+        for detection_index in np.flatnonzero(track_ids < 0):
+            detection = detections[detection_index]
+            track = Track(
+                self._next_track_id,
+                detection["bbox"],
+                int(detection["class_id"]),
+                float(detection["confidence"]),
+            )
+            self._next_track_id += 1
+            self.tracks.append(track)
+            track_ids[detection_index] = track.track_id
+
+        return track_ids
+
+    def propagate(self, frame_shape: Tuple[int, int]) -> np.ndarray:
+        """
+        Move the tracks one frame forward without new detections.
+
+        Args:
+            frame_shape: Frame dimensions (height, width)
+
+        Returns:
+            np.ndarray: Detections (structured array, track_id filled) for the
+            tracks seen on the last keyframe
+        """
+        for track in self.tracks:
+            track.predict()
+        visible = [track for track in self.tracks if track.missed_keyframes == 0]
+        if not visible:
+            return empty_detections()
+        return make_detections(
+            [track.bbox(frame_shape) for track in visible],
+            [track.confidence for track in visible],
+            [track.class_id for track in visible],
+            [track.track_id for track in visible],
+        )
@@ -3,12 +3,21 @@ Utility functions for computer vision operations.
 Contains reusable functions for geometry calculations, color analysis, and visualization.
 """
 
-from typing import Tuple
+import os
+from datetime import datetime
+from typing import Optional, Tuple
 
 import cv2
 import numpy as np
 
-from .config import FONT_COLOR, CLASS_COLORS, DEFAULT_COLOR, OUTPUT_DATA_PATH
+from .colors import name_colors
+from .config import (
+    CLASS_COLORS,
+    DEFAULT_COLOR,
+    DOMINANT_COLOR_DOWNSCALE,
+    FONT_COLOR,
+    OUTPUT_DATA_PATH,
+)
 
 
 def calculate_bbox_attributes(
@@ -89,6 +98,93 @@ def calculate_position_region(center_x_norm: float, center_y_norm: float) -> str
     return f"{vertical}-{horizontal}"
 
 
+# Names of the region codes returned by calculate_position_region_codes
+POSITION_REGIONS = np.array(
+    [
+        f"{vertical}-{horizontal}"
+        for vertical in ("top", "middle", "bottom")
+        for horizontal in ("left", "center", "right")
+    ],
+    dtype=object,
+)
+_REGION_BOUNDS = np.array([0.33, 0.67])
+
+
+def calculate_position_region_codes(
+    center_x_norm: np.ndarray, center_y_norm: np.ndarray
+) -> np.ndarray:
+    """
+    Vectorized calculate_position_region returning region codes.
+
+    Args:
+        center_x_norm: Normalized x centers (0-1)
+        center_y_norm: Normalized y centers (0-1)
+
+    Returns:
+        np.ndarray: Codes (int8) indexing POSITION_REGIONS
+    """
+    vertical = np.searchsorted(_REGION_BOUNDS, center_y_norm, side="right")
+    horizontal = np.searchsorted(_REGION_BOUNDS, center_x_norm, side="right")
+    return (3 * vertical + horizontal).astype(np.int8)
+
+
+def calculate_bbox_attributes_batch(
+    boxes: np.ndarray, frame_shape: Tuple[int, int]
+) -> dict:
+    """
+    Vectorized calculate_bbox_attributes for all the boxes of a frame.
+
+    Args:
+        boxes: Integer bounding boxes (N, 4) as (x1, y1, x2, y2)
+        frame_shape: Frame dimensions (height, width)
+
+    Returns:
+        dict: Same keys as calculate_bbox_attributes, each holding an (N,)
+        array, plus "position_region_code"
+    """
+    boxes = np.asarray(boxes, dtype=np.int64).reshape(-1, 4)
+    x1, y1, x2, y2 = boxes.T
+    frame_height, frame_width = frame_shape[:2]
+
+    width = x2 - x1
+    height = y2 - y1
+    area_pixels = width * height
+
+    center_x = x1 + width // 2
+    center_y = y1 + height // 2
+
+    center_x_norm = center_x / frame_width if frame_width > 0 else np.zeros(len(boxes))
+    center_y_norm = (
+        center_y / frame_height if frame_height > 0 else np.zeros(len(boxes))
+    )
+
+    frame_area = frame_width * frame_height
+    bbox_area_ratio = (
+        area_pixels / frame_area if frame_area > 0 else np.zeros(len(boxes))
+    )
+
+    region_codes = calculate_position_region_codes(center_x_norm, center_y_norm)
+
+    return {
+        "x_min": x1,
+        "y_min": y1,
+        "x_max": x2,
+        "y_max": y2,
+        "width": width,
+        "height": height,
+        "area_pixels": area_pixels,
+        "frame_width": np.full(len(boxes), frame_width, dtype=np.int64),
+        "frame_height": np.full(len(boxes), frame_height, dtype=np.int64),
+        "bbox_area_ratio": bbox_area_ratio,
+        "center_x": center_x,
+        "center_y": center_y,
+        "center_x_norm": center_x_norm,
+        "center_y_norm": center_y_norm,
+        "position_region": POSITION_REGIONS[region_codes],
+        "position_region_code": region_codes,
+    }
+
+
 def calculate_dominant_color(
     frame: np.ndarray, bbox: Tuple[int, int, int, int]
 ) -> dict:
@@ -121,7 +217,7 @@ def calculate_dominant_color(
     mean_color = np.mean(roi, axis=(0, 1)).astype(int)
     dom_b, dom_g, dom_r = mean_color
 
-    color_name = get_color_name(dom_r, dom_g, dom_b)
+    color_name = name_colors(dom_r, dom_g, dom_b)
 
     return {
         "dominant_color_name": color_name,
@@ -131,9 +227,70 @@ def calculate_dominant_color(
     }
 
 
+def calculate_dominant_colors_batch(
+    frame: np.ndarray, boxes: np.ndarray, downscale: int = DOMINANT_COLOR_DOWNSCALE
+) -> dict:
+    """
+    Vectorized calculate_dominant_color for all the boxes of a frame.
+    The frame's summed-area table (cv2.integral) is built once, then the mean
+    color of every box takes four lookups whatever its size, so overlapping
+    boxes never read the same pixels twice.
+
+    Args:
+        frame: Input frame (BGR)
+        boxes: Integer bounding boxes (N, 4) as (x1, y1, x2, y2)
+        downscale: Build the table on the frame shrunk by this factor (faster,
+            approximate). 1 gives the same values as calculate_dominant_color
+
+    Returns:
+        dict: Same keys as calculate_dominant_color, each holding an (N,) array
+    """
+    boxes = np.asarray(boxes, dtype=np.int64).reshape(-1, 4)
+    dom_bgr = np.zeros((len(boxes), 3), dtype=np.int64)
+    color_names = np.full(len(boxes), "unknown", dtype=object)
+
+    x1, y1, x2, y2 = boxes.T
+    valid = (x1 < x2) & (y1 < y2)
+    if valid.any() and frame.size > 0:
+        frame_height, frame_width = frame.shape[:2]
+        # Same clamping as calculate_dominant_color
+        x1 = np.clip(x1[valid], 0, frame_width - 1)
+        y1 = np.clip(y1[valid], 0, frame_height - 1)
+        x2 = np.maximum(x1 + 1, np.minimum(x2[valid], frame_width))
+        y2 = np.maximum(y1 + 1, np.minimum(y2[valid], frame_height))
+
+        if downscale > 1:
+            small_width = -(-frame_width // downscale)
+            small_height = -(-frame_height // downscale)
+            frame = cv2.resize(
+                frame, (small_width, small_height), interpolation=cv2.INTER_AREA
+            )
+            x1, y1 = x1 // downscale, y1 // downscale
+            x2 = np.minimum(-(-x2 // downscale), small_width)
+            y2 = np.minimum(-(-y2 // downscale), small_height)
+
+        # Float64 sums of uint8 pixels are exact, so the means equal np.mean's
+        integral = cv2.integral(frame, sdepth=cv2.CV_64F)
+        sums = integral[y2, x2] - integral[y1, x2] - integral[y2, x1] + integral[y1, x1]
+        means = sums / ((x2 - x1) * (y2 - y1))[:, None]
+        dom_bgr[valid] = means.astype(int)
+        color_names[valid] = name_colors(
+            dom_bgr[valid, 2], dom_bgr[valid, 1], dom_bgr[valid, 0]
+        )
+
+    return {
+        "dominant_color_name": color_names,
+        "dom_r": dom_bgr[:, 2],
+        "dom_g": dom_bgr[:, 1],
+        "dom_b": dom_bgr[:, 0],
+    }
+
+
 def get_color_name(r: int, g: int, b: int) -> str:
     """
     Determine color name based on RGB values.
+    Reference version of the rules; detections are named through the
+    quantized lookup table in colors.py.
 
     Args:
         r, g, b: RGB color values (0-255)
@@ -191,7 +348,8 @@ def get_class_color(class_name: str) -> Tuple[int, int, int]:
 
 def draw_multiple_detections(
     frame: np.ndarray,
-    detections: list,
+    detections: np.ndarray,
+    class_names: Optional[np.ndarray],
     font_color: Tuple[int, int, int] = FONT_COLOR,
 ) -> None:
     """
@@ -199,12 +357,22 @@ def draw_multiple_detections(
 
     Args:
         frame: Frame to draw on (modified in-place)
-        detections: List of detections [(class_name, confidence, bbox, class_id), ...]
+        detections: Detections of the frame (structured array, see detections.py)
+        class_names: Class name table indexed by class_id. If None, boxes are
+            labelled with their class ID
         font_color: Color for text (BGR format)
     """
-    for class_name, confidence, bbox, _ in detections:
-        class_color = get_class_color(class_name)
-        draw_detection_box(frame, bbox, class_name, confidence, class_color, font_color)
+    for bbox, confidence, class_id, track_id in detections.tolist():
+        class_name = class_names[class_id] if class_names is not None else str(class_id)
+        draw_detection_box(
+            frame,
+            bbox,
+            class_name,
+            confidence,
+            get_class_color(class_name),
+            font_color,
+            track_id if track_id >= 0 else None,
+        )
 
 
 def draw_detection_box(
@@ -214,6 +382,7 @@ def draw_detection_box(
     confidence: float,
     box_color: Tuple[int, int, int] = None,
     font_color: Tuple[int, int, int] = FONT_COLOR,
+    track_id: Optional[int] = None,
 ) -> None:
     """
     Draw detection bounding box and label on frame with class-specific color.
@@ -225,6 +394,7 @@ def draw_detection_box(
         confidence: Detection confidence score
         box_color: Color for bounding box (BGR format). If None, uses class-specific color
         font_color: Color for text (BGR format)
+        track_id: Tracker ID shown in the label, if any
     """
     if box_color is None:
         box_color = get_class_color(class_name)
@@ -239,6 +409,8 @@ def draw_detection_box(
     cv2.rectangle(frame, (x1, y1), (x2, y2), box_color, 3)
 
     label = f"{class_name} {confidence:.2f}"
+    if track_id is not None:
+        label = f"{class_name} #{track_id} {confidence:.2f}"
 
     font = cv2.FONT_HERSHEY_SIMPLEX
     font_scale = 0.8
@@ -267,6 +439,16 @@ def draw_detection_box(
     )
 
 
+def new_run_id() -> str:
+    """
+    Get the ID of a new processing run.
+
+    Returns:
+        str: Start time and process ID, e.g. "20260131_142501_4242"
+    """
+    return f"{datetime.now():%Y%m%d_%H%M%S}_{os.getpid()}"
+
+
 def extract_filename_from_path(file_path: str) -> str:
     """
     Extract filename from a file path (cross-platform).
@@ -335,7 +517,9 @@ def create_detection_dataframe_schema() -> list:
         "detection_id",
         "source_type",
         "source_id",
+        "run_id",
         "frame_number",
+        "track_id",
         "class_id",
         "class_name",
         "confidence",
@@ -380,6 +564,25 @@ def save_dataframe_to_csv(dataframe, filename) -> None:
         print("No detection data to save")
 
 
+def save_dataframe_to_parquet(dataframe, filename) -> None:
+    """
+    Save detection dataframe to a Parquet file with the Hive table types.
+
+    Args:
+        dataframe: pandas DataFrame with detection data
+        filename: Name of Parquet file to save
+    """
+    from .parquet_output import write_detections_parquet
+
+    path = OUTPUT_DATA_PATH + filename
+    if not dataframe.empty:
+        write_detections_parquet(dataframe, path)
+        print(f"Detection data saved to {path}")
+        print(f"Total detections: {len(dataframe)}")
+    else:
+        print("No detection data to save")
+
+
 def get_detection_summary(dataframe) -> dict:
     """
     Get summary statistics from detection dataframe.
@@ -408,58 +611,73 @@ def get_detection_summary(dataframe) -> dict:
     return summary
 
 
-def add_detection_to_dataframe(
-    dataframe,
+def build_detection_columns(
     source_type: str,
     source_id: str,
     frame,
-    class_name: str,
-    confidence: float,
-    bbox: Tuple[int, int, int, int],
-    class_id: int,
+    detections: np.ndarray,
+    class_names: np.ndarray,
     frame_counter: int,
     start_time: float,
-) -> None:
+    timestamp_sec: Optional[float] = None,
+    source_size: Optional[Tuple[int, int]] = None,
+    run_id: str = "",
+) -> dict:
     """
-    Add detection data to dataframe.
+    Build the detection columns (one value per schema column) of all the
+    detections of a frame at once.
 
     Args:
-        dataframe: pandas DataFrame to append to
         source_type: Type of source ("image", "video", "camera")
         source_id: Source identifier
         frame: Current frame (numpy array)
-        class_name: Detected class name
-        confidence: Detection confidence
-        bbox: Bounding box coordinates
-        class_id: Class ID number
+        detections: Detections of the frame (structured array, see detections.py)
+        class_names: Class name table indexed by class_id
         frame_counter: Current frame number
         start_time: Processing start time
+        timestamp_sec: Position of the frame in the source. If None, the time
+            elapsed since start_time is used
+        source_size: (width, height) of the source when `frame` was decoded
+            at a reduced size. Box columns are then scaled back to the source
+            resolution; colors are still read from `frame`
+        run_id: Processing run the detections belong to (see MediaIO.run_id)
 
     Returns:
-        Updated dataframe
+        dict: {column: value or (N,) array} for DetectionAccumulator.extend
     """
     import time
-    import pandas as pd
-
-    bbox_attrs = calculate_bbox_attributes(bbox, frame.shape)
-    color_attrs = calculate_dominant_color(frame, bbox)
 
-    detection_id = f"{source_id}_{frame_counter}"
-    timestamp_sec = time.time() - start_time
-    ingestion_date = time.strftime("%Y-%m-%d", time.localtime())
+    boxes = detections["bbox"]
+    frame_shape = frame.shape
+    source_boxes = boxes
+    if source_size is not None:
+        source_width, source_height = source_size
+        frame_height, frame_width = frame.shape[:2]
+        if (source_width, source_height) != (frame_width, frame_height):
+            scale = np.array(
+                [source_width / frame_width, source_height / frame_height] * 2
+            )
+            source_boxes = np.rint(boxes * scale).astype(np.int64)
+        frame_shape = (source_height, source_width)
+    bbox_attrs = calculate_bbox_attributes_batch(source_boxes, frame_shape)
+    del bbox_attrs["position_region_code"]
+    color_attrs = calculate_dominant_colors_batch(frame, boxes)
+
+    if timestamp_sec is None:
+        timestamp_sec = time.time() - start_time
 
-    new_row = {
-        "detection_id": detection_id,
+    return {
+        "detection_id": f"{source_id}_{frame_counter}",
         "source_type": source_type,
         "source_id": source_id,
+        "run_id": run_id,
         "frame_number": frame_counter,
-        "class_id": class_id,
-        "class_name": class_name,
-        "confidence": confidence,
+        "track_id": detections["track_id"],
+        "class_id": detections["class_id"],
+        "class_name": class_names[detections["class_id"]],
+        "confidence": detections["confidence"],
         "timestamp_sec": timestamp_sec,
-        "ingestion_date": ingestion_date,
+        "ingestion_date": time.strftime("%Y-%m-%d", time.localtime()),
         **bbox_attrs,
         **color_attrs,
     }
-
-    return pd.concat([dataframe, pd.DataFrame([new_row])], ignore_index=True)
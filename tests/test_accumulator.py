@@ -0,0 +1,51 @@
+import numpy as np
+import pandas as pd
+
+from src.vision.accumulator import DetectionAccumulator
+from src.vision.utils import create_detection_dataframe_schema
+
+
+def _columns(frame_numbers):
+    columns = {name: 0 for name in create_detection_dataframe_schema()}
+    columns.update(
+        detection_id=[f"clip_{frame_number}" for frame_number in frame_numbers],
+        frame_number=frame_numbers,
+        confidence=0.5,
+        class_name="person",
+    )
+    return columns
+
+
+def test_rows_survive_growth_with_typed_columns():
+    """Goal: test that appending past the capacity keeps every row and the column dtypes."""
+    accumulator = DetectionAccumulator(capacity=2)
+    accumulator.extend(_columns([0, 1]))
+    accumulator.extend(_columns([2, 3, 4]))
+
+    dataframe = accumulator.to_dataframe()
+
+    assert len(accumulator) == 5 and accumulator.capacity >= 5
+    assert list(dataframe.columns) == create_detection_dataframe_schema()
+    assert dataframe["frame_number"].tolist() == [0, 1, 2, 3, 4]
+    assert dataframe["frame_number"].dtype == np.int64
+    assert dataframe["confidence"].dtype == np.float64
+
+
+def test_slices_truncate_and_dataframe_roundtrip():
+    """Goal: test that row slices are copies and dataframes can be appended back."""
+    accumulator = DetectionAccumulator()
+    accumulator.extend(_columns([0, 1, 2, 3]))
+    accumulator.extend(_columns([]))
+    tail = accumulator.to_dataframe(2)
+
+    accumulator.truncate(2)
+    accumulator.extend_dataframe(tail)
+    accumulator.extend_dataframe(
+        pd.DataFrame(columns=create_detection_dataframe_schema())
+    )
+
+    assert tail["frame_number"].tolist() == [2, 3]
+    assert accumulator.to_dataframe()["frame_number"].tolist() == [0, 1, 2, 3]
+
+    accumulator.clear()
+    assert accumulator.to_dataframe().empty
@@ -0,0 +1,79 @@
+import numpy as np
+import ultralytics
+
+from src.vision import model as model_module
+from src.vision.model import YoloModel
+
+
+class _FakeBoxes:
+    def __init__(self, xyxy, conf, cls):
+        self.xyxy, self.conf, self.cls = xyxy, conf, cls
+
+    def __len__(self):
+        return len(self.cls)
+
+    def cpu(self):
+        return self
+
+    def numpy(self):
+        return self
+
+
+class _FakeResult:
+    def __init__(self, frame):
+        # Boxes derived from the frame content: value v gives v % 4 boxes
+        value = int(frame[0, 0, 0])
+        count = value % 4
+        offsets = np.arange(count, dtype=np.float32)
+        self.boxes = (
+            _FakeBoxes(
+                np.stack(
+                    [value + offsets, offsets, value + 10.7 + offsets, 20.2 + offsets],
+                    axis=1,
+                ),
+                (0.301 + offsets / 10).astype(np.float32),
+                (offsets % 3).astype(np.float32),
+            )
+            if count
+            else None
+        )
+
+
+class _FakeYolo:
+    calls = []
+
+    def __init__(self, path, task):
+        self.names = {0: "person", 1: "zebra", 2: "car"}
+
+    def __call__(self, frames, stream, imgsz, verbose=True):
+        frames = frames if isinstance(frames, list) else [frames]
+        _FakeYolo.calls.append(len(frames))
+        return (_FakeResult(frame) for frame in frames)
+
+
+def test_batch_inference_matches_frame_by_frame(monkeypatch):
+    """Goal: test that one batched forward pass gives the same filtered detections as inferring frame by frame."""
+    monkeypatch.setattr(ultralytics, "YOLO", _FakeYolo)
+    monkeypatch.setattr(model_module, "resolve_model_path", lambda *a, **k: "fake.pt")
+    model = YoloModel()
+    frames = [np.full((32, 32, 3), value, dtype=np.uint8) for value in range(8)]
+
+    _FakeYolo.calls.clear()
+    batched = model.run_inference_on_batch(frames)
+    assert _FakeYolo.calls == [8]
+
+    for frame, (xyxy, conf, cls) in zip(frames, batched):
+        model.run_inference_on_frame(frame)
+        single = model.get_detections()
+        assert np.array_equal(single["bbox"], xyxy)
+        assert np.array_equal(single["confidence"], conf)
+        assert np.array_equal(single["class_id"], cls)
+        # "zebra" (class 1) is not in ALLOWED_CLASSES
+        assert 1 not in cls
+
+    xyxy, conf, cls = batched[3]
+    assert xyxy.tolist() == [[3, 0, 13, 20], [5, 2, 15, 22]]
+    assert conf.tolist() == [0.31, 0.51]  # Rounded up to 2 decimals
+    # The last single-frame call (value 7) keeps classes 0 and 2
+    assert model.get_class_names().tolist() == ["person", "car"]
+    assert model.run_inference_on_batch([]) == []
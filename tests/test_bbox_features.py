@@ -0,0 +1,52 @@
+import numpy as np
+
+from src.vision.utils import (
+    POSITION_REGIONS,
+    calculate_bbox_attributes,
+    calculate_bbox_attributes_batch,
+    calculate_dominant_color,
+    calculate_dominant_colors_batch,
+)
+
+
+def test_batch_attributes_match_per_box_attributes():
+    """Goal: test that the vectorized bbox features equal the per-box ones, regions included."""
+    rng = np.random.default_rng(0)
+    corners = rng.integers(0, 100, size=(200, 2, 2))
+    boxes = np.concatenate([corners.min(axis=1), corners.max(axis=1)], axis=1)
+    # Centers right on the region boundaries
+    boxes[:2] = [[0, 0, 66, 66], [0, 0, 134, 134]]
+
+    batch = calculate_bbox_attributes_batch(boxes, (100, 100))
+
+    for index, bbox in enumerate(boxes.tolist()):
+        expected = calculate_bbox_attributes(tuple(bbox), (100, 100))
+        for name, value in expected.items():
+            assert batch[name][index] == value, name
+    assert (
+        POSITION_REGIONS[batch["position_region_code"]] == batch["position_region"]
+    ).all()
+
+
+def test_batch_attributes_of_a_frame_without_boxes():
+    """Goal: test that a frame without detections gives empty feature arrays."""
+    batch = calculate_bbox_attributes_batch(np.empty((0, 4)), (480, 640))
+
+    assert all(len(values) == 0 for values in batch.values())
+
+
+def test_batch_colors_match_per_box_colors():
+    """Goal: test that the summed-area-table colors equal the per-box ROI means."""
+    rng = np.random.default_rng(1)
+    frame = rng.integers(0, 256, size=(60, 80, 3), dtype=np.uint8)
+    # Large overlapping boxes (table path), out-of-frame and degenerate boxes
+    boxes = np.array(
+        [[0, 0, 80, 60], [-5, 10, 70, 90], [10, 10, 10, 30], [79, 59, 95, 70]]
+    )
+
+    for subset in (boxes, boxes[2:]):
+        colors = calculate_dominant_colors_batch(frame, subset)
+        for index, bbox in enumerate(subset.tolist()):
+            expected = calculate_dominant_color(frame, tuple(bbox))
+            for name, value in expected.items():
+                assert colors[name][index] == value, name
@@ -1,3 +1,7 @@
+import subprocess
+import sys
+from pathlib import Path
+
 import pytest
 
 from src.vision.media_io import MediaIO
@@ -25,3 +29,21 @@ def test_at_least_one_camera_if_available():
         )
 
     assert len(cameras) > 0
+
+
+def test_media_io_does_not_load_model_until_inference():
+    """Goal: test that creating a MediaIO and diagnosing cameras does not import ultralytics."""
+    code = (
+        "import sys\n"
+        "from src.vision.media_io import MediaIO\n"
+        "media_io = MediaIO()\n"
+        "media_io.diagnose_cameras()\n"
+        "assert media_io.get_startup_stats()['model_load_seconds'] is None\n"
+        "assert 'ultralytics' not in sys.modules\n"
+    )
+    subprocess.run(
+        [sys.executable, "-c", code],
+        check=True,
+        capture_output=True,
+        cwd=Path(__file__).resolve().parents[1],
+    )
@@ -0,0 +1,57 @@
+import time
+
+from src.vision import camera_discovery
+from src.vision.camera_discovery import (
+    candidate_indices,
+    list_video_devices,
+    load_camera_cache,
+    probe_cameras,
+    save_camera_cache,
+)
+
+
+def test_candidates_come_from_video_devices():
+    """Goal: test that /dev/video* names are used as probe candidates when available."""
+    assert candidate_indices(["video0", "video2", "video10"]) == [0, 2, 10]
+    assert candidate_indices(None, max_index=3) == [0, 1, 2]
+
+
+def test_video_devices_are_only_listed_on_linux(tmp_path, monkeypatch):
+    """Goal: test that /dev/video* nodes are only enumerated on Linux and other platforms probe every index."""
+    (tmp_path / "video1").touch()
+    (tmp_path / "tty0").touch()
+
+    monkeypatch.setattr(camera_discovery.sys, "platform", "linux")
+    assert list_video_devices(str(tmp_path)) == ["video1"]
+
+    monkeypatch.setattr(camera_discovery.sys, "platform", "darwin")
+    devices = list_video_devices(str(tmp_path))
+    assert devices is None
+    assert candidate_indices(devices, max_index=2) == [0, 1]
+
+
+def test_cache_is_reused_until_devices_change(tmp_path):
+    """Goal: test that the camera cache is only valid for the device list it was built with."""
+    cache_path = str(tmp_path / "cameras.json")
+    cameras = [{"index": 0, "backend": 200, "width": 640, "height": 480}]
+    save_camera_cache(cameras, cache_path, devices=["video0"])
+
+    assert load_camera_cache(cache_path, devices=["video0"]) == cameras
+    assert load_camera_cache(cache_path, devices=["video0", "video1"]) is None
+
+
+def test_slow_probes_time_out(monkeypatch):
+    """Goal: test that probes run in parallel and a hanging camera does not block discovery."""
+
+    def fake_probe(index, backends=None):
+        if index == 1:
+            time.sleep(5)
+        return {"index": index, "backend": 0, "width": 640, "height": 480}
+
+    monkeypatch.setattr(camera_discovery, "probe_camera", fake_probe)
+
+    start = time.monotonic()
+    cameras = probe_cameras([0, 1, 2], timeout=0.5)
+
+    assert time.monotonic() - start < 2
+    assert [camera["index"] for camera in cameras] == [0, 2]
@@ -0,0 +1,49 @@
+import time
+
+import numpy as np
+
+from src.vision.capture import LatencyMonitor, LatestFrameCapture
+
+
+class _FakeCamera:
+    """Camera delivering numbered frames every few milliseconds."""
+
+    def __init__(self, frames: int = 40, interval: float = 0.005) -> None:
+        self._frames = frames
+        self._interval = interval
+        self._index = 0
+
+    def read(self):
+        if self._index >= self._frames:
+            return False, None
+        time.sleep(self._interval)
+        self._index += 1
+        return True, np.full((4, 4, 3), self._index, dtype=np.uint8)
+
+
+def test_slow_consumer_gets_newest_frames_and_counts_drops():
+    """Goal: test that a slow reader skips stale frames, which are counted as dropped."""
+    read_values = []
+    with LatestFrameCapture(_FakeCamera()) as capture:
+        while True:
+            ret, frame, _ = capture.read(timeout=1.0)
+            if not ret:
+                break
+            read_values.append(int(frame[0, 0, 0]))
+            time.sleep(0.03)
+
+    assert read_values == sorted(set(read_values))
+    assert capture.dropped_frames > 0
+    assert capture.dropped_frames + len(read_values) == capture.captured_frames == 40
+
+
+def test_latency_monitor_flags_slow_frames():
+    """Goal: test that latencies above the threshold are counted as alerts."""
+    monitor = LatencyMonitor(alert_ms=100)
+
+    assert not monitor.record(captured_at=10.0, done_at=10.05)
+    assert monitor.record(captured_at=10.0, done_at=10.25)
+
+    stats = monitor.stats()
+    assert stats["frames"] == 2 and stats["alerts"] == 1
+    assert round(stats["max_ms"]) == 250
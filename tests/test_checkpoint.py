@@ -0,0 +1,180 @@
+import shutil
+
+import cv2
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.vision import checkpoint as checkpoint_module
+from src.vision.checkpoint import VideoCheckpoint
+from src.vision.detections import make_detections
+from src.vision.media_io import MediaIO
+from src.vision.utils import create_detection_dataframe_schema
+
+
+def _rows(frame_numbers):
+    rows = pd.DataFrame(columns=create_detection_dataframe_schema())
+    for index, frame_number in enumerate(frame_numbers):
+        rows.loc[index] = None
+        rows.loc[index, "frame_number"] = frame_number
+    return rows
+
+
+def test_resume_restores_state_and_flushed_rows(tmp_path, monkeypatch):
+    """Goal: test that a checkpoint restores the last state and every flushed row in order."""
+    monkeypatch.setattr(checkpoint_module, "model_identity", lambda: {"weights": "w"})
+    video = tmp_path / "clip.mp4"
+    video.write_bytes(b"frames")
+    checkpoint = VideoCheckpoint(str(video), {}, str(tmp_path / "ck"), interval=0)
+
+    assert checkpoint.load() is None
+    checkpoint.save({"next_frame": 8}, _rows([0, 3]))
+    checkpoint.save({"next_frame": 16}, _rows([9]))
+
+    state, rows = VideoCheckpoint(str(video), {}, str(tmp_path / "ck")).load()
+    assert state == {"next_frame": 16}
+    assert rows["frame_number"].tolist() == [0, 3, 9]
+
+    checkpoint.clear()
+    assert VideoCheckpoint(str(video), {}, str(tmp_path / "ck")).load() is None
+
+
+def test_flushed_rows_are_not_restored(tmp_path, monkeypatch):
+    """Goal: test that rows marked as written to the output are not restored on resume and their parts are deleted."""
+    monkeypatch.setattr(checkpoint_module, "model_identity", lambda: {"weights": "w"})
+    video = tmp_path / "clip.mp4"
+    video.write_bytes(b"frames")
+    checkpoint = VideoCheckpoint(str(video), {}, str(tmp_path / "ck"), interval=0)
+
+    checkpoint.save({"next_frame": 8}, _rows([0, 3]))
+    checkpoint.mark_flushed()
+    checkpoint.save({"next_frame": 16}, _rows([9]))
+
+    state, rows = VideoCheckpoint(str(video), {}, str(tmp_path / "ck")).load()
+    assert state == {"next_frame": 16}
+    assert rows["frame_number"].tolist() == [9]
+    assert sorted(path.name for path in checkpoint.directory.glob("part_*")) == [
+        "part_000002.pkl"
+    ]
+
+
+def test_checkpoint_is_not_reused_with_other_parameters(tmp_path, monkeypatch):
+    """Goal: test that a checkpoint only resumes a run with the same parameters."""
+    monkeypatch.setattr(checkpoint_module, "model_identity", lambda: {"weights": "w"})
+    video = tmp_path / "clip.mp4"
+    video.write_bytes(b"frames")
+    VideoCheckpoint(str(video), {"frame_stride": 1}, str(tmp_path)).save(
+        {"next_frame": 8}, _rows([0])
+    )
+
+    assert (
+        VideoCheckpoint(str(video), {"frame_stride": 2}, str(tmp_path)).load() is None
+    )
+    monkeypatch.setattr(checkpoint_module, "DOMINANT_COLOR_DOWNSCALE", 4)
+    assert (
+        VideoCheckpoint(str(video), {"frame_stride": 1}, str(tmp_path)).load() is None
+    )
+
+
+class _FakeCapture:
+    def release(self):
+        pass
+
+
+def test_checkpoint_is_kept_when_the_run_is_stopped(tmp_path, monkeypatch):
+    """Goal: test that a video stopped before its end keeps its checkpoint and a finished one clears it."""
+    from src.vision import media_io as media_io_module
+
+    monkeypatch.setattr(checkpoint_module, "model_identity", lambda: {"weights": "w"})
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "videos").mkdir()
+    (tmp_path / "videos" / "clip.mp4").write_bytes(b"frames")
+    monkeypatch.setattr(media_io_module, "VIDEO_INPUT_PATH", "videos")
+    media_io = MediaIO(motion_gating=False, tracking=False, result_cache=False)
+    monkeypatch.setattr(
+        media_io, "read_video_from_file", lambda *a, **k: _FakeCapture()
+    )
+
+    def run(completed):
+        def preview_video(cap, path, preview, checkpoint):
+            checkpoint.save({"next_frame": 8}, _rows([0]))
+            return completed
+
+        monkeypatch.setattr(media_io, "preview_video", preview_video)
+        media_io.run_video_process(
+            preview=False, pipelined=False, workers=1, checkpoints=True
+        )
+        return VideoCheckpoint(
+            "videos/clip.mp4", media_io._video_cache_params(False)
+        ).load()
+
+    assert run(completed=False) is not None
+    assert run(completed=True) is None
+
+
+class _SquareModel:
+    """Model stand-in that detects the bright square drawn on every frame."""
+
+    class_name_table = np.array(["person"], dtype=object)
+
+    def __init__(self, crash_after_batches=None):
+        self._batches_left = crash_after_batches
+        self.batches = 0
+
+    @staticmethod
+    def to_detections(xyxy, conf, cls):
+        return make_detections(xyxy, conf, cls)
+
+    def run_inference_on_batch(self, frames):
+        if self._batches_left is not None:
+            if self._batches_left == 0:
+                raise RuntimeError("worker killed")
+            self._batches_left -= 1
+        self.batches += 1
+        results = []
+        for frame in frames:
+            ys, xs = np.nonzero(frame[:, :, 1] > 128)
+            box = [[xs.min(), ys.min(), xs.max() + 1, ys.max() + 1]]
+            results.append((np.array(box), np.array([0.9]), np.array([0])))
+        return results
+
+
+def test_resumed_run_matches_an_uninterrupted_run(tmp_path, monkeypatch):
+    """Goal: test that a run that crashes mid-video and resumes from its checkpoint produces the rows of an uninterrupted run."""
+    monkeypatch.setattr(checkpoint_module, "model_identity", lambda: {"weights": "w"})
+    video_path = str(tmp_path / "clip.mp4")
+    writer = cv2.VideoWriter(
+        video_path, cv2.VideoWriter_fourcc(*"mp4v"), 25, (160, 120)
+    )
+    for index in range(60):
+        frame = np.zeros((120, 160, 3), dtype=np.uint8)
+        frame[20:60, 2 * index : 2 * index + 30] = (0, 255, 0)
+        writer.write(frame)
+    writer.release()
+
+    def run(model):
+        media_io = MediaIO(motion_gating=True, tracking=True, run_id="run")
+        media_io._yolo_model = model
+        checkpoint = VideoCheckpoint(video_path, {}, str(tmp_path / "ck"), interval=0)
+        media_io.preview_video(
+            cv2.VideoCapture(video_path),
+            video_path,
+            preview=False,
+            batch_size=4,
+            frame_stride=1,
+            target_fps=None,
+            checkpoint=checkpoint,
+        )
+        return media_io.get_df_detections().drop(columns="ingestion_date")
+
+    with pytest.raises(RuntimeError, match="worker killed"):
+        run(_SquareModel(crash_after_batches=5))
+    resumed_model, uninterrupted_model = _SquareModel(), _SquareModel()
+    resumed = run(resumed_model)
+    shutil.rmtree(tmp_path / "ck")
+    uninterrupted = run(uninterrupted_model)
+
+    assert resumed["frame_number"].tolist() == list(range(60))
+    assert (resumed["track_id"] >= 0).all()
+    assert resumed_model.batches < uninterrupted_model.batches
+    pd.testing.assert_frame_equal(resumed, uninterrupted)
@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+
+from src.etl.etl import ETL
+from src.vision.colors import (
+    build_color_lut,
+    classify_colors,
+    lookup_color_codes,
+    name_colors,
+)
+from src.vision.utils import get_color_name
+
+
+def test_vectorized_rules_match_get_color_name():
+    """Goal: test that the vectorized color rules name every color like get_color_name."""
+    values = np.arange(0, 256, 3)
+    r, g, b = (channel.ravel() for channel in np.meshgrid(values, values, values))
+
+    names = name_colors(r, g, b, bits=8)
+    expected = [
+        get_color_name(*color) for color in zip(r.tolist(), g.tolist(), b.tolist())
+    ]
+
+    assert names.tolist() == expected
+    assert (lookup_color_codes(r, g, b, bits=8) == classify_colors(r, g, b)).all()
+    assert (
+        build_color_lut(8)[(r << 16) | (g << 8) | b] == classify_colors(r, g, b)
+    ).all()
+
+
+def test_etl_relabels_colors_and_keeps_unknown():
+    """Goal: test that the ETL re-labels colors from dom_r/dom_g/dom_b except invalid boxes."""
+    df = pd.DataFrame(
+        {
+            "dom_r": [250, 0, 0],
+            "dom_g": [10, 0, 0],
+            "dom_b": [10, 0, 0],
+            "dominant_color_name": ["mixed", "gray", "unknown"],
+        }
+    )
+
+    out = ETL.relabel_dominant_colors(df)
+
+    assert out["dominant_color_name"].tolist() == ["red", "black", "unknown"]
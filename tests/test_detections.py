@@ -0,0 +1,47 @@
+import numpy as np
+
+from src.vision.detections import (
+    DETECTION_DTYPE,
+    class_name_table,
+    empty_detections,
+    make_detections,
+)
+from src.vision.utils import build_detection_columns
+
+
+def test_detection_columns_are_views():
+    """Goal: test that detection fields are zero-copy views of the records and names come from the table."""
+    detections = make_detections(
+        np.array([[10, 20, 50, 80], [0, 0, 5, 5]]), [0.9, 0.4], [2, 0]
+    )
+    names = class_name_table({0: "person", 2: "car"})
+
+    assert detections.dtype == DETECTION_DTYPE
+    assert detections["track_id"].tolist() == [-1, -1]
+    assert np.shares_memory(detections["bbox"], detections)
+    assert names[detections["class_id"]].tolist() == ["car", "person"]
+    assert names.tolist() == ["person", "unknown", "car"]
+    assert len(empty_detections()) == 0
+
+
+def test_build_detection_columns_from_records():
+    """Goal: test that the feature columns are built straight from the detection records."""
+    frame = np.zeros((100, 200, 3), dtype=np.uint8)
+    frame[20:80, 10:50] = (0, 0, 255)
+    detections = make_detections([(10, 20, 50, 80)], [0.9], [2], track_id=[7])
+
+    columns = build_detection_columns(
+        "image",
+        "img",
+        frame,
+        detections,
+        class_name_table({2: "car"}),
+        frame_counter=3,
+        start_time=0.0,
+        timestamp_sec=1.5,
+    )
+
+    assert columns["class_name"].tolist() == ["car"]
+    assert columns["track_id"].tolist() == [7]
+    assert columns["width"].tolist() == [40]
+    assert columns["dominant_color_name"].tolist() == ["red"]
@@ -0,0 +1,114 @@
+import cv2
+import numpy as np
+import pytest
+
+from src.vision.detections import class_name_table, make_detections
+from src.vision.ffmpeg_reader import FFmpegVideoReader, ffmpeg_available, scaled_size
+from src.vision.media_io import MediaIO
+from src.vision.utils import build_detection_columns
+
+
+def test_scaled_size_keeps_aspect_and_never_upscales():
+    """Goal: test that frames are downscaled to fit the longest side with even sizes."""
+    assert scaled_size(1920, 1080, 640) == (640, 360)
+    assert scaled_size(1080, 1920, 640) == (360, 640)
+    assert scaled_size(320, 240, 640) == (320, 240)
+    assert scaled_size(1920, 1080, None) == (1920, 1080)
+
+
+@pytest.mark.skipif(not ffmpeg_available(), reason="ffmpeg no está instalado")
+def test_reader_matches_opencv_frames(tmp_path):
+    """Goal: test that the ffmpeg reader returns the same frames and positions as OpenCV."""
+    video_path = str(tmp_path / "video.avi")
+    writer = cv2.VideoWriter(video_path, cv2.VideoWriter_fourcc(*"MJPG"), 10, (64, 48))
+    for value in range(0, 200, 20):
+        writer.write(np.full((48, 64, 3), value, dtype=np.uint8))
+    writer.release()
+
+    reader = FFmpegVideoReader(video_path, max_side=None, ring_size=2)
+    cap = cv2.VideoCapture(video_path)
+    frames = []
+    while True:
+        ok, frame = reader.read()
+        expected_ok, expected = cap.read()
+        assert ok == expected_ok
+        if not ok:
+            break
+        assert np.abs(frame.astype(int) - expected).max() <= 2
+        frames.append(frame)
+
+    assert len(frames) == 10
+    # Ring buffers are reused instead of allocating every frame
+    assert frames[0] is frames[2]
+
+    reader.set(cv2.CAP_PROP_POS_FRAMES, 5)
+    assert reader.get(cv2.CAP_PROP_POS_FRAMES) == 5
+    assert reader.read()[1].mean() == pytest.approx(100, abs=2)
+    reader.release()
+
+
+def _box_of_bright_pixels(frame):
+    ys, xs = np.nonzero(frame[:, :, 1] > 128)
+    return xs.min(), ys.min(), xs.max() + 1, ys.max() + 1
+
+
+@pytest.mark.skipif(not ffmpeg_available(), reason="ffmpeg no está instalado")
+def test_reduced_frames_give_source_resolution_boxes(tmp_path):
+    """Goal: test that boxes found on ffmpeg's reduced frames are reported like the OpenCV reader's, at the source resolution."""
+    video_path = str(tmp_path / "video.avi")
+    writer = cv2.VideoWriter(
+        video_path, cv2.VideoWriter_fourcc(*"MJPG"), 10, (1280, 720)
+    )
+    frame = np.zeros((720, 1280, 3), dtype=np.uint8)
+    frame[200:520, 400:880] = (0, 255, 0)
+    writer.write(frame)
+    writer.release()
+
+    rows = []
+    for cap in (
+        cv2.VideoCapture(video_path),
+        FFmpegVideoReader(video_path, max_side=320),
+    ):
+        ok, decoded = cap.read()
+        assert ok
+        detections = make_detections([_box_of_bright_pixels(decoded)], [0.9], [0])
+        rows.append(
+            build_detection_columns(
+                "video",
+                "video",
+                decoded,
+                detections,
+                class_name_table({0: "person"}),
+                frame_counter=0,
+                start_time=0.0,
+                timestamp_sec=0.0,
+                source_size=MediaIO._source_size(cap),
+            )
+        )
+        cap.release()
+
+    opencv_row, ffmpeg_row = rows
+    assert ffmpeg_row["frame_width"].tolist() == [1280]
+    assert ffmpeg_row["frame_height"].tolist() == [720]
+    for column in ("x_min", "y_min", "x_max", "y_max", "center_x", "center_y"):
+        assert abs(int(ffmpeg_row[column][0]) - int(opencv_row[column][0])) <= 4
+    assert ffmpeg_row["area_pixels"][0] == pytest.approx(
+        opencv_row["area_pixels"][0], rel=0.03
+    )
+
+
+@pytest.mark.skipif(not ffmpeg_available(), reason="ffmpeg no está instalado")
+def test_ffmpeg_error_is_not_an_end_of_video(tmp_path):
+    """Goal: test that an ffmpeg failure raises instead of looking like the end of the video."""
+    video_path = str(tmp_path / "video.avi")
+    writer = cv2.VideoWriter(video_path, cv2.VideoWriter_fourcc(*"MJPG"), 10, (64, 48))
+    writer.write(np.zeros((48, 64, 3), dtype=np.uint8))
+    writer.release()
+
+    reader = FFmpegVideoReader(video_path, max_side=None)
+    reader.file_path = str(tmp_path / "missing.avi")
+    reader.set(cv2.CAP_PROP_POS_FRAMES, 0)  # Restarts ffmpeg on the missing file
+
+    with pytest.raises(RuntimeError, match="exit code"):
+        reader.read()
+    reader.release()
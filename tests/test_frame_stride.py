@@ -0,0 +1,70 @@
+import cv2
+import numpy as np
+
+from src.vision.detections import make_detections
+from src.vision.media_io import MediaIO
+
+
+class _SquareModel:
+    """Model stand-in that detects the bright square drawn on every frame."""
+
+    class_name_table = np.array(["person"], dtype=object)
+
+    @staticmethod
+    def to_detections(xyxy, conf, cls):
+        return make_detections(xyxy, conf, cls)
+
+    def run_inference_on_batch(self, frames):
+        results = []
+        for frame in frames:
+            ys, xs = np.nonzero(frame[:, :, 1] > 128)
+            box = [[xs.min(), ys.min(), xs.max() + 1, ys.max() + 1]]
+            results.append((np.array(box), np.array([0.9]), np.array([0])))
+        return results
+
+
+def _write_video(path, frame_count=60, fps=25):
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"mp4v"), fps, (160, 120))
+    for index in range(frame_count):
+        frame = np.zeros((120, 160, 3), dtype=np.uint8)
+        frame[20:60, 2 * index : 2 * index + 30] = (0, 255, 0)
+        writer.write(frame)
+    writer.release()
+
+
+def test_strided_read_returns_the_full_read_frames(tmp_path):
+    """Goal: test that a strided read returns the frames, frame numbers and timestamps of a full read at those positions."""
+    video_path = str(tmp_path / "video.mp4")
+    _write_video(video_path)
+
+    full = list(MediaIO.iter_video_frames(cv2.VideoCapture(video_path)))
+    strided = list(
+        MediaIO.iter_video_frames(cv2.VideoCapture(video_path), frame_stride=3)
+    )
+
+    assert len(full) == 60
+    assert [metadata for metadata, _ in strided] == [
+        metadata for metadata, _ in full[::3]
+    ]
+    for (_, frame), (_, expected) in zip(strided, full[::3]):
+        assert np.array_equal(frame, expected)
+
+
+def test_target_fps_samples_rows_at_the_full_read_positions(tmp_path):
+    """Goal: test that target_fps picks the matching stride and the rows keep the frame numbers and timestamps of a full read."""
+    video_path = str(tmp_path / "video.mp4")
+    _write_video(video_path, fps=25)
+    full = list(MediaIO.iter_video_frames(cv2.VideoCapture(video_path)))
+
+    assert MediaIO.resolve_frame_stride(cv2.VideoCapture(video_path), 1, 5) == 5
+    media_io = MediaIO(motion_gating=False, tracking=False)
+    media_io._yolo_model = _SquareModel()
+    media_io.preview_video(
+        cv2.VideoCapture(video_path), video_path, preview=False, target_fps=5
+    )
+
+    rows = media_io.get_df_detections()
+    assert rows["frame_number"].tolist() == list(range(0, 60, 5))
+    assert rows["timestamp_sec"].tolist() == [
+        timestamp_sec for (_, timestamp_sec), _ in full[::5]
+    ]
@@ -0,0 +1,115 @@
+import cv2
+import numpy as np
+
+from src.vision import media_io as media_io_module
+from src.vision.detections import make_detections
+from src.vision.media_io import MediaIO
+
+
+def test_decoding_keeps_order_and_isolates_bad_files(tmp_path):
+    """Goal: test that parallel decoding returns images in order and reports unreadable files."""
+    paths = []
+    for index in range(6):
+        path = tmp_path / f"img{index}.png"
+        cv2.imwrite(str(path), np.full((40, 80, 3), index * 10, dtype=np.uint8))
+        paths.append(path)
+    broken = tmp_path / "broken.jpg"
+    broken.write_bytes(b"not an image")
+    paths.insert(3, broken)
+
+    results = list(MediaIO()._iter_decoded_images(paths, workers=3, prefetch=1))
+
+    assert [path for path, _, _ in results] == paths
+    assert isinstance(results[3][2], FileNotFoundError)
+    assert [int(image[0, 0, 0]) for _, image, _ in results if image is not None] == [
+        0,
+        10,
+        20,
+        30,
+        40,
+        50,
+    ]
+
+
+def test_reduced_decode_halves_the_size(tmp_path):
+    """Goal: test that IMREAD_REDUCED_COLOR_2 decoding returns a half size image."""
+    path = tmp_path / "big.jpg"
+    cv2.imwrite(str(path), np.zeros((400, 600, 3), dtype=np.uint8))
+
+    assert MediaIO().read_image_from_file(str(path), reduction=2).shape == (200, 300, 3)
+
+
+class _SquareModel:
+    """Model stand-in that detects the bright square drawn on every image."""
+
+    class_name_table = np.array(["person"], dtype=object)
+
+    def __init__(self) -> None:
+        self.inferred = 0
+
+    @staticmethod
+    def to_detections(xyxy, conf, cls):
+        return make_detections(xyxy, conf, cls)
+
+    def run_inference_on_batch(self, frames):
+        self.inferred += len(frames)
+        results = []
+        for frame in frames:
+            ys, xs = np.nonzero(frame[:, :, 1] > 128)
+            box = [[xs.min(), ys.min(), xs.max() + 1, ys.max() + 1]]
+            results.append((np.array(box), np.array([0.9]), np.array([0])))
+        return results
+
+
+def test_images_bypass_motion_gate_and_tracker(tmp_path, monkeypatch):
+    """Goal: test that every image is inferred on its own, untracked, even with motion gating and tracking on."""
+    for index in range(5):
+        image = np.zeros((120, 160, 3), dtype=np.uint8)
+        # Images 1 and 2 are identical: a motion gate would skip the second one
+        x = 20 * min(index, 1) + 20 * max(index - 2, 0)
+        image[30:70, x : x + 40] = (0, 255, 0)
+        cv2.imwrite(str(tmp_path / f"img{index}.png"), image)
+    monkeypatch.setattr(media_io_module, "IMG_INPUT_PATH", str(tmp_path))
+    model = _SquareModel()
+    media_io = MediaIO(motion_gating=True, tracking=True, keyframe_interval=5)
+    media_io._yolo_model = model
+
+    media_io.run_image_process(preview=False, batch_size=2, workers=1, reduction=1)
+
+    detections = media_io.get_df_detections()
+    assert model.inferred == 5
+    assert detections["x_min"].tolist() == [0, 20, 20, 40, 60]
+    assert (detections["track_id"] == -1).all()
+
+
+def test_reduced_decode_reports_original_size_boxes(tmp_path, monkeypatch):
+    """Goal: test that images decoded at a reduced size give boxes and frame sizes at the original resolution."""
+    image = np.zeros((400, 600, 3), dtype=np.uint8)
+    image[100:300, 200:360] = (0, 255, 0)
+    cv2.imwrite(str(tmp_path / "big.png"), image)
+    monkeypatch.setattr(media_io_module, "IMG_INPUT_PATH", str(tmp_path))
+
+    def run(reduction):
+        media_io = MediaIO(motion_gating=False, tracking=False)
+        media_io._yolo_model = _SquareModel()
+        media_io.run_image_process(preview=False, workers=1, reduction=reduction)
+        return media_io.get_df_detections().iloc[0]
+
+    full, reduced = run(1), run(4)
+
+    assert (reduced["frame_width"], reduced["frame_height"]) == (600, 400)
+    for column in ("x_min", "y_min", "x_max", "y_max"):
+        assert abs(reduced[column] - full[column]) <= 4
+
+
+def test_image_source_size_follows_exif_rotation(tmp_path):
+    """Goal: test that the header size of a rotated JPEG matches the size imread returns."""
+    from PIL import Image
+
+    path = tmp_path / "rotated.jpg"
+    exif = Image.Exif()
+    exif[0x0112] = 6  # Rotate 90 degrees clockwise
+    Image.new("RGB", (60, 40)).save(path, exif=exif)
+
+    height, width = cv2.imread(str(path)).shape[:2]
+    assert MediaIO._image_source_size(str(path)) == (width, height) == (40, 60)
@@ -16,6 +16,7 @@ def test_insert_no_duplica_detection_id():
         "source_type": "image",
         "source_id": "img.jpg",
         "frame_number": 0,
+        "track_id": -1,
         "class_id": 1,
         "class_name": "person",
         "confidence": 0.9,
@@ -0,0 +1,29 @@
+from src.vision import model
+
+
+class _FakeYoloModel:
+    instances = 0
+
+    def __init__(self, backend, imgsz, quantization):
+        _FakeYoloModel.instances += 1
+        self.key = (backend, imgsz, quantization)
+        self.warmed_up = False
+
+    def warmup(self):
+        self.warmed_up = True
+
+
+def test_shared_model_is_loaded_once_per_configuration(monkeypatch):
+    """Goal: test that the registry loads and warms up one model per configuration and reuses it."""
+    monkeypatch.setattr(model, "YoloModel", _FakeYoloModel)
+    model.clear_model_registry()
+
+    first = model.get_shared_model("pytorch", 640, None)
+    second = model.get_shared_model("pytorch", 640, None)
+    other = model.get_shared_model("onnx", 640, None, warmup=False)
+
+    assert first is second
+    assert first.warmed_up and not other.warmed_up
+    assert _FakeYoloModel.instances == 2
+
+    model.clear_model_registry()
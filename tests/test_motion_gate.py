@@ -0,0 +1,34 @@
+import numpy as np
+
+from src.vision.motion_gate import MotionGate
+
+
+def _frame(value: int = 0) -> np.ndarray:
+    return np.full((240, 320, 3), value, dtype=np.uint8)
+
+
+def test_static_frames_are_skipped_until_refresh():
+    """Goal: test that identical frames reuse detections and the refresh interval forces inference."""
+    gate = MotionGate(refresh_interval=5)
+
+    decisions = [gate.should_infer(_frame()) for _ in range(11)]
+
+    assert decisions == [True, False, False, False, False] * 2 + [True]
+    assert gate.skipped_frames == 8
+    assert gate.skip_ratio == 8 / 11
+
+
+def test_scene_change_triggers_inference():
+    """Goal: test that a moving object makes the gate request a new inference."""
+    gate = MotionGate(refresh_interval=100)
+    assert gate.should_infer(_frame())
+    assert not gate.should_infer(_frame())
+
+    moved = _frame()
+    moved[50:150, 50:150] = 255
+
+    assert gate.should_infer(moved)
+    assert not gate.should_infer(moved.copy())
+
+    gate.reset()
+    assert gate.stats() == {"total_frames": 0, "skipped_frames": 0, "skip_ratio": 0.0}
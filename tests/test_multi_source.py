@@ -0,0 +1,129 @@
+from typing import Optional
+
+import numpy as np
+
+from src.vision import multi_source
+from src.vision.detections import make_detections
+from src.vision.media_io import MediaIO
+from src.vision.multi_source import MultiSourceScheduler, SourceSession
+
+
+class _FakeSession:
+    def __init__(self, name: str, frames: int) -> None:
+        self.name = name
+        self._remaining = frames
+
+    def poll(self):
+        if self._remaining == 0:
+            return None
+        self._remaining -= 1
+        return (self._remaining, None), self.name
+
+
+def test_batches_take_sources_in_round_robin():
+    """Goal: test that every batch interleaves the ready sources instead of draining one."""
+    sessions = [_FakeSession("a", 10), _FakeSession("b", 10), _FakeSession("c", 1)]
+    scheduler = MultiSourceScheduler(sessions, batch_size=4)
+
+    first = [frame for _, _, frame in scheduler._next_batch()]
+    second = [frame for _, _, frame in scheduler._next_batch()]
+
+    assert first == ["a", "b", "c", "a"]
+    assert second == ["b", "a", "b", "a"]
+
+
+class _FakeCapture:
+    """Video capture stand-in that yields `frames` frames, failing after `fail_after` if given."""
+
+    def __init__(self, frames: int, fail_after: Optional[int] = None) -> None:
+        self._frames = frames
+        self._fail_after = fail_after
+        self._position = 0
+        self.releases = 0
+
+    def isOpened(self):
+        return True
+
+    def get(self, prop):
+        return 0.0
+
+    def set(self, prop, value):
+        return True
+
+    def read(self):
+        if self._position == self._fail_after:
+            raise RuntimeError("decoder crashed")
+        if self._position == self._frames:
+            return False, None
+        self._position += 1
+        return True, np.zeros((32, 32, 3), dtype=np.uint8)
+
+    def release(self):
+        self.releases += 1
+
+
+class _CountingModel:
+    """Model stand-in that finds one box per frame and counts the inferred frames."""
+
+    class_name_table = np.array(["person"], dtype=object)
+
+    def __init__(self) -> None:
+        self.inferred = 0
+
+    @staticmethod
+    def to_detections(xyxy, conf, cls):
+        return make_detections(xyxy, conf, cls)
+
+    def run_inference_on_batch(self, frames):
+        self.inferred += len(frames)
+        return [
+            (np.array([[4, 4, 20, 20]]), np.array([0.9]), np.array([0])) for _ in frames
+        ]
+
+
+def test_failing_source_does_not_stop_the_others(monkeypatch):
+    """Goal: test that a source whose decoder fails or that ends early stops alone, the others get every frame inferred and each capture is released once."""
+    captures = {
+        "long.mp4": _FakeCapture(12),
+        "short.mp4": _FakeCapture(2),
+        "broken.mp4": _FakeCapture(12, fail_after=3),
+    }
+    monkeypatch.setattr(SourceSession, "_open", staticmethod(captures.__getitem__))
+    model = _CountingModel()
+    monkeypatch.setattr(multi_source, "get_shared_model", lambda: model)
+
+    sessions = []
+    for source in captures:
+        media_io = MediaIO(motion_gating=False, tracking=False, result_cache=False)
+        media_io._yolo_model = model
+        sessions.append(SourceSession(source, media_io, queue_size=2))
+    scheduler = MultiSourceScheduler(sessions, batch_size=2)
+    scheduler.run()
+    for session in sessions:
+        session.close()
+
+    assert [session.processed_frames for session in sessions] == [12, 2, 3]
+    assert model.inferred == 17
+    assert isinstance(sessions[2].error, RuntimeError)
+    detections = scheduler.get_detections()
+    assert detections.groupby("source_id").size().to_dict() == {
+        "broken.mp4": 3,
+        "long.mp4": 12,
+        "short.mp4": 2,
+    }
+    assert [capture.releases for capture in captures.values()] == [1, 1, 1]
+
+
+def test_captures_are_released_once_when_the_run_fails(monkeypatch):
+    """Goal: test that a failing shared inference ends the run with every capture released exactly once."""
+    captures = {"a.mp4": _FakeCapture(12), "b.mp4": _FakeCapture(12)}
+    monkeypatch.setattr(SourceSession, "_open", staticmethod(captures.__getitem__))
+    model = _CountingModel()
+    model.run_inference_on_batch = lambda frames: 1 / 0
+    monkeypatch.setattr(multi_source, "get_shared_model", lambda: model)
+
+    MediaIO(motion_gating=False, tracking=False).run_multi_source_process(
+        list(captures), preview=False
+    )
+
+    assert [capture.releases for capture in captures.values()] == [1, 1]
@@ -0,0 +1,103 @@
+import cv2
+import numpy as np
+import pandas as pd
+
+from src.etl.etl import ETL
+from src.vision.accumulator import DetectionAccumulator
+from src.vision.detections import make_detections
+from src.vision.media_io import MediaIO
+from src.vision.output_writer import ChunkedDetectionWriter
+from src.vision.utils import create_detection_dataframe_schema
+
+
+def _columns(frame_number):
+    columns = {name: 0 for name in create_detection_dataframe_schema()}
+    columns.update(
+        detection_id=[f"cam_{frame_number}"], frame_number=frame_number, confidence=0.9
+    )
+    return columns
+
+
+def test_flush_writes_bounded_chunks_read_by_etl(tmp_path):
+    """Goal: test that detections are flushed in row-bounded chunks that the ETL reads back, ignoring temporary files."""
+    writer = ChunkedDetectionWriter(str(tmp_path), max_rows=3, max_seconds=0)
+    media_io = MediaIO(motion_gating=False, tracking=False, output_writer=writer)
+    media_io._detections = DetectionAccumulator(capacity=4)
+
+    for frame_number in range(7):
+        media_io._detections.extend(_columns(frame_number))
+        media_io.flush_detections(force=False)
+        assert len(media_io.get_df_detections()) < 3
+    media_io.flush_detections()
+
+    assert writer.stats() == {"files": 3, "rows": 7}
+    (tmp_path / "detections_unfinished.csv.tmp").write_text("half,written\n1")
+
+    df = ETL(str(tmp_path)).extract()
+    assert df["frame_number"].tolist() == list(range(7))
+
+
+def test_time_bound_flushes_pending_rows(tmp_path):
+    """Goal: test that pending rows become due once the time bound has passed, and never without rows."""
+    writer = ChunkedDetectionWriter(str(tmp_path), max_rows=1000, max_seconds=0.01)
+    assert not writer.due(0)
+
+    writer._last_written -= 1.0
+    assert writer.due(1)
+    assert writer.write(pd.DataFrame()) is None
+    assert not writer.due(1)
+
+
+class _SquareModel:
+    """Model stand-in that detects the bright square drawn on every frame."""
+
+    class_name_table = np.array(["person"], dtype=object)
+
+    @staticmethod
+    def to_detections(xyxy, conf, cls):
+        return make_detections(xyxy, conf, cls)
+
+    def run_inference_on_batch(self, frames):
+        results = []
+        for frame in frames:
+            ys, xs = np.nonzero(frame[:, :, 1] > 128)
+            box = [[xs.min(), ys.min(), xs.max() + 1, ys.max() + 1]]
+            results.append((np.array(box), np.array([0.9]), np.array([0])))
+        return results
+
+
+def test_long_video_is_streamed_while_it_is_processed(tmp_path):
+    """Goal: test that the rows of a single video are written in bounded chunks during processing, not only at its end."""
+    video_path = str(tmp_path / "video.mp4")
+    writer = cv2.VideoWriter(
+        video_path, cv2.VideoWriter_fourcc(*"mp4v"), 25, (160, 120)
+    )
+    for index in range(60):
+        frame = np.zeros((120, 160, 3), dtype=np.uint8)
+        frame[20:60, 2 * index : 2 * index + 30] = (0, 255, 0)
+        writer.write(frame)
+    writer.release()
+
+    output = ChunkedDetectionWriter(str(tmp_path / "out"), max_rows=10, max_seconds=0)
+    chunk_rows = []
+    write = output.write
+    output.write = lambda rows: chunk_rows.append(len(rows)) or write(rows)
+    media_io = MediaIO(motion_gating=False, tracking=False, output_writer=output)
+    media_io._yolo_model = _SquareModel()
+
+    completed = media_io.preview_video(
+        cv2.VideoCapture(video_path),
+        video_path,
+        preview=False,
+        batch_size=4,
+        frame_stride=1,
+        target_fps=None,
+    )
+    streamed = len(chunk_rows)
+    media_io.flush_detections()
+
+    assert completed
+    assert streamed >= 5
+    assert max(chunk_rows) < 10 + 4
+    df = ETL(str(tmp_path / "out")).extract()
+    assert df["frame_number"].tolist() == list(range(60))
@@ -0,0 +1,124 @@
+import pandas as pd
+
+from src.vision import media_io as media_io_module
+from src.vision import parallel
+from src.vision.media_io import MediaIO
+from src.vision.parallel import (
+    merge_detection_frames,
+    process_videos_in_parallel,
+    resolve_torch_threads,
+)
+from src.vision.utils import create_detection_dataframe_schema
+
+
+class _InlineExecutor:
+    """ProcessPoolExecutor stand-in that runs the worker functions in-process."""
+
+    def __init__(self, max_workers, mp_context, initializer, initargs):
+        self.max_workers = max_workers
+        initializer(*initargs)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def map(self, function, *iterables):
+        # Finish in reverse order: the merge must still follow the input order
+        results = {args: function(*args) for args in reversed(list(zip(*iterables)))}
+        return iter(results[args] for args in zip(*iterables))
+
+
+def _rows(source_id, count):
+    rows = pd.DataFrame(
+        0, index=range(count), columns=create_detection_dataframe_schema()
+    )
+    rows["source_id"] = source_id
+    rows["frame_number"] = range(count)
+    return rows
+
+
+def test_videos_are_processed_once_each_and_merged_in_path_order(monkeypatch):
+    """Goal: test that every video is processed by a worker once and the rows are merged by video path."""
+    processed = []
+    init_args = []
+
+    def process_video_file(video_path):
+        processed.append(video_path)
+        return _rows(video_path, 0 if video_path == "b.mp4" else 2)
+
+    monkeypatch.setattr(parallel, "ProcessPoolExecutor", _InlineExecutor)
+    monkeypatch.setattr(parallel, "_init_worker", lambda *args: init_args.append(args))
+    monkeypatch.setattr(parallel, "_process_video_file", process_video_file)
+    monkeypatch.setattr(parallel, "resolve_model_path", lambda: None)
+
+    detections = process_videos_in_parallel(
+        ["c.mp4", "a.mp4", "b.mp4"],
+        workers=8,
+        torch_threads=2,
+        media_io_settings={"tracking": True},
+    )
+
+    assert sorted(processed) == ["a.mp4", "b.mp4", "c.mp4"]
+    assert init_args == [(2, {"tracking": True})]
+    assert detections["source_id"].tolist() == ["a.mp4", "a.mp4", "c.mp4", "c.mp4"]
+    assert detections.index.tolist() == [0, 1, 2, 3]
+
+
+def test_merge_and_thread_split_edge_cases():
+    """Goal: test merging without rows and splitting CPU threads between workers."""
+    empty = merge_detection_frames([_rows("a", 0)])
+    assert empty.empty
+    assert list(empty.columns) == create_detection_dataframe_schema()
+
+    assert resolve_torch_threads(4, torch_threads=0) == 1
+    assert resolve_torch_threads(10_000) == 1
+
+
+def test_workers_get_the_parent_settings(tmp_path, monkeypatch):
+    """Goal: test that parallel video runs hand the motion gating and tracking settings of the MediaIO to the workers."""
+    (tmp_path / "a.mp4").write_bytes(b"frames")
+    (tmp_path / "b.mp4").write_bytes(b"frames")
+    calls = []
+
+    def process_videos(video_paths, workers, torch_threads, media_io_settings):
+        calls.append(media_io_settings)
+        return merge_detection_frames([])
+
+    monkeypatch.setattr(media_io_module, "VIDEO_INPUT_PATH", str(tmp_path))
+    monkeypatch.setattr(media_io_module, "process_videos_in_parallel", process_videos)
+    media_io = MediaIO(
+        motion_gating=True, tracking=True, keyframe_interval=3, run_id="run"
+    )
+    media_io.run_video_process(preview=False, workers=2, split_ranges=False)
+
+    assert calls == [
+        {
+            "motion_gating": True,
+            "tracking": True,
+            "keyframe_interval": 3,
+            "run_id": "run",
+        }
+    ]
+
+
+def test_tracked_videos_are_not_split_in_ranges(tmp_path, monkeypatch):
+    """Goal: test that with tracking on, split_ranges falls back to processing whole videos in the workers."""
+    (tmp_path / "a.mp4").write_bytes(b"frames")
+    processed = []
+
+    def process_videos(video_paths, workers, torch_threads, media_io_settings):
+        processed.extend(video_paths)
+        return merge_detection_frames([])
+
+    def process_ranges(*args, **kwargs):
+        raise AssertionError("tracked video split in ranges")
+
+    monkeypatch.setattr(media_io_module, "VIDEO_INPUT_PATH", str(tmp_path))
+    monkeypatch.setattr(media_io_module, "process_videos_in_parallel", process_videos)
+    monkeypatch.setattr(media_io_module, "process_video_in_ranges", process_ranges)
+    media_io = MediaIO(motion_gating=False, tracking=True)
+    media_io.run_video_process(preview=False, workers=2, split_ranges=True)
+
+    assert processed == [str(tmp_path / "a.mp4")]
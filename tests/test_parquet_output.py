@@ -0,0 +1,42 @@
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from src.etl.etl import ETL
+from src.vision.output_writer import ChunkedDetectionWriter
+from src.vision.utils import create_detection_dataframe_schema
+
+
+def _rows(source_frames):
+    rows = []
+    for source_id, frame_number in source_frames:
+        row = {name: 0 for name in create_detection_dataframe_schema()}
+        row.update(
+            detection_id=f"{source_id}_{frame_number}",
+            source_type="video",
+            source_id=source_id,
+            frame_number=frame_number,
+            class_name="person",
+            confidence=0.9,
+            position_region="center",
+            dominant_color_name="red",
+            ingestion_date="2026-01-31",
+        )
+        rows.append(row)
+    return pd.DataFrame(rows, columns=create_detection_dataframe_schema())
+
+
+def test_parquet_chunks_use_hive_types_and_sort_rows(tmp_path):
+    """Goal: test that Parquet chunks follow the Hive table types, are sorted by source and frame and are read by the ETL."""
+    writer = ChunkedDetectionWriter(str(tmp_path), output_format="parquet")
+    path = writer.write(_rows([("b", 0), ("a", 5), ("a", 2)]))
+
+    schema = pq.read_schema(path)
+    assert schema.field("frame_number").type == pa.int32()
+    assert schema.field("confidence").type == pa.float64()
+    assert pa.types.is_dictionary(schema.field("class_name").type)
+    assert pa.types.is_timestamp(schema.field("ingestion_date").type)
+
+    df = ETL(str(tmp_path)).extract()
+    assert df["detection_id"].tolist() == ["a_2", "a_5", "b_0"]
+    assert df["ingestion_date"].iloc[0] == pd.Timestamp("2026-01-31")
@@ -0,0 +1,64 @@
+import threading
+
+import numpy as np
+import pytest
+
+from src.vision.pipeline import FramePipeline
+
+
+def _frames(count):
+    for index in range(count):
+        yield index, np.full((2, 2, 3), index % 256, dtype=np.uint8)
+
+
+def _infer(frames):
+    return [int(frame[0, 0, 0]) for frame in frames]
+
+
+def _pipeline_threads():
+    return [t for t in threading.enumerate() if t.name.startswith("pipeline-")]
+
+
+def test_pipeline_yields_every_frame_in_order_and_stops():
+    """Goal: test that all frames come out in order with their own detections and the stage threads end."""
+    pipeline = FramePipeline(_infer, batch_size=4, queue_size=3)
+
+    results = list(pipeline.run(_frames(50)))
+
+    assert [metadata for metadata, _, _ in results] == list(range(50))
+    assert all(detections == metadata for metadata, _, detections in results)
+    assert not _pipeline_threads()
+    assert all(stats["max_depth"] <= 3 for stats in pipeline.queue_stats())
+
+
+def test_consumer_stopping_early_stops_the_stages():
+    """Goal: test that closing the result iterator early sets the stop event and joins the threads."""
+    pipeline = FramePipeline(_infer, batch_size=2, queue_size=2)
+    results = pipeline.run(_frames(10_000))
+
+    assert next(results)[0] == 0
+    results.close()
+
+    assert not _pipeline_threads()
+
+
+@pytest.mark.parametrize("failing_stage", ["decode", "infer"])
+def test_stage_errors_reach_the_consumer(failing_stage):
+    """Goal: test that an exception in the decoder or the inference thread is raised to the caller."""
+
+    def frames():
+        yield from _frames(5)
+        if failing_stage == "decode":
+            raise ValueError("corrupt frame")
+
+    def infer(batch):
+        if failing_stage == "infer":
+            raise ValueError("inference failed")
+        return _infer(batch)
+
+    pipeline = FramePipeline(infer, batch_size=2, queue_size=2)
+    with pytest.raises(ValueError):
+        for _ in pipeline.run(frames()):
+            pass
+
+    assert not _pipeline_threads()
@@ -0,0 +1,25 @@
+import time
+
+import numpy as np
+
+from src.vision import preview
+from src.vision.preview import PreviewRenderer
+
+
+def test_renderer_drops_stale_frames(monkeypatch):
+    """Goal: test that the renderer shows the latest frame at a capped rate and drops the rest."""
+    shown = []
+    monkeypatch.setattr(preview.cv2, "imshow", lambda title, frame: shown.append(frame))
+    monkeypatch.setattr(preview.cv2, "waitKey", lambda delay: -1)
+    monkeypatch.setattr(preview.cv2, "destroyWindow", lambda title: None)
+
+    frames = [np.full((48, 64, 3), value, dtype=np.uint8) for value in range(50)]
+    with PreviewRenderer(max_fps=10) as renderer:
+        for frame in frames:
+            renderer.submit(frame)
+        time.sleep(0.3)
+
+    assert renderer.shown_frames == len(shown) >= 1
+    assert renderer.shown_frames + renderer.dropped_frames == len(frames)
+    assert shown[-1] is frames[-1]
+    assert not renderer.stop_requested
@@ -0,0 +1,32 @@
+import numpy as np
+import pytest
+
+from src.vision.model_export import resolve_model_path
+from src.vision.quantization_report import match_detections
+
+
+def _detections(boxes, classes):
+    return (
+        np.array(boxes, dtype=int).reshape(-1, 4),
+        np.ones(len(classes)),
+        np.array(classes, dtype=int),
+    )
+
+
+def test_match_detections_requires_same_class_and_overlap():
+    """Goal: test that FP32/INT8 boxes only match one-to-one with the same class and enough IoU."""
+    reference = _detections([[0, 0, 100, 100], [200, 200, 300, 300]], [0, 2])
+    candidate = _detections(
+        [[2, 2, 100, 100], [0, 0, 100, 100], [200, 200, 300, 300]], [0, 0, 0]
+    )
+
+    assert match_detections(reference, candidate) == 1
+    assert match_detections(reference, _detections([], [])) == 0
+
+
+def test_quantization_is_only_allowed_for_onnx():
+    """Goal: test that INT8 quantization is rejected for other backends or unknown modes."""
+    with pytest.raises(ValueError):
+        resolve_model_path(backend="pytorch", quantization="dynamic")
+    with pytest.raises(ValueError):
+        resolve_model_path(backend="onnx", quantization="int4")
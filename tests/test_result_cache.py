@@ -0,0 +1,81 @@
+import pandas as pd
+
+from src.vision import result_cache
+from src.vision.result_cache import ResultCache
+from src.vision.utils import create_detection_dataframe_schema
+
+
+def _rows(count):
+    rows = pd.DataFrame(columns=create_detection_dataframe_schema())
+    for index in range(count):
+        rows.loc[index] = None
+    rows["source_id"] = "clip"
+    rows["ingestion_date"] = "2000-01-01"
+    return rows
+
+
+def test_cached_rows_are_served_until_the_file_changes(tmp_path, monkeypatch):
+    """Goal: test that stored rows are reused for the same file and parameters only."""
+    monkeypatch.setattr(result_cache, "model_identity", lambda: {"weights": "w"})
+    media = tmp_path / "clip.mp4"
+    media.write_bytes(b"frames")
+    cache = ResultCache(str(tmp_path / "cache"))
+    params = {"frame_stride": 1}
+
+    assert cache.load(str(media), params) is None
+    cache.store(str(media), params, _rows(2))
+
+    cached = ResultCache(str(tmp_path / "cache")).load(str(media), params)
+    assert len(cached) == 2
+    assert (cached["ingestion_date"] != "2000-01-01").all()
+    assert cache.load(str(media), {"frame_stride": 2}) is None
+
+    media.write_bytes(b"other frames")
+    assert cache.load(str(media), params) is None
+    assert cache.stats() == {"hits": 0, "misses": 3}
+
+
+def test_empty_results_are_cached(tmp_path, monkeypatch):
+    """Goal: test that a file without detections is also served from the cache."""
+    monkeypatch.setattr(result_cache, "model_identity", lambda: {"weights": "w"})
+    media = tmp_path / "empty.jpg"
+    media.write_bytes(b"pixels")
+    cache = ResultCache(str(tmp_path / "cache"))
+
+    cache.store(str(media), {}, _rows(0))
+
+    assert cache.load(str(media), {}).empty
+
+
+def test_hash_index_is_written_in_batches(tmp_path, monkeypatch):
+    """Goal: test that new file hashes are saved once per interval and on flush, not after every file."""
+    monkeypatch.setattr(result_cache, "HASH_INDEX_SAVE_INTERVAL", 4)
+    saves = []
+    monkeypatch.setattr(
+        ResultCache,
+        "_save_hash_index",
+        lambda self: saves.append(len(self._hash_index)),
+    )
+    cache = ResultCache(str(tmp_path / "cache"))
+    for index in range(10):
+        media = tmp_path / f"img{index}.jpg"
+        media.write_bytes(bytes([index]))
+        cache.file_hash(str(media))
+        cache.file_hash(str(media))  # Known hash: nothing new to save
+
+    assert saves == [4, 8]
+    cache.flush()
+    cache.flush()
+    assert saves == [4, 8, 10]
+
+
+def test_color_settings_are_part_of_the_key(tmp_path, monkeypatch):
+    """Goal: test that rows computed with another color downscale are not served."""
+    monkeypatch.setattr(result_cache, "model_identity", lambda: {"weights": "w"})
+    media = tmp_path / "clip.mp4"
+    media.write_bytes(b"frames")
+    cache = ResultCache(str(tmp_path / "cache"))
+    cache.store(str(media), {}, _rows(1))
+
+    monkeypatch.setattr(result_cache, "DOMINANT_COLOR_DOWNSCALE", 4)
+    assert cache.load(str(media), {}) is None
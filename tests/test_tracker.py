@@ -0,0 +1,69 @@
+import pandas as pd
+
+from src.etl.etl import ETL
+from src.vision.detections import make_detections
+from src.vision.tracker import IoUTracker, iou_matrix
+
+
+def test_iou_matrix():
+    """Goal: test IoU values for identical, disjoint and half-overlapping boxes."""
+    ious = iou_matrix(
+        [(0, 0, 10, 10)], [(0, 0, 10, 10), (20, 20, 30, 30), (5, 0, 15, 10)]
+    )
+
+    assert ious.shape == (1, 3)
+    assert ious[0, 0] == 1.0
+    assert ious[0, 1] == 0.0
+    assert abs(ious[0, 2] - 1 / 3) < 1e-9
+
+
+def test_tracker_keeps_ids_and_propagates_boxes():
+    """Goal: test that a moving object keeps its track ID and is propagated between keyframes."""
+    tracker = IoUTracker(iou_threshold=0.3)
+
+    first = make_detections(
+        [(100, 100, 200, 300), (400, 100, 450, 150)], [0.9, 0.8], [0, 41]
+    )
+    assert tracker.update(first).tolist() == [0, 1]
+
+    moved = make_detections(
+        [(402, 100, 452, 150), (110, 100, 210, 300)], [0.8, 0.9], [41, 0]
+    )
+    assert tracker.update(moved).tolist() == [1, 0]
+
+    detections = tracker.propagate((480, 640))
+    assert sorted(detections["track_id"].tolist()) == [0, 1]
+    person_box = detections["bbox"][detections["track_id"] == 0][0]
+    assert person_box[0] > 107  # keeps moving to the right
+
+    new_object = make_detections([(500, 300, 600, 470)], [0.9], [0])
+    assert tracker.update(new_object).tolist() == [2]
+
+
+def test_track_ids_are_not_reused_after_reset():
+    """Goal: test that a reset drops the tracks but never hands out an earlier track ID again."""
+    tracker = IoUTracker()
+    assert tracker.update(make_detections([(0, 0, 10, 10)], [0.9], [0])).tolist() == [0]
+
+    tracker.reset()
+
+    assert tracker.tracks == []
+    assert tracker.update(make_detections([(0, 0, 10, 10)], [0.9], [0])).tolist() == [1]
+
+
+def test_etl_collapses_tracks_per_run():
+    """Goal: test that equal track IDs of different runs of a source are kept as separate objects."""
+    df = pd.DataFrame(
+        {
+            "source_type": "camera",
+            "source_id": "live_camera",
+            "run_id": ["run1", "run1", "run2", "run2", "run2"],
+            "track_id": [0, 0, 0, 0, -1],
+            "confidence": [0.6, 0.9, 0.7, 0.8, 0.5],
+        }
+    )
+
+    collapsed = ETL.collapse_track_segments(df)
+
+    assert collapsed["confidence"].tolist() == [0.9, 0.8, 0.5]
+    assert collapsed["run_id"].tolist() == ["run1", "run2", "run2"]
@@ -0,0 +1,127 @@
+import cv2
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.vision.detections import make_detections
+from src.vision.media_io import MediaIO
+from src.vision.parallel import split_frame_ranges
+
+
+class _KeyframeSeekCapture:
+    """
+    Capture over synthetic frames (pixel value = frame number) whose seeks
+    land on the previous keyframe, while CAP_PROP_POS_FRAMES echoes the
+    requested position like some OpenCV backends do.
+    """
+
+    def __init__(self, frame_count: int, keyframe_interval: int, fps: float = 25.0):
+        self.frame_count = frame_count
+        self.keyframe_interval = keyframe_interval
+        self.fps = fps
+        self._next = 0
+        self._requested = 0
+
+    def set(self, prop_id, value):
+        assert prop_id == cv2.CAP_PROP_POS_FRAMES
+        self._requested = int(value)
+        self._next = int(value) // self.keyframe_interval * self.keyframe_interval
+        return True
+
+    def get(self, prop_id):
+        if prop_id == cv2.CAP_PROP_FPS:
+            return self.fps
+        if prop_id == cv2.CAP_PROP_POS_FRAMES:
+            return float(self._requested)
+        if prop_id == cv2.CAP_PROP_POS_MSEC:
+            # Timestamp of the last frame read, with a container start offset
+            return 40.0 + (self._next - 1) * 1000 / self.fps
+        return 0.0
+
+    def grab(self):
+        if self._next >= self.frame_count:
+            return False
+        self._next += 1
+        return True
+
+    def read(self):
+        if not self.grab():
+            return False, None
+        return True, np.full((4, 4, 3), self._next - 1, dtype=np.uint8)
+
+
+@pytest.mark.parametrize("start", [1, 9, 10, 11, 25, 39])
+def test_seek_lands_on_the_requested_frame(start):
+    """Goal: test that a seek landing on an earlier keyframe is corrected, so the next read is the requested frame."""
+    cap = _KeyframeSeekCapture(frame_count=40, keyframe_interval=10)
+
+    MediaIO._seek_to_frame(cap, start)
+
+    ok, frame = cap.read()
+    assert ok and frame[0, 0, 0] == start
+
+
+def test_split_frame_ranges_cover_the_video_without_gaps():
+    """Goal: test that ranges are contiguous, start at 0, leave the last one open and never exceed the frame count."""
+    for frame_count, parts in [(100, 3), (7, 7), (3, 8), (1, 4)]:
+        ranges = split_frame_ranges(frame_count, parts)
+
+        assert len(ranges) == min(parts, frame_count)
+        assert ranges[0][0] == 0 and ranges[-1][1] is None
+        for (_, end), (start, _) in zip(ranges, ranges[1:]):
+            assert end == start
+        assert all(start < (end or frame_count) for start, end in ranges)
+
+
+class _SquareModel:
+    """Model stand-in that detects the bright square drawn on every frame."""
+
+    class_name_table = np.array(["person"], dtype=object)
+
+    @staticmethod
+    def to_detections(xyxy, conf, cls):
+        return make_detections(xyxy, conf, cls)
+
+    def run_inference_on_batch(self, frames):
+        results = []
+        for frame in frames:
+            ys, xs = np.nonzero(frame[:, :, 1] > 128)
+            box = [[xs.min(), ys.min(), xs.max() + 1, ys.max() + 1]]
+            results.append((np.array(box), np.array([0.9]), np.array([0])))
+        return results
+
+
+def test_split_ranges_give_the_sequential_rows(tmp_path):
+    """Goal: test that processing a video in seek ranges gives exactly the rows of a sequential run."""
+    video_path = str(tmp_path / "video.mp4")
+    writer = cv2.VideoWriter(
+        video_path, cv2.VideoWriter_fourcc(*"mp4v"), 25, (160, 120)
+    )
+    for index in range(60):
+        frame = np.zeros((120, 160, 3), dtype=np.uint8)
+        frame[20:60, 2 * index : 2 * index + 30] = (0, 255, 0)
+        writer.write(frame)
+    writer.release()
+
+    def run(ranges):
+        media_io = MediaIO(
+            motion_gating=False, tracking=False, result_cache=False, run_id="run"
+        )
+        media_io._yolo_model = _SquareModel()
+        for start, end in ranges:
+            media_io.preview_video(
+                cv2.VideoCapture(video_path),
+                video_path,
+                preview=False,
+                start_frame=start,
+                end_frame=end,
+                frame_stride=1,
+                target_fps=None,
+            )
+        return media_io.get_df_detections()
+
+    sequential = run([(0, None)])
+    stitched = run(split_frame_ranges(60, 4))
+
+    assert sequential["frame_number"].tolist() == list(range(60))
+    pd.testing.assert_frame_equal(stitched, sequential)